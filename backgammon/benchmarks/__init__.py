@@ -0,0 +1 @@
+# Benchmarks de rendimiento (se corren con python -m backgammon.benchmarks.<nombre>)
@@ -0,0 +1,107 @@
+"""
+Benchmark del arranque del CLI.
+
+Corre `python -X importtime -m backgammon.cli <comando>` varias veces y
+suma el tiempo de import acumulado de cada módulo de nivel superior. Falla
+(exit 1) si el promedio supera el presupuesto o si el comando importa
+módulos que no necesita.
+
+Uso:
+    python -m backgammon.benchmarks.cli_startup [--comando roll] [--runs 20] [--budget-ms 15]
+"""
+from __future__ import annotations
+
+import argparse
+import os
+import subprocess
+import sys
+import time
+from typing import Dict, List, Tuple
+
+# Módulos que ningún comando simple debería cargar
+PROHIBIDOS = ("colorama", "argparse", "backgammon.core.game", "backgammon.core.board_refactored")
+
+
+def parse_importtime(stderr: str) -> Dict[str, int]:
+    """
+    Parsea la salida de -X importtime.
+
+    Args:
+        stderr: Texto emitido por el intérprete en stderr
+
+    Returns:
+        Diccionario módulo -> tiempo acumulado en microsegundos
+    """
+    tiempos: Dict[str, int] = {}
+    for linea in stderr.splitlines():
+        if not linea.startswith("import time:") or "|" not in linea:
+            continue
+        partes = linea[len("import time:"):].split("|")
+        if len(partes) != 3 or not partes[1].strip().isdigit():
+            continue
+        tiempos[partes[2].strip()] = int(partes[1].strip())
+    return tiempos
+
+
+def medir_arranque(comando: str = "roll") -> Tuple[float, Dict[str, int]]:
+    """
+    Ejecuta el CLI una vez con -X importtime.
+
+    Args:
+        comando: Subcomando del CLI a ejecutar
+
+    Returns:
+        Tupla (tiempo de pared en ms, tiempos de import por módulo)
+    """
+    env = dict(os.environ)
+    raiz = os.path.abspath(os.path.join(os.path.dirname(__file__), "..", ".."))
+    env["PYTHONPATH"] = raiz + os.pathsep + env.get("PYTHONPATH", "")
+    inicio = time.perf_counter()
+    proc = subprocess.run(
+        [sys.executable, "-X", "importtime", "-m", "backgammon.cli", comando],
+        capture_output=True, text=True, env=env, check=True,
+    )
+    pared_ms = (time.perf_counter() - inicio) * 1000.0
+    return pared_ms, parse_importtime(proc.stderr)
+
+
+def tiempo_propio_us(tiempos: Dict[str, int]) -> int:
+    """Suma el tiempo de import acumulado de los módulos de backgammon."""
+    return sum(us for mod, us in tiempos.items() if mod == "backgammon" or mod.startswith("backgammon."))
+
+
+def main(argv: List[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(description="Benchmark de arranque del CLI")
+    parser.add_argument("--comando", default="roll")
+    parser.add_argument("--runs", type=int, default=20)
+    parser.add_argument("--budget-ms", type=float, default=15.0,
+                        help="Presupuesto de import de módulos backgammon (ms)")
+    args = parser.parse_args(argv)
+
+    paredes: List[float] = []
+    propios: List[int] = []
+    cargados: set = set()
+    for _ in range(args.runs):
+        pared_ms, tiempos = medir_arranque(args.comando)
+        paredes.append(pared_ms)
+        propios.append(tiempo_propio_us(tiempos))
+        cargados.update(tiempos)
+
+    paredes.sort()
+    prom_import_ms = sum(propios) / len(propios) / 1000.0
+    print(f"comando: {args.comando} ({args.runs} corridas)")
+    print(f"  pared mediana: {paredes[len(paredes) // 2]:.1f} ms")
+    print(f"  import backgammon promedio: {prom_import_ms:.2f} ms (presupuesto {args.budget_ms} ms)")
+
+    indebidos = [m for m in PROHIBIDOS if m in cargados]
+    if indebidos:
+        print(f"  ERROR: se importaron módulos innecesarios: {indebidos}")
+        return 1
+    if prom_import_ms > args.budget_ms:
+        print("  ERROR: presupuesto de import excedido")
+        return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,103 @@
+"""
+Benchmark del costo por llamada de GameFacade frente a core.game.Game.
+
+Mide is_valid_move, move, roll y next_turn en tres variantes: Game,
+GameFacade (delegando en los componentes SOLID) y GameFacade con
+fast_path=True. Falla (exit 1) si el camino rápido supera al Game en más
+que la tolerancia indicada.
+
+Uso:
+    python -m backgammon.benchmarks.facade_overhead [--n 200000] [--tolerancia 1.25]
+"""
+from __future__ import annotations
+
+import argparse
+import sys
+import timeit
+from typing import Callable, Dict, List
+
+from backgammon.core.board import BoardWithSetup
+from backgammon.core.dice import Dice
+from backgammon.core.game import Game
+from backgammon.core.game_refactored import GameFacade
+from backgammon.core.player import Player
+
+
+def _crear(variante: str):
+    p1 = Player("Blancas", color="blanco")
+    p2 = Player("Negras", color="negro")
+    board = BoardWithSetup()
+    board.setup_initial_position(p1, p2)
+    dice = Dice.from_seed(1)
+    if variante == "game":
+        return Game(p1, p2, board=board, dice=dice)
+    return GameFacade(p1, p2, board=board, dice=dice, fast_path=(variante == "fast"))
+
+
+def _operaciones(juego) -> Dict[str, Callable[[], object]]:
+    """Arma un cierre por operación; move va y vuelve para no alterar el tablero."""
+    def mover_ida_vuelta():
+        juego.move(1, 2)
+        juego.move(2, 1)
+
+    def turno_doble():
+        juego.next_turn()
+        juego.next_turn()
+
+    return {
+        "is_valid_move": lambda: juego.is_valid_move(1, 3, 2),
+        "move (x2)": mover_ida_vuelta,
+        "roll": juego.roll,
+        "next_turn (x2)": turno_doble,
+    }
+
+
+def medir(n: int, repeticiones: int = 15) -> Dict[str, Dict[str, float]]:
+    """
+    Mide ns por llamada de cada operación en cada variante.
+
+    Las variantes se alternan dentro de cada repetición y se toma el mínimo,
+    así el ruido de la máquina afecta a todas por igual.
+
+    Args:
+        n: Cantidad de llamadas por operación y repetición
+        repeticiones: Cantidad de repeticiones alternadas
+
+    Returns:
+        Diccionario operación -> {variante: ns por llamada}
+    """
+    variantes = ("game", "facade", "fast")
+    ops = {v: _operaciones(_crear(v)) for v in variantes}
+    resultados: Dict[str, Dict[str, float]] = {}
+    for nombre in ops["game"]:
+        mejores = {v: float("inf") for v in variantes}
+        for _ in range(repeticiones):
+            for v in variantes:
+                t = timeit.timeit(ops[v][nombre], number=n)
+                mejores[v] = min(mejores[v], t / n * 1e9)
+        resultados[nombre] = mejores
+    return resultados
+
+
+def main(argv: List[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(description="Overhead por llamada de GameFacade")
+    parser.add_argument("--n", type=int, default=20_000)
+    parser.add_argument("--tolerancia", type=float, default=1.25,
+                        help="Máximo cociente fast/game permitido")
+    args = parser.parse_args(argv)
+
+    resultados = medir(args.n)
+    ok = True
+    print(f"{'operación':<16}{'Game':>10}{'Facade':>10}{'fast':>10}{'fast/Game':>11}")
+    for nombre, r in resultados.items():
+        cociente = r["fast"] / r["game"]
+        ok = ok and cociente <= args.tolerancia
+        print(f"{nombre:<16}{r['game']:>9.0f}n{r['facade']:>9.0f}n{r['fast']:>9.0f}n{cociente:>11.2f}")
+    if not ok:
+        print(f"ERROR: el camino rápido supera la tolerancia de {args.tolerancia}x")
+        return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
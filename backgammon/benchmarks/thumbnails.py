@@ -0,0 +1,77 @@
+"""
+Benchmark del render por lotes de posiciones a PNG.
+
+Genera posiciones jugando partidas al azar, las dibuja sin ventana con
+ThumbnailRenderer en un solo proceso (un núcleo) y reporta imágenes por
+segundo. Falla (exit 1) si no llega al mínimo indicado.
+
+Uso:
+    python -m backgammon.benchmarks.thumbnails [--posiciones 1000] [--min-por-segundo 100]
+"""
+from __future__ import annotations
+
+import argparse
+import random
+import sys
+import tempfile
+import time
+from typing import List
+
+
+def generar(cantidad: int, seed: int) -> List:
+    """Posiciones variadas sacadas de partidas con jugadas al azar."""
+    from backgammon.core.movegen import legal_plays
+    from backgammon.core.position import Position
+
+    rng = random.Random(seed)
+    positions = []
+    while len(positions) < cantidad:
+        position = Position.initial()
+        while len(positions) < cantidad and not (position.has_won("blanco") or position.has_won("negro")):
+            dice = (rng.randint(1, 6), rng.randint(1, 6))
+            position = rng.choice(legal_plays(position, dice))[1]
+            positions.append(position)
+    return positions
+
+
+def medir(cantidad: int, size, seed: int) -> float:
+    """
+    Dibuja y guarda las posiciones en un solo proceso.
+
+    Returns:
+        Imágenes por segundo
+    """
+    from backgammon.pygame_ui.thumbnails import render_batch
+
+    positions = generar(cantidad, seed)
+    items = ((f"p{i:06d}", position) for i, position in enumerate(positions))
+    with tempfile.TemporaryDirectory() as out_dir:
+        start = time.perf_counter()
+        count = render_batch(items, out_dir, size, processes=0)
+        elapsed = time.perf_counter() - start
+    return count / elapsed
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(description="Imágenes por segundo del render sin ventana")
+    parser.add_argument("--posiciones", type=int, default=1000)
+    parser.add_argument("--tamano", default="325x175", help="ANCHOxALTO")
+    parser.add_argument("--seed", type=int, default=1)
+    parser.add_argument("--min-por-segundo", type=float, default=100.0,
+                        help="Mínimo de imágenes por segundo en un núcleo")
+    args = parser.parse_args(argv)
+    try:
+        size = tuple(int(v) for v in args.tamano.lower().split("x"))
+    except ValueError:
+        parser.error(f"Tamaño inválido: {args.tamano}")
+
+    por_segundo = medir(args.posiciones, size, args.seed)
+    print(f"{args.posiciones} posiciones {size[0]}x{size[1]}: {por_segundo:.0f} imágenes/s por núcleo")
+    if por_segundo < args.min_por_segundo:
+        print(f"FALLA: {por_segundo:.0f} imágenes/s está por debajo de {args.min_por_segundo:.0f}")
+        return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
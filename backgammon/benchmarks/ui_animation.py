@@ -0,0 +1,100 @@
+"""
+Benchmark de la animación de movimientos en una partida bot contra bot.
+
+Juega partidas completas entre dos HeuristicBot y anima cada jugada con
+MoveAnimator a la velocidad indicada (por defecto 10x), dibujando con el
+driver de video 'dummy' de SDL a ~60 FPS. Reporta tiempo por cuadro,
+cuadros animados y cuadros salteados. Falla (exit 1) si el p95 del
+cuadro supera el presupuesto.
+
+Uso:
+    python -m backgammon.benchmarks.ui_animation [--partidas 1] [--velocidad 10] [--max-frame-ms 8]
+"""
+from __future__ import annotations
+
+import argparse
+import os
+import random
+import sys
+import time
+from typing import Dict
+
+
+def jugar(partidas: int, velocidad: float, seed: int) -> Dict[str, float]:
+    """
+    Juega y anima partidas bot contra bot.
+
+    Returns:
+        Jugadas, cuadros animados, salteados, p50/p95 de cuadro (ms) y % de CPU
+    """
+    os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+    import pygame
+    from backgammon.core.bot import HeuristicBot
+    from backgammon.core.movegen import apply_play
+    from backgammon.core.position import Position, opponent
+    from backgammon.pygame_ui.animation import MoveAnimator
+    from backgammon.pygame_ui.frame_stats import FrameStats
+    from backgammon.pygame_ui.renderer import BoardRenderer, WIDTH, HEIGHT
+
+    pygame.init()
+    screen = pygame.display.set_mode((WIDTH, HEIGHT))
+    renderer = BoardRenderer(screen)
+    layout = renderer.get_layout()
+    frame_seconds = 1 / 60
+    animator = MoveAnimator(speed=velocidad, frame_seconds=frame_seconds)
+    stats = FrameStats()
+    bot = HeuristicBot()
+    rng = random.Random(seed)
+
+    jugadas = 0
+    stats.start()
+    for _ in range(partidas):
+        position = Position.initial()
+        while not (position.has_won("blanco") or position.has_won("negro")):
+            dice = (rng.randint(1, 6), rng.randint(1, 6))
+            play = bot.choose_play(position, dice)
+            animator.enqueue_play(position, play)
+            position = apply_play(position, play)
+            jugadas += 1
+            while True:
+                start = time.perf_counter()
+                display, overlays = animator.frame(layout, start)
+                rects = renderer.render_position(display or position, dice, "", None, overlays)
+                pygame.display.update(rects)
+                stats.record_frame(time.perf_counter() - start)
+                if display is None:
+                    break
+                time.sleep(max(0.0, frame_seconds - (time.perf_counter() - start)))
+    stats.stop()
+    pygame.quit()
+    return {
+        "jugadas": jugadas,
+        "cuadros": animator.get_frames(),
+        "salteados": animator.get_dropped_frames(),
+        "p50": stats.get_frame_ms(50),
+        "p95": stats.get_frame_ms(95),
+        "cpu": stats.get_cpu_percent(),
+    }
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(description="Animación bot contra bot")
+    parser.add_argument("--partidas", type=int, default=1)
+    parser.add_argument("--velocidad", type=float, default=10.0)
+    parser.add_argument("--seed", type=int, default=1)
+    parser.add_argument("--max-frame-ms", type=float, default=8.0,
+                        help="p95 máximo (ms) permitido para dibujar un cuadro animado")
+    args = parser.parse_args(argv)
+
+    r = jugar(args.partidas, args.velocidad, args.seed)
+    print(f"jugadas={r['jugadas']} cuadros={r['cuadros']} salteados={r['salteados']} "
+          f"cuadro p50={r['p50']:.2f}ms p95={r['p95']:.2f}ms cpu={r['cpu']:.1f}%")
+
+    if r["p95"] > args.max_frame_ms:
+        print(f"FALLA: el p95 del cuadro ({r['p95']:.2f}ms) supera {args.max_frame_ms}ms")
+        return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
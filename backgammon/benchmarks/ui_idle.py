@@ -0,0 +1,75 @@
+"""
+Benchmark del costo ocioso de la UI de Pygame.
+
+Abre la UI con el driver de video 'dummy' de SDL, la deja quieta unos
+segundos con cada loop (polling a 60 FPS y event-driven) y reporta
+cuadros dibujados, tiempo por cuadro y uso de CPU. Falla (exit 1) si el
+loop event-driven ocioso usa más CPU que el máximo indicado.
+
+Uso:
+    python -m backgammon.benchmarks.ui_idle [--segundos 3] [--max-cpu 5]
+"""
+from __future__ import annotations
+
+import argparse
+import os
+import sys
+from typing import Dict
+
+
+def medir(modo: str, segundos: float) -> Dict[str, float]:
+    """
+    Corre la UI sin interacción durante un tiempo.
+
+    Args:
+        modo: "polling" o "event"
+        segundos: Duración de la medición
+
+    Returns:
+        Cuadros, despertares, p50 de cuadro (ms) y % de CPU
+    """
+    os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+    import pygame
+    from backgammon.pygame_ui.main import BackgammonUI, create_game
+    from backgammon.pygame_ui.renderer import WIDTH, HEIGHT
+
+    pygame.init()
+    screen = pygame.display.set_mode((WIDTH, HEIGHT))
+    ui = BackgammonUI(screen, create_game())
+    # Un QUIT programado corta el loop sin tocar su código
+    pygame.time.set_timer(pygame.QUIT, int(segundos * 1000), 1)
+    if modo == "polling":
+        ui.run_polling()
+    else:
+        ui.run_event_driven()
+    stats = ui.get_stats()
+    pygame.quit()
+    return {
+        "cuadros": stats.get_frames(),
+        "despertares": stats.get_wakeups(),
+        "cuadro_ms": stats.get_frame_ms(50),
+        "cpu": stats.get_cpu_percent(),
+    }
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(description="Costo ocioso de la UI de Pygame")
+    parser.add_argument("--segundos", type=float, default=3.0)
+    parser.add_argument("--max-cpu", type=float, default=5.0,
+                        help="CPU máxima (%%) permitida al loop event-driven ocioso")
+    args = parser.parse_args(argv)
+
+    resultados = {modo: medir(modo, args.segundos) for modo in ("polling", "event")}
+    print(f"{'loop':<10}{'cuadros':>10}{'despertares':>14}{'cuadro p50':>13}{'cpu':>9}")
+    for modo, r in resultados.items():
+        print(f"{modo:<10}{r['cuadros']:>10}{r['despertares']:>14}"
+              f"{r['cuadro_ms']:>11.2f}ms{r['cpu']:>8.1f}%")
+
+    if resultados["event"]["cpu"] > args.max_cpu:
+        print(f"FALLA: el loop event-driven ocioso usa {resultados['event']['cpu']:.1f}% de CPU")
+        return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
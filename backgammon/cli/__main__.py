@@ -1,29 +1,80 @@
-﻿import argparse
+﻿"""
+CLI de Backgammon.
+
+El arranque es liviano a propósito: colorama y las clases del core se
+importan recién cuando un comando las necesita, así los scripts que invocan
+el CLI miles de veces no pagan imports que no usan.
+"""
 import sys
 
-try:
-    from colorama import init, Fore, Back, Style
-    init(autoreset=True)
-    HAS_COLOR = True
-except ImportError:
-    HAS_COLOR = False
-    # Fallback sin colores
-    class Fore:
-        RED = GREEN = YELLOW = BLUE = MAGENTA = CYAN = WHITE = RESET = ""
-    class Back:
-        BLACK = RED = GREEN = YELLOW = BLUE = MAGENTA = CYAN = WHITE = RESET = ""
-    class Style:
-        BRIGHT = DIM = NORMAL = RESET_ALL = ""
-
-from backgammon.core.dice import Dice
-from backgammon.core.board import Board, BoardWithSetup
-from backgammon.core.player import Player
-from backgammon.core.game import Game
+# Se completa recién cuando se usa el primer color (ver _cargar_colores)
+HAS_COLOR = False
+
+
+class _SinColor:
+    """Paleta vacía: cualquier código de color es un string vacío."""
+
+    def __getattr__(self, name):
+        return ""
+
+
+class _ColorPerezoso:
+    """
+    Proxy de Fore/Back/Style que carga colorama en el primer uso.
+
+    Solo se activan colores si stdout es una TTY; en pipes o redirecciones
+    no se importa colorama en absoluto.
+    """
+
+    def __init__(self, nombre):
+        self.__nombre = nombre
+
+    def __getattr__(self, name):
+        return getattr(_cargar_colores()[self.__nombre], name)
+
+
+_PALETA = None
+
+
+def _cargar_colores():
+    """
+    Resuelve la paleta de colores una sola vez y reemplaza los proxies
+    globales por los objetos reales, así los siguientes accesos son directos.
+
+    Returns:
+        Diccionario con las paletas 'Fore', 'Back' y 'Style'
+    """
+    global _PALETA, HAS_COLOR, Fore, Back, Style
+    if _PALETA is None:
+        sin_color = _SinColor()
+        _PALETA = {"Fore": sin_color, "Back": sin_color, "Style": sin_color}
+        isatty = getattr(sys.stdout, "isatty", None)
+        if isatty is not None and isatty():
+            try:
+                import colorama
+                colorama.init(autoreset=True)
+                _PALETA = {"Fore": colorama.Fore, "Back": colorama.Back, "Style": colorama.Style}
+                HAS_COLOR = True
+            except ImportError:
+                pass
+        Fore, Back, Style = _PALETA["Fore"], _PALETA["Back"], _PALETA["Style"]
+    return _PALETA
+
+
+def _colores_activos():
+    """Devuelve True si la terminal usa colores (carga la paleta si hace falta)."""
+    _cargar_colores()
+    return HAS_COLOR
+
+
+Fore = _ColorPerezoso("Fore")
+Back = _ColorPerezoso("Back")
+Style = _ColorPerezoso("Style")
 
 
 def print_header(text):
     """Imprime un header colorido."""
-    if HAS_COLOR:
+    if _colores_activos():
         print(f"\n{Fore.CYAN}{Style.BRIGHT}{'='*50}")
         print(f"{Fore.CYAN}{Style.BRIGHT}{text:^50}")
         print(f"{Fore.CYAN}{Style.BRIGHT}{'='*50}{Style.RESET_ALL}\n")
@@ -35,6 +86,8 @@ def print_header(text):
 
 def cmd_roll(_args):
     """Tira los dados y muestra el resultado con colores."""
+    from backgammon.core.dice import Dice
+
     print_header("TIRANDO DADOS")
     
     d = Dice()
@@ -53,6 +106,8 @@ def cmd_roll(_args):
 
 def cmd_board(_args):
     """Muestra el tablero con ASCII art mejorado."""
+    from backgammon.core.board import Board
+
     print_header("TABLERO DE BACKGAMMON")
     
     b = Board()
@@ -143,6 +198,9 @@ def cmd_info(_args):
 
 def cmd_setup(_args):
     """Muestra el tablero con la posición inicial estándar."""
+    from backgammon.core.board import BoardWithSetup
+    from backgammon.core.player import Player
+
     print_header("TABLERO - POSICION INICIAL")
     
     # Crear tablero con setup
@@ -218,6 +276,8 @@ def cmd_setup(_args):
 
 def cmd_simulate(_args):
     """Simula una tirada de dados y muestra posibles movimientos."""
+    from backgammon.core.dice import Dice
+
     print_header("SIMULACION DE TIRADA")
     
     d = Dice()
@@ -280,6 +340,10 @@ def cmd_stats(_args):
 
 def cmd_play(_args):
     """Juego interactivo completo en CLI."""
+    from backgammon.core.board import BoardWithSetup
+    from backgammon.core.player import Player
+    from backgammon.core.game import Game
+
     print_header("BACKGAMMON - MODO JUEGO")
     
     # Setup inicial
@@ -451,7 +515,7 @@ def mostrar_tablero_cli(board):
             top_checker = board.get_top_checker(i)
             if top_checker and hasattr(top_checker, 'get_color'):
                 color = top_checker.get_color()
-                if HAS_COLOR:
+                if _colores_activos():
                     symbol = f"{Fore.WHITE}●{count:1d}{Style.RESET_ALL}" if color == "blanco" else f"{Fore.RED}○{count:1d}{Style.RESET_ALL}"
                 else:
                     symbol = f"●{count:1d}" if color == "blanco" else f"○{count:1d}"
@@ -478,7 +542,7 @@ def mostrar_tablero_cli(board):
             bottom_checker = board.get_top_checker(i)
             if bottom_checker and hasattr(bottom_checker, 'get_color'):
                 color = bottom_checker.get_color()
-                if HAS_COLOR:
+                if _colores_activos():
                     symbol = f"{Fore.WHITE}●{count:1d}{Style.RESET_ALL}" if color == "blanco" else f"{Fore.RED}○{count:1d}{Style.RESET_ALL}"
                 else:
                     symbol = f"●{count:1d}" if color == "blanco" else f"○{count:1d}"
@@ -573,11 +637,33 @@ def mostrar_ayuda_juego():
     print("  - M 8 13   (mover 5 espacios)")
 
 
-def main():
-    """Función principal de la CLI."""
+# Subcomandos: nombre -> (función, ayuda). El orden es el de la ayuda.
+COMANDOS = {
+    "play": (cmd_play, "Jugar una partida interactiva completa"),
+    "roll": (cmd_roll, "Tirar los dados"),
+    "board": (cmd_board, "Mostrar tablero con ASCII art"),
+    "info": (cmd_info, "Mostrar información del juego"),
+    "setup": (cmd_setup, "Mostrar tablero con posición inicial"),
+    "simulate": (cmd_simulate, "Simular una tirada y mostrar movimientos"),
+    "stats": (cmd_stats, "Mostrar estadísticas y reglas del juego"),
+}
+
+
+def build_parser():
+    """
+    Construye el parser de argparse.
+
+    Solo se usa para la ayuda o para argumentos que el despacho rápido
+    no entiende, así los comandos simples no importan argparse.
+
+    Returns:
+        ArgumentParser con todos los subcomandos registrados
+    """
+    import argparse
+
     parser = argparse.ArgumentParser(
         prog="backgammon",
-        description=f"{Fore.CYAN}CLI de Backgammon{Style.RESET_ALL} - Juego de mesa clásico",
+        description="CLI de Backgammon - Juego de mesa clásico",
         formatter_class=argparse.RawDescriptionHelpFormatter,
         epilog="""
 Ejemplos de uso:
@@ -590,47 +676,46 @@ Ejemplos de uso:
     
     sub = parser.add_subparsers(dest="cmd", title="Comandos disponibles")
     
-    # Comando play
-    p_play = sub.add_parser("play", help="Jugar una partida interactiva completa")
-    p_play.set_defaults(func=cmd_play)
-    
-    # Comando roll
-    p_roll = sub.add_parser("roll", help="Tirar los dados")
-    p_roll.set_defaults(func=cmd_roll)
+    for nombre, (func, ayuda) in COMANDOS.items():
+        p_cmd = sub.add_parser(nombre, help=ayuda)
+        p_cmd.set_defaults(func=func)
     
-    # Comando board
-    p_board = sub.add_parser("board", help="Mostrar tablero con ASCII art")
-    p_board.set_defaults(func=cmd_board)
-    
-    # Comando info
-    p_info = sub.add_parser("info", help="Mostrar información del juego")
-    p_info.set_defaults(func=cmd_info)
-    
-    # Comando setup
-    p_setup = sub.add_parser("setup", help="Mostrar tablero con posición inicial")
-    p_setup.set_defaults(func=cmd_setup)
-    
-    # Comando simulate
-    p_simulate = sub.add_parser("simulate", help="Simular una tirada y mostrar movimientos")
-    p_simulate.set_defaults(func=cmd_simulate)
-    
-    # Comando stats
-    p_stats = sub.add_parser("stats", help="Mostrar estadísticas y reglas del juego")
-    p_stats.set_defaults(func=cmd_stats)
-    
-    args = parser.parse_args()
-    
-    if hasattr(args, "func"):
-        try:
-            args.func(args)
-        except Exception as e:
-            print(f"{Fore.RED}Error: {e}{Style.RESET_ALL}", file=sys.stderr)
-            return 1
+    return parser
+
+
+def main(argv=None):
+    """
+    Función principal de la CLI.
+
+    Args:
+        argv: Argumentos sin el nombre del programa (por defecto sys.argv[1:])
+
+    Returns:
+        Código de salida (0 si todo salió bien)
+    """
+    if argv is None:
+        argv = sys.argv[1:]
+    
+    # Despacho rápido: "backgammon roll" no necesita argparse
+    if len(argv) == 1 and argv[0] in COMANDOS:
+        func = COMANDOS[argv[0]][0]
+        args = None
     else:
-        parser.print_help()
+        parser = build_parser()
+        args = parser.parse_args(argv)
+        func = getattr(args, "func", None)
+        if func is None:
+            parser.print_help()
+            return 0
+    
+    try:
+        func(args)
+    except Exception as e:
+        print(f"{Fore.RED}Error: {e}{Style.RESET_ALL}", file=sys.stderr)
+        return 1
     
     return 0
 
 
 if __name__ == "__main__":
-    sys.exit(main())
\ No newline at end of file
+    sys.exit(main())
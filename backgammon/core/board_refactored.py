@@ -1,11 +1,8 @@
 from __future__ import annotations
-from typing import List, Optional, Tuple, TYPE_CHECKING
+from typing import List, Optional, Tuple
 
-if TYPE_CHECKING:
-    from .player import Player
-    from .checker import Checker
-
-from .board import Board, BoardWithSetup
+from .checker import Checker
+from .engine import BoardEngine, POSICION_INICIAL
 
 
 class BoardPoints:
@@ -13,15 +10,20 @@ class BoardPoints:
     SRP: Responsabilidad única de gestionar los 24 puntos del tablero.
     
     Maneja solo el estado de los puntos (fichas en cada posición).
+    El estado vive en un BoardEngine, que puede compartirse con otros
+    componentes (así lo hace BoardFacade).
     """
     
-    def __init__(self):
-        # 25 elementos: índice 0 no se usa, puntos 1-24
-        self.__points: List[List] = [[] for _ in range(25)]
+    def __init__(self, engine: Optional[BoardEngine] = None):
+        self.__engine = engine if engine is not None else BoardEngine()
+    
+    def get_engine(self) -> BoardEngine:
+        """Getter del motor que guarda el estado."""
+        return self.__engine
     
     def get_points(self) -> List[List]:
         """Getter de todos los puntos."""
-        return self.__points
+        return self.__engine.points
     
     def get_point(self, point: int) -> List:
         """
@@ -35,7 +37,7 @@ class BoardPoints:
         """
         if not (1 <= point <= 24):
             return []
-        return self.__points[point]
+        return self.__engine.points[point]
     
     def add_checker_to_point(self, point: int, checker) -> None:
         """
@@ -45,9 +47,7 @@ class BoardPoints:
             point: Número del punto (1-24)
             checker: Ficha a agregar
         """
-        if not (1 <= point <= 24):
-            raise ValueError(f"Punto {point} fuera de rango (1-24)")
-        self.__points[point].append(checker)
+        self.__engine.add_checker(point, checker)
     
     def remove_checker_from_point(self, point: int):
         """
@@ -59,13 +59,7 @@ class BoardPoints:
         Returns:
             La ficha removida
         """
-        if not (1 <= point <= 24):
-            raise ValueError(f"Punto {point} fuera de rango (1-24)")
-        
-        if not self.__points[point]:
-            raise ValueError(f"No hay fichas en el punto {point}")
-        
-        return self.__points[point].pop()
+        return self.__engine.pop_checker(point)
     
     def point_count(self, point: int) -> int:
         """
@@ -77,9 +71,7 @@ class BoardPoints:
         Returns:
             Cantidad de fichas
         """
-        if not (1 <= point <= 24):
-            return 0
-        return len(self.__points[point])
+        return self.__engine.point_count(point)
     
     def get_top_checker(self, point: int):
         """
@@ -91,17 +83,11 @@ class BoardPoints:
         Returns:
             La ficha superior o None
         """
-        if not (1 <= point <= 24):
-            return None
-        
-        if not self.__points[point]:
-            return None
-        
-        return self.__points[point][-1]
+        return self.__engine.get_top_checker(point)
     
     def clear(self) -> None:
         """Limpia todos los puntos."""
-        self.__points = [[] for _ in range(25)]
+        self.__engine.clear_points()
 
 
 class BarManager:
@@ -111,12 +97,16 @@ class BarManager:
     Maneja las fichas capturadas que deben re-entrar al tablero.
     """
     
-    def __init__(self):
-        self.__bar: List = []
+    def __init__(self, engine: Optional[BoardEngine] = None):
+        self.__engine = engine if engine is not None else BoardEngine()
+    
+    def get_engine(self) -> BoardEngine:
+        """Getter del motor que guarda el estado."""
+        return self.__engine
     
     def get_bar(self) -> List:
-        """Getter de la barra."""
-        return self.__bar
+        """Getter de la barra (copia: el motor guarda una pila por color)."""
+        return self.__engine.bar
     
     def add_to_bar(self, checker) -> None:
         """
@@ -125,7 +115,7 @@ class BarManager:
         Args:
             checker: Ficha capturada
         """
-        self.__bar.append(checker)
+        self.__engine.capture_checker(checker)
     
     def remove_from_bar(self, color: str):
         """
@@ -137,10 +127,7 @@ class BarManager:
         Returns:
             La ficha removida o None
         """
-        for i, checker in enumerate(self.__bar):
-            if checker.get_color() == color:
-                return self.__bar.pop(i)
-        return None
+        return self.__engine.remove_from_bar(color)
     
     def get_bar_count(self, color: str) -> int:
         """
@@ -152,11 +139,11 @@ class BarManager:
         Returns:
             Cantidad de fichas
         """
-        return sum(1 for c in self.__bar if c.get_color() == color)
+        return self.__engine.get_bar_count(color)
     
     def clear(self) -> None:
         """Limpia la barra."""
-        self.__bar = []
+        self.__engine.clear_bar()
 
 
 class BearOffManager:
@@ -166,12 +153,16 @@ class BearOffManager:
     Maneja las fichas que han sido sacadas del tablero.
     """
     
-    def __init__(self):
-        self.__off: dict = {"blanco": 0, "negro": 0}
+    def __init__(self, engine: Optional[BoardEngine] = None):
+        self.__engine = engine if engine is not None else BoardEngine()
+    
+    def get_engine(self) -> BoardEngine:
+        """Getter del motor que guarda el estado."""
+        return self.__engine
     
     def get_off_dict(self) -> dict:
         """Getter del diccionario de bear off."""
-        return self.__off
+        return self.__engine.off
     
     def get_off_count(self, color: str) -> int:
         """
@@ -183,7 +174,7 @@ class BearOffManager:
         Returns:
             Cantidad de fichas sacadas
         """
-        return self.__off.get(color, 0)
+        return self.__engine.get_off_count(color)
     
     def bear_off_checker(self, color: str) -> None:
         """
@@ -192,7 +183,7 @@ class BearOffManager:
         Args:
             color: Color de la ficha
         """
-        self.__off[color] = self.__off.get(color, 0) + 1
+        self.__engine.bear_off(color)
     
     def has_won(self, color: str) -> bool:
         """
@@ -204,11 +195,11 @@ class BearOffManager:
         Returns:
             True si tiene 15 fichas fuera
         """
-        return self.get_off_count(color) >= 15
+        return self.__engine.has_won(color)
     
     def clear(self) -> None:
         """Reinicia bear off."""
-        self.__off = {"blanco": 0, "negro": 0}
+        self.__engine.clear_off()
 
 
 class CaptureRules:
@@ -363,9 +354,35 @@ class BoardFacade:
     Esta clase mantiene compatibilidad con la interfaz de Board original,
     pero internamente delega responsabilidades a componentes especializados.
     
+    Cuando se usan los componentes por defecto, todos comparten un mismo
+    BoardEngine (el motor que usa Board) y los métodos del tablero quedan
+    ligados directamente al motor, sin saltos por componente en cada llamada.
+    
     DIP: Acepta inyección de dependencias para los componentes.
     """
     
+    # Métodos que se ligan al motor compartido: nombre en la fachada -> en BoardEngine
+    _ENGINE_METHODS = {
+        "colocar_ficha": "colocar_ficha",
+        "point_count": "point_count",
+        "get_top_checker": "get_top_checker",
+        "get_bar_count": "get_bar_count",
+        "capture_checker": "capture_checker",
+        "remove_from_bar": "remove_from_bar",
+        "get_off_count": "get_off_count",
+        "bear_off": "bear_off",
+        "bear_off_checker": "bear_off",
+        "has_won": "has_won",
+        "is_empty": "is_empty",
+        "get_point_color": "get_point_color",
+        "can_place_checker": "can_place_checker",
+        "mover_ficha": "mover_ficha",
+        "is_in_home_board": "is_in_home_board",
+        "all_in_home_board": "all_in_home_board",
+        "get_all_checkers": "get_all_checkers",
+        "clear": "clear",
+    }
+    
     def __init__(
         self,
         points: Optional[BoardPoints] = None,
@@ -384,15 +401,52 @@ class BoardFacade:
             capture_rules: Componente de reglas de captura (si es None, crea uno)
             validator: Componente de validación (si es None, crea uno)
         """
+        # Los componentes por defecto comparten un único motor
+        engine = BoardEngine()
+        
         # Inyección de dependencias (DIP)
-        self.__points = points or BoardPoints()
-        self.__bar = bar or BarManager()
-        self.__bear_off = bear_off or BearOffManager()
+        self.__points = points or BoardPoints(engine)
+        self.__bar = bar or BarManager(engine)
+        self.__bear_off = bear_off or BearOffManager(engine)
         self.__capture_rules = capture_rules or CaptureRules(self.__points, self.__bar)
         self.__validator = validator or BoardValidator(self.__points)
         
-        # Guardar referencia a Board original para compatibilidad
-        self.__original_board = Board()
+        self.__engine: Optional[BoardEngine] = None
+        self.__bind_engine()
+    
+    def __bind_engine(self) -> None:
+        """
+        Liga los métodos del tablero al motor compartido, si se puede.
+
+        Solo es seguro cuando los componentes son los estándar y comparten
+        el mismo BoardEngine; con componentes inyectados a medida se usa la
+        delegación clásica por componente.
+        """
+        for name in self._ENGINE_METHODS:
+            self.__dict__.pop(name, None)
+        self.__engine = None
+        
+        points, bar, bear_off = self.__points, self.__bar, self.__bear_off
+        rules, validator = self.__capture_rules, self.__validator
+        if not (type(points) is BoardPoints and type(bar) is BarManager
+                and type(bear_off) is BearOffManager):
+            return
+        engine = points.get_engine()
+        if bar.get_engine() is not engine or bear_off.get_engine() is not engine:
+            return
+        if not (type(rules) is CaptureRules and rules.get_points() is points
+                and rules.get_bar() is bar):
+            return
+        if not (type(validator) is BoardValidator and validator.get_points() is points):
+            return
+        
+        self.__engine = engine
+        for name, engine_name in self._ENGINE_METHODS.items():
+            setattr(self, name, getattr(engine, engine_name))
+    
+    def get_engine(self) -> Optional[BoardEngine]:
+        """Devuelve el motor compartido o None si hay componentes a medida."""
+        return self.__engine
     
     #  Getters y Setters de componentes 
     
@@ -405,6 +459,7 @@ class BoardFacade:
         self.__points = points
         self.__capture_rules.set_points(points)
         self.__validator.set_points(points)
+        self.__bind_engine()
     
     def get_bar_component(self) -> BarManager:
         """Getter del componente de barra."""
@@ -414,6 +469,7 @@ class BoardFacade:
         """Setter del componente de barra."""
         self.__bar = bar
         self.__capture_rules.set_bar(bar)
+        self.__bind_engine()
     
     def get_bear_off_component(self) -> BearOffManager:
         """Getter del componente de bear off."""
@@ -422,6 +478,7 @@ class BoardFacade:
     def set_bear_off_component(self, bear_off: BearOffManager) -> None:
         """Setter del componente de bear off."""
         self.__bear_off = bear_off
+        self.__bind_engine()
     
     def get_capture_rules(self) -> CaptureRules:
         """Getter del componente de reglas de captura."""
@@ -430,6 +487,7 @@ class BoardFacade:
     def set_capture_rules(self, capture_rules: CaptureRules) -> None:
         """Setter del componente de reglas de captura."""
         self.__capture_rules = capture_rules
+        self.__bind_engine()
     
     def get_validator(self) -> BoardValidator:
         """Getter del componente de validación."""
@@ -438,6 +496,7 @@ class BoardFacade:
     def set_validator(self, validator: BoardValidator) -> None:
         """Setter del componente de validación."""
         self.__validator = validator
+        self.__bind_engine()
     
     #  Delegación a BoardPoints 
     
@@ -462,12 +521,8 @@ class BoardFacade:
             player: Jugador dueño de la ficha
             point: Número del punto (1-24)
         """
-        from .checker import Checker
         checker = Checker(player=player, color=player.get_color())
         self.__points.add_checker_to_point(point, checker)
-        
-        # Sincronizar con Board original
-        self.__original_board.colocar_ficha(player, point)
     
     #  Delegación a BarManager
     
@@ -674,31 +729,8 @@ class BoardWithSetupFacade(BoardFacade):
             player1: Jugador con fichas blancas
             player2: Jugador con fichas negras
         """
-        # Limpiar tablero
         self.clear()
-        
-        # Fichas BLANCAS (player1)
-        for _ in range(2):
-            self.colocar_ficha(player1, 1)
-        
-        for _ in range(5):
-            self.colocar_ficha(player1, 12)
-        
-        for _ in range(3):
-            self.colocar_ficha(player1, 17)
-        
-        for _ in range(5):
-            self.colocar_ficha(player1, 19)
-        
-        # Fichas NEGRAS (player2)
-        for _ in range(2):
-            self.colocar_ficha(player2, 24)
-        
-        for _ in range(5):
-            self.colocar_ficha(player2, 13)
-        
-        for _ in range(3):
-            self.colocar_ficha(player2, 8)
-        
-        for _ in range(5):
-            self.colocar_ficha(player2, 6)
\ No newline at end of file
+        players = (player1, player2)
+        for owner, point, count in POSICION_INICIAL:
+            for _ in range(count):
+                self.colocar_ficha(players[owner], point)
@@ -0,0 +1,163 @@
+from __future__ import annotations
+import random
+import threading
+from typing import List, Optional, Sequence, Tuple
+
+from .movegen import legal_plays
+from .position import Play, Position
+
+"""
+Jugadores automáticos.
+
+Los bots reciben una Position (foto inmutable) y una tirada y devuelven
+una jugada; nunca tocan el tablero real. Eso permite correrlos en otro
+hilo o proceso mientras la interfaz sigue respondiendo.
+"""
+
+
+class SearchCancelled(Exception):
+    """La búsqueda se canceló antes de terminar."""
+
+
+def evaluate(position: Position, color: str) -> float:
+    """
+    Evaluación heurística de una posición desde el punto de vista de color.
+
+    Suma ventaja en la carrera (pips), puntos hechos (más en el home board),
+    el prime más largo y fichas en la barra, y resta blots a tiro del rival.
+    En una carrera sin contacto solo cuentan los pips y las fichas sacadas.
+
+    Returns:
+        Puntaje: cuanto más alto, mejor para color
+    """
+    rel = position.to_relative(color)
+    my_pips = rel[25] * 25
+    their_pips = rel[26] * 25
+    my_back = 0
+    their_front = 25
+    for r in range(1, 25):
+        n = rel[r]
+        if n > 0:
+            my_pips += n * r
+            my_back = r
+        elif n < 0:
+            their_pips += -n * (25 - r)
+            if their_front == 25:
+                their_front = r
+    if rel[26]:
+        their_front = 0
+
+    score = float(their_pips - my_pips)
+    score += 2.0 * rel[0]
+
+    # Sin contacto: carrera pura
+    if their_front > my_back and not rel[25]:
+        return score
+
+    score -= 8.0 * rel[25]
+    score += 6.0 * rel[26]
+
+    prime = longest = 0
+    for r in range(1, 25):
+        n = rel[r]
+        if n >= 2:
+            score += 2.0
+            if r <= 6:
+                score += 1.5
+            elif r == 7:
+                score += 1.0
+            prime += 1
+            longest = max(longest, prime)
+        else:
+            prime = 0
+        if n == 1:
+            score -= _blot_penalty(rel, r)
+    score += 0.5 * longest * longest
+    return score
+
+
+def _blot_penalty(rel: List[int], r: int) -> float:
+    """Penalización por un blot propio en el punto relativo r."""
+    # El rival avanza hacia los r altos; desde su barra entra en 1..6
+    closest = 25
+    if rel[26] and r <= 6:
+        closest = r
+    for q in range(r - 1, max(r - 13, 0), -1):
+        if rel[q] < 0:
+            closest = min(closest, r - q)
+            break
+    if closest <= 6:
+        return 4.0 + (1.0 if r <= 6 else 0.0)
+    if closest <= 12:
+        return 1.5
+    return 0.0
+
+
+class Bot:
+    """Interfaz común: elegir una jugada para una posición y una tirada."""
+
+    def choose_play(
+        self,
+        position: Position,
+        dice: Sequence[int],
+        cancel: Optional[threading.Event] = None,
+    ) -> Play:
+        """
+        Elige una jugada.
+
+        Args:
+            position: Posición con el color del bot en turno
+            dice: Tirada (dos valores)
+            cancel: Evento que, si se activa, corta la búsqueda
+
+        Returns:
+            La jugada (tupla vacía si no hay movimientos posibles)
+
+        Raises:
+            SearchCancelled: Si cancel se activó durante la búsqueda
+        """
+        raise NotImplementedError
+
+
+class RandomBot(Bot):
+    """Elige una jugada legal al azar (útil como rival de referencia)."""
+
+    def __init__(self, rng: Optional[random.Random] = None) -> None:
+        self.__rng = rng or random.Random()
+
+    def choose_play(self, position, dice, cancel=None) -> Play:
+        plays = legal_plays(position, dice)
+        if cancel is not None and cancel.is_set():
+            raise SearchCancelled()
+        return self.__rng.choice(plays)[0]
+
+
+class HeuristicBot(Bot):
+    """Elige la jugada cuya posición resultante tiene mejor evaluate()."""
+
+    def rank_plays(
+        self,
+        position: Position,
+        dice: Sequence[int],
+        cancel: Optional[threading.Event] = None,
+    ) -> List[Tuple[float, Play, Position]]:
+        """
+        Evalúa todas las jugadas legales.
+
+        Returns:
+            Lista de (puntaje, jugada, posición resultante), de mejor a peor
+
+        Raises:
+            SearchCancelled: Si cancel se activó durante la búsqueda
+        """
+        color = position.get_turn()
+        ranked = []
+        for play, result in legal_plays(position, dice):
+            if cancel is not None and cancel.is_set():
+                raise SearchCancelled()
+            ranked.append((evaluate(result, color), play, result))
+        ranked.sort(key=lambda item: item[0], reverse=True)
+        return ranked
+
+    def choose_play(self, position, dice, cancel=None) -> Play:
+        return self.rank_plays(position, dice, cancel)[0][1]
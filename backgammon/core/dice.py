@@ -1,6 +1,5 @@
 from __future__ import annotations
 import random
-from typing import Tuple, List, Optional
 
 
 class Dice:
@@ -8,10 +7,10 @@ class Dice:
     Clase que representa dos dados de seis caras
     """
 
-    def __init__(self, rng: Optional[random.Random] = None) -> None:
+    def __init__(self, rng: random.Random | None = None) -> None:
         # Atributos internos con doble underscore (encapsulación)
         self.__rng__ = rng or random.Random()
-        self.__ultima_tirada__: Tuple[int, int] = (0, 0)
+        self.__ultima_tirada__: tuple[int, int] = (0, 0)
 
     @classmethod
     def from_seed(cls, seed: int) -> "Dice":
@@ -19,7 +18,7 @@ class Dice:
         rng = random.Random(seed)
         return cls(rng)
 
-    def roll(self) -> Tuple[int, int]:
+    def roll(self) -> tuple[int, int]:
         """Tira los dos dados, guarda la tirada y devuelve una tupla (d1, d2)"""
         d1 = self.__rng__.randint(1, 6)
         d2 = self.__rng__.randint(1, 6)
@@ -31,7 +30,7 @@ class Dice:
         d1, d2 = self.__ultima_tirada__
         return d1 == d2
 
-    def moves_from_roll(self) -> List[int]:
+    def moves_from_roll(self) -> list[int]:
         """
         Devuelve una lista con los movimientos posibles según la tirada
         Si es doble, repite cuatro veces; si no, solo dos valores
@@ -47,7 +46,7 @@ class Dice:
         """Permite cambiar el generador aleatorio"""
         self.__rng__ = rng
 
-    def get_ultima_tirada(self) -> Tuple[int, int]:
+    def get_ultima_tirada(self) -> tuple[int, int]:
         """Devuelve la última tirada como tupla (d1, d2)"""
         return self.__ultima_tirada__
 
@@ -0,0 +1,304 @@
+from __future__ import annotations
+from typing import List, Optional, Tuple, TYPE_CHECKING
+
+from .checker import Checker
+
+"""
+Motor único del tablero de Backgammon.
+
+Board y BoardFacade comparten esta implementación: las reglas y el estado
+viven en un solo lugar, así cualquier optimización se hace una sola vez.
+"""
+
+if TYPE_CHECKING:
+    from .player import Player
+
+
+# Posición inicial estándar: (índice de jugador, punto, cantidad).
+# Jugador 0 = blancas (mueven 1→24), jugador 1 = negras (mueven 24→1).
+POSICION_INICIAL: Tuple[Tuple[int, int, int], ...] = (
+    (0, 1, 2), (0, 12, 5), (0, 17, 3), (0, 19, 5),
+    (1, 24, 2), (1, 13, 5), (1, 8, 3), (1, 6, 5),
+)
+
+
+class BoardEngine:
+    """
+    Estado y reglas del tablero en una sola clase.
+
+    Atributos públicos (compatibles con la interfaz histórica de Board):
+    - points: 25 listas de fichas (índice 0 sin uso, puntos 1-24)
+    - bar: fichas capturadas (vista de solo lectura, ver la property)
+    - off: fichas sacadas por color
+
+    La barra se guarda como una pila por color, así contar y sacar fichas
+    de la barra es O(1) (se consulta antes de generar cada movimiento).
+    """
+
+    def __init__(self) -> None:
+        self.points: List[List[Checker]] = [[] for _ in range(25)]
+        self.__bar: dict[str, List[Checker]] = {"blanco": [], "negro": []}
+        self.off: dict[str, int] = {"blanco": 0, "negro": 0}
+
+    #  Puntos
+
+    def add_checker(self, point: int, checker: Checker) -> None:
+        """
+        Agrega una ficha existente a un punto.
+
+        Args:
+            point: Número del punto (1-24)
+            checker: Ficha a agregar
+
+        Raises:
+            ValueError: Si el punto está fuera del rango válido
+        """
+        if not (1 <= point <= 24):
+            raise ValueError(f"Punto {point} fuera de rango (1-24)")
+        self.points[point].append(checker)
+
+    def colocar_ficha(self, player: Player, point: int) -> None:
+        """
+        Crea una ficha del jugador y la coloca en un punto.
+
+        Args:
+            player: Jugador dueño de la ficha
+            point: Número del punto (1-24)
+
+        Raises:
+            ValueError: Si el punto está fuera del rango válido
+        """
+        self.add_checker(point, Checker(player=player, color=player.get_color()))
+
+    def pop_checker(self, point: int) -> Checker:
+        """
+        Remueve y retorna la ficha superior de un punto.
+
+        Args:
+            point: Número del punto (1-24)
+
+        Returns:
+            La ficha removida
+
+        Raises:
+            ValueError: Si el punto está fuera de rango o vacío
+        """
+        if not (1 <= point <= 24):
+            raise ValueError(f"Punto {point} fuera de rango (1-24)")
+        stack = self.points[point]
+        if not stack:
+            raise ValueError(f"No hay fichas en el punto {point}")
+        return stack.pop()
+
+    def point_count(self, point: int) -> int:
+        """Cuenta las fichas en un punto (0 si está fuera de rango)."""
+        if not (1 <= point <= 24):
+            return 0
+        return len(self.points[point])
+
+    def get_top_checker(self, point: int) -> Optional[Checker]:
+        """Obtiene la ficha superior de un punto o None si está vacío."""
+        if not (1 <= point <= 24):
+            return None
+        stack = self.points[point]
+        return stack[-1] if stack else None
+
+    def is_empty(self, point: int) -> bool:
+        """Verifica si un punto está vacío (fuera de rango cuenta como vacío)."""
+        if not (1 <= point <= 24):
+            return True
+        return not self.points[point]
+
+    def get_point_color(self, point: int) -> Optional[str]:
+        """Obtiene el color de las fichas en un punto o None si está vacío."""
+        if not (1 <= point <= 24):
+            return None
+        stack = self.points[point]
+        return stack[-1].get_color() if stack else None
+
+    def can_place_checker(self, point: int, color: str) -> bool:
+        """
+        Verifica si se puede colocar una ficha en un punto.
+
+        Args:
+            point: Número del punto (1-24)
+            color: Color de la ficha a colocar
+
+        Returns:
+            True si el punto está vacío, es propio o tiene una sola ficha rival
+        """
+        if not (1 <= point <= 24):
+            return False
+        stack = self.points[point]
+        if not stack or stack[-1].get_color() == color:
+            return True
+        # Solo se puede capturar si hay una sola ficha del oponente
+        return len(stack) == 1
+
+    def mover_ficha(self, origin: int, dest: int) -> None:
+        """
+        Mueve una ficha de un punto a otro capturando una ficha solitaria rival.
+
+        Args:
+            origin: Punto de origen (1-24)
+            dest: Punto de destino (1-24)
+
+        Raises:
+            ValueError: Si el movimiento es inválido
+        """
+        if not (1 <= origin <= 24 and 1 <= dest <= 24):
+            raise ValueError("Puntos fuera de rango")
+        source = self.points[origin]
+        if not source:
+            raise ValueError(f"No hay fichas en el punto {origin}")
+        checker = source.pop()
+        target = self.points[dest]
+        if len(target) == 1 and target[0].get_color() != checker.get_color():
+            self.capture_checker(target.pop())
+        target.append(checker)
+
+    #  Barra
+
+    @property
+    def bar(self) -> List[Checker]:
+        """
+        Todas las fichas de la barra (blancas primero, después negras).
+
+        Es una lista nueva en cada acceso: para modificar la barra usar
+        capture_checker y remove_from_bar.
+        """
+        checkers: List[Checker] = []
+        for stack in self.__bar.values():
+            checkers.extend(stack)
+        return checkers
+
+    def get_bar_count(self, color: str) -> int:
+        """Cuenta las fichas de un color en la barra (O(1))."""
+        stack = self.__bar.get(color)
+        return len(stack) if stack else 0
+
+    def capture_checker(self, checker: Checker) -> None:
+        """Coloca una ficha capturada en la pila de su color en la barra."""
+        color = checker.get_color()
+        stack = self.__bar.get(color)
+        if stack is None:
+            stack = self.__bar[color] = []
+        stack.append(checker)
+
+    def remove_from_bar(self, color: str) -> Optional[Checker]:
+        """
+        Saca una ficha de la barra (O(1)).
+
+        Args:
+            color: Color de la ficha a sacar
+
+        Returns:
+            La ficha sacada o None si no hay fichas de ese color
+        """
+        stack = self.__bar.get(color)
+        return stack.pop() if stack else None
+
+    #  Bear off
+
+    def get_off_count(self, color: str) -> int:
+        """Obtiene la cantidad de fichas sacadas del tablero."""
+        return self.off.get(color, 0)
+
+    def bear_off(self, color: str) -> None:
+        """Suma una ficha sacada del tablero (bear off)."""
+        self.off[color] = self.off.get(color, 0) + 1
+
+    def has_won(self, color: str) -> bool:
+        """Verifica si un color sacó sus 15 fichas."""
+        return self.off.get(color, 0) >= 15
+
+    #  Análisis
+
+    def is_in_home_board(self, point: int, color: str) -> bool:
+        """Verifica si un punto está en el home board del color."""
+        if color == "blanco":
+            return 19 <= point <= 24
+        return 1 <= point <= 6
+
+    def all_in_home_board(self, color: str) -> bool:
+        """
+        Verifica si todas las fichas de un color están en su home board.
+
+        Args:
+            color: Color del jugador
+
+        Returns:
+            True si no hay fichas fuera del home board ni en la barra
+        """
+        outside = range(1, 19) if color == "blanco" else range(7, 25)
+        points = self.points
+        for point in outside:
+            stack = points[point]
+            if stack and stack[-1].get_color() == color:
+                return False
+        return self.get_bar_count(color) == 0
+
+    def get_all_checkers(self, color: str) -> List[Tuple[int, int]]:
+        """
+        Obtiene todas las posiciones de fichas de un color.
+
+        Returns:
+            Lista de tuplas (punto, cantidad)
+        """
+        points = self.points
+        return [
+            (point, len(points[point]))
+            for point in range(1, 25)
+            if points[point] and points[point][-1].get_color() == color
+        ]
+
+    #  Limpieza
+
+    def clear_points(self) -> None:
+        """Vacía los 24 puntos."""
+        for stack in self.points:
+            stack.clear()
+
+    def clear_bar(self) -> None:
+        """Vacía la barra."""
+        for stack in self.__bar.values():
+            stack.clear()
+
+    def clear_off(self) -> None:
+        """Reinicia los contadores de bear off."""
+        self.off["blanco"] = 0
+        self.off["negro"] = 0
+
+    def clear(self) -> None:
+        """Limpia el tablero completamente."""
+        self.clear_points()
+        self.clear_bar()
+        self.clear_off()
+
+    #  Representación
+
+    def describe(self, title: str) -> str:
+        """
+        Arma la representación de texto del tablero.
+
+        Args:
+            title: Primera línea del texto
+
+        Returns:
+            Texto de varias líneas con puntos, barra y bear off
+        """
+        lines = [title]
+        lines.append("Arriba (13-24): " + self.__describe_row(range(13, 25)))
+        lines.append(f"Bar: Blancas={self.get_bar_count('blanco')}, Negras={self.get_bar_count('negro')}")
+        lines.append(f"Off: Blancas={self.get_off_count('blanco')}, Negras={self.get_off_count('negro')}")
+        lines.append("Abajo (12-1):  " + self.__describe_row(range(12, 0, -1)))
+        return "\n".join(lines)
+
+    def __describe_row(self, points: range) -> str:
+        row = ""
+        for point in points:
+            stack = self.points[point]
+            if stack:
+                symbol = "●" if stack[-1].get_color() == "blanco" else "○"
+                row += f"[{point}:{symbol}{len(stack)}] "
+        return row
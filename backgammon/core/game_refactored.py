@@ -208,7 +208,8 @@ class GameFacade:
         dice: Optional[Dice] = None,
         validator: Optional[MoveValidator] = None,
         turn_manager: Optional[TurnManager] = None,
-        victory_checker: Optional[VictoryChecker] = None
+        victory_checker: Optional[VictoryChecker] = None,
+        fast_path: bool = False
     ):
         """
         Inicializa el juego con inyección de dependencias (DIP).
@@ -221,7 +222,18 @@ class GameFacade:
             validator: Validador de movimientos (si es None, crea uno)
             turn_manager: Gestor de turnos (si es None, crea uno)
             victory_checker: Verificador de victoria (si es None, crea uno)
+            fast_path: Si es True, los métodos calientes (is_valid_move, move,
+                roll, next_turn y los getters de turno) quedan ligados
+                directamente al Game interno, sin delegación por llamada.
+                En ese modo el Game es la única fuente de verdad del turno.
+
+        Raises:
+            ValueError: Si fast_path se combina con un validator o un
+                turn_manager propios (el camino rápido no los consultaría)
         """
+        if fast_path and (validator is not None or turn_manager is not None):
+            raise ValueError("fast_path no admite validator ni turn_manager propios")
+
         # Usar Game original internamente para no romper funcionalidad existente
         self.__game = Game(player1, player2, board=board, dice=dice)
         
@@ -239,6 +251,47 @@ class GameFacade:
             self.__game.get_board(),
             self.__game.get_players()
         )
+        
+        self.__fast_path = fast_path
+        if fast_path:
+            self.__bind_fast_path()
+    
+    # Métodos que el camino rápido liga al Game interno
+    _FAST_PATH_METHODS = (
+        "is_valid_move", "move", "roll", "next_turn",
+        "get_current_player", "get_current_index", "get_board",
+    )
+
+    def __bind_fast_path(self) -> None:
+        """
+        Liga los métodos calientes a los del Game interno.
+
+        Los atributos de instancia tapan a los métodos de clase, así que una
+        llamada como facade.is_valid_move(...) cuesta lo mismo que
+        game.is_valid_move(...): no pasa por el validador ni por el
+        TurnManager, que en este modo no se consultan para el turno.
+        """
+        game = self.__game
+        self.is_valid_move = game.is_valid_move
+        self.move = game.move
+        self.roll = game.roll
+        self.next_turn = game.next_turn
+        self.get_current_player = game.get_current_player
+        self.get_current_index = game.get_current_index
+        self.get_board = game.get_board
+
+    def __unbind_fast_path(self) -> None:
+        """Vuelve a la delegación normal (los métodos de clase)."""
+        if not self.__fast_path:
+            return
+        for name in self._FAST_PATH_METHODS:
+            self.__dict__.pop(name, None)
+        self.__fast_path = False
+        self.__turn_manager.set_current_index(self.__game.get_current_index())
+    
+    def is_fast_path(self) -> bool:
+        """Indica si la fachada usa el camino rápido."""
+        return self.__fast_path
     
     # ========== Getters y Setters de componentes SOLID ==========
     
@@ -247,15 +300,23 @@ class GameFacade:
         return self.__validator
     
     def set_validator(self, validator: MoveValidator) -> None:
-        """Setter del validador de movimientos."""
+        """Setter del validador de movimientos (desactiva el camino rápido)."""
+        self.__unbind_fast_path()
         self.__validator = validator
     
     def get_turn_manager(self) -> TurnManager:
-        """Getter del gestor de turnos."""
+        """Getter del gestor de turnos (sincronizado con el Game en el camino rápido)."""
+        if self.__fast_path:
+            self.__turn_manager.set_current_index(self.__game.get_current_index())
         return self.__turn_manager
     
     def set_turn_manager(self, turn_manager: TurnManager) -> None:
-        """Setter del gestor de turnos."""
+        """Setter del gestor de turnos (desactiva el camino rápido)."""
+        was_fast = self.__fast_path
+        self.__unbind_fast_path()
+        if was_fast:
+            # En el camino rápido el turno vivía solo en el Game
+            turn_manager.set_current_index(self.__game.get_current_index())
         self.__turn_manager = turn_manager
     
     def get_victory_checker(self) -> VictoryChecker:
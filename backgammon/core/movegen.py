@@ -0,0 +1,167 @@
+from __future__ import annotations
+from typing import Dict, List, Optional, Sequence, Tuple
+
+from .position import Play, Position, opponent
+
+"""
+Generación de jugadas legales.
+
+Trabaja sobre la vista relativa de Position (27 enteros vistos por el
+color que mueve: 25 = barra, 0 = afuera) y aplica las reglas completas:
+entrar desde la barra antes de mover otra ficha, bear off exacto o con
+dado mayor desde el punto más alto, usar la mayor cantidad de dados
+posible y, si solo entra uno, el mayor.
+"""
+
+RelMove = Tuple[int, int]
+
+
+def _die_moves(rel: List[int], die: int, max_origin: int = 25) -> List[RelMove]:
+    """Movimientos relativos posibles con un dado (origen <= max_origin)."""
+    if rel[25]:
+        dest = 25 - die
+        if rel[dest] >= -1:
+            return [(25, dest)]
+        return []
+
+    highest = 0
+    for r in range(24, 0, -1):
+        if rel[r] > 0:
+            highest = r
+            break
+    all_home = highest <= 6
+
+    moves = []
+    for r in range(min(highest, max_origin), 0, -1):
+        if rel[r] <= 0:
+            continue
+        dest = r - die
+        if dest >= 1:
+            if rel[dest] >= -1:
+                moves.append((r, dest))
+        elif all_home and (dest == 0 or r == highest):
+            moves.append((r, 0))
+    return moves
+
+
+def _apply(rel: List[int], origin: int, dest: int) -> List[int]:
+    """Aplica un movimiento relativo y devuelve una lista nueva."""
+    new = rel.copy()
+    new[origin] -= 1
+    if dest == 0:
+        new[0] += 1
+    else:
+        if new[dest] == -1:
+            # Captura: la ficha rival va a su barra
+            new[dest] = 0
+            new[26] += 1
+        new[dest] += 1
+    return new
+
+
+def _search(
+    rel: List[int],
+    dice: Tuple[int, ...],
+    moves: Tuple[Tuple[int, int, int], ...],
+    results: List[Tuple[Tuple[Tuple[int, int, int], ...], List[int]]],
+    doubles: bool,
+    max_origin: int,
+) -> None:
+    found = False
+    tried = set()
+    for i, die in enumerate(dice):
+        if die in tried:
+            continue
+        tried.add(die)
+        rest = dice[:i] + dice[i + 1:]
+        for origin, dest in _die_moves(rel, die, max_origin if doubles else 25):
+            found = True
+            # Con dobles el orden no importa: se exige origen no creciente
+            _search(_apply(rel, origin, dest), rest, moves + ((origin, dest, die),),
+                    results, doubles, origin)
+    if not found:
+        results.append((moves, rel))
+
+
+def legal_plays(position: Position, dice: Sequence[int]) -> List[Tuple[Play, Position]]:
+    """
+    Todas las jugadas legales para una tirada, sin repetir posiciones finales.
+
+    Args:
+        position: Posición con el color que mueve en turno
+        dice: Dos valores de dados (con dobles se juegan cuatro movimientos)
+
+    Returns:
+        Lista de (jugada, posición resultante). La posición resultante tiene
+        el turno del rival. Si no hay movimientos posibles devuelve una sola
+        jugada vacía.
+    """
+    color = position.get_turn()
+    rival = opponent(color)
+    d1, d2 = int(dice[0]), int(dice[1])
+    doubles = d1 == d2
+    remaining = (d1,) * 4 if doubles else (d1, d2)
+
+    results: List[Tuple[Tuple[Tuple[int, int, int], ...], List[int]]] = []
+    _search(position.to_relative(), remaining, (), results, doubles, 25)
+
+    max_len = max(len(moves) for moves, _ in results)
+    candidates = [(moves, rel) for moves, rel in results if len(moves) == max_len]
+    if max_len == 1 and not doubles:
+        # Si entra un solo dado, es obligatorio jugar el mayor (si se puede)
+        high = max(d1, d2)
+        with_high = [(moves, rel) for moves, rel in candidates if moves[0][2] == high]
+        candidates = with_high or candidates
+
+    rival_off = position.get_off_count(rival)
+    plays: List[Tuple[Play, Position]] = []
+    seen: Dict[Tuple[int, ...], bool] = {}
+    for moves, rel in candidates:
+        key = tuple(rel)
+        if key in seen:
+            continue
+        seen[key] = True
+        play = tuple(position.to_absolute_move(origin, dest, color) for origin, dest, _ in moves)
+        plays.append((play, Position.from_relative(rel, color, rival, rival_off)))
+    return plays
+
+
+def find_play(position: Position, dice: Sequence[int], play: Play) -> Optional[Position]:
+    """
+    Busca una jugada entre las legales.
+
+    El orden de los movimientos no importa: se comparan las posiciones
+    resultantes, así (8/5, 6/5) y (6/5, 8/5) son la misma jugada.
+
+    Returns:
+        La posición resultante o None si la jugada no es legal
+    """
+    target = apply_play(position, play)
+    if target is None:
+        return None
+    for _, result in legal_plays(position, dice):
+        if result == target:
+            return result
+    return None
+
+
+def apply_play(position: Position, play: Play) -> Optional[Position]:
+    """
+    Aplica una jugada sin validar los dados (solo que cada movimiento sea posible).
+
+    Returns:
+        La posición resultante (turno del rival) o None si algún movimiento
+        sale de un punto sin fichas propias o cae en un punto bloqueado
+    """
+    color = position.get_turn()
+    rel = position.to_relative()
+    for origin, dest in play:
+        r_origin = 25 if origin < 0 else (25 - origin if color == "blanco" else origin)
+        r_dest = 0 if dest == 0 else (25 - dest if color == "blanco" else dest)
+        if not (0 <= r_dest < r_origin <= 25) or rel[r_origin] <= 0:
+            return None
+        if r_dest and rel[r_dest] < -1:
+            return None
+        rel = _apply(rel, r_origin, r_dest)
+    rival = opponent(color)
+    return Position.from_relative(rel, color, rival, position.get_off_count(rival))
@@ -0,0 +1,224 @@
+from __future__ import annotations
+import threading
+import time
+from collections import OrderedDict
+from typing import Dict, List, Optional, Sequence, Tuple
+
+from .bot import Bot, HeuristicBot, SearchCancelled, evaluate
+from .movegen import legal_plays
+from .position import Play, Position
+
+"""
+Pondering: pensar las respuestas del bot mientras juega el humano.
+
+Cuando empieza el turno humano se generan sus jugadas más probables y,
+para cada posición resultante, la mejor jugada del bot con cada una de
+las 21 tiradas posibles. Al llegar el turno del bot la respuesta sale
+del cache sin buscar.
+"""
+
+# Las 21 tiradas distintas (mayor primero)
+ALL_ROLLS: Tuple[Tuple[int, int], ...] = tuple(
+    (d1, d2) for d1 in range(6, 0, -1) for d2 in range(d1, 0, -1)
+)
+
+
+def roll_key(dice: Sequence[int]) -> Tuple[int, int]:
+    """Clave de una tirada sin importar el orden de los dados."""
+    d1, d2 = int(dice[0]), int(dice[1])
+    return (d1, d2) if d1 >= d2 else (d2, d1)
+
+
+class PonderService(Bot):
+    """
+    Bot con cache que piensa en segundo plano durante el turno rival.
+
+    Se usa como cualquier Bot (choose_play); start() arranca el pondering
+    de una posición con el humano en turno y stop() lo corta. Las métricas
+    (aciertos de cache y tiempo ahorrado) salen de get_metrics().
+    """
+
+    def __init__(
+        self,
+        bot: Optional[HeuristicBot] = None,
+        max_replies: int = 4,
+        max_replies_per_roll: int = 2,
+        max_entries: int = 50000,
+    ) -> None:
+        """
+        Args:
+            bot: Bot que busca las jugadas (por defecto HeuristicBot)
+            max_replies: Jugadas humanas a anticipar si ya se conoce su tirada
+            max_replies_per_roll: Jugadas humanas por tirada si todavía no tiró
+            max_entries: Máximo de entradas del cache
+        """
+        self.__bot = bot or HeuristicBot()
+        self.__max_replies = max_replies
+        self.__max_replies_per_roll = max_replies_per_roll
+        self.__max_entries = max_entries
+
+        self.__cache: "OrderedDict[Tuple[Position, Tuple[int, int]], Tuple[Play, float]]" = OrderedDict()
+        self.__lock = threading.Lock()
+        # start/stop se llaman desde el hilo de la UI y desde el del bot
+        self.__control = threading.RLock()
+        self.__cancel = threading.Event()
+        self.__thread: Optional[threading.Thread] = None
+
+        self.__lookups = 0
+        self.__hits = 0
+        self.__time_saved = 0.0
+        self.__ponder_time = 0.0
+
+    #  Pondering
+
+    def start(self, position: Position, dice: Optional[Sequence[int]] = None) -> None:
+        """
+        Empieza a pensar las respuestas a la posición del humano.
+
+        Args:
+            position: Posición con el humano en turno
+            dice: Tirada del humano si ya la conoce (enfoca la búsqueda)
+        """
+        with self.__control:
+            self.stop()
+            cancel = threading.Event()
+            self.__cancel = cancel
+            self.__thread = threading.Thread(
+                target=self.__run, args=(position, dice, cancel), name="backgammon-ponder", daemon=True
+            )
+            self.__thread.start()
+
+    def stop(self, timeout: float = 1.0) -> None:
+        """Corta el pondering en curso (lo ya calculado queda en el cache)."""
+        with self.__control:
+            self.__cancel.set()
+            thread = self.__thread
+            if thread is not None and thread is not threading.current_thread():
+                thread.join(timeout)
+            self.__thread = None
+
+    def is_pondering(self) -> bool:
+        """True mientras el hilo de pondering está trabajando."""
+        thread = self.__thread
+        return thread is not None and thread.is_alive()
+
+    def wait(self, timeout: Optional[float] = None) -> bool:
+        """Espera a que termine el pondering; True si terminó."""
+        thread = self.__thread
+        if thread is None:
+            return True
+        thread.join(timeout)
+        return not thread.is_alive()
+
+    def __targets(
+        self, position: Position, dice: Optional[Sequence[int]], cancel: threading.Event
+    ) -> List[Position]:
+        """Posiciones (bot en turno) que probablemente deje el humano, de más a menos probable."""
+        human = position.get_turn()
+        if dice is not None:
+            rolls = [roll_key(dice)]
+            per_roll = self.__max_replies
+        else:
+            rolls = list(ALL_ROLLS)
+            per_roll = self.__max_replies_per_roll
+
+        ranked_by_roll = []
+        for roll in rolls:
+            if cancel.is_set():
+                return []
+            replies = legal_plays(position, roll)
+            replies.sort(key=lambda item: evaluate(item[1], human), reverse=True)
+            ranked_by_roll.append([result for _, result in replies[:per_roll]])
+
+        # Primero la mejor respuesta de cada tirada, después la segunda, etc.
+        targets: List[Position] = []
+        seen = set()
+        for rank in range(per_roll):
+            for replies in ranked_by_roll:
+                if rank < len(replies) and replies[rank] not in seen:
+                    seen.add(replies[rank])
+                    targets.append(replies[rank])
+        return targets
+
+    def __run(self, position: Position, dice: Optional[Sequence[int]], cancel: threading.Event) -> None:
+        for target in self.__targets(position, dice, cancel):
+            for roll in ALL_ROLLS:
+                if cancel.is_set():
+                    return
+                key = (target, roll)
+                with self.__lock:
+                    if key in self.__cache:
+                        continue
+                start = time.perf_counter()
+                try:
+                    play = self.__bot.choose_play(target, roll, cancel)
+                except SearchCancelled:
+                    return
+                elapsed = time.perf_counter() - start
+                with self.__lock:
+                    self.__ponder_time += elapsed
+                    self.__store(key, play, elapsed)
+
+    def __store(self, key: Tuple[Position, Tuple[int, int]], play: Play, elapsed: float) -> None:
+        self.__cache[key] = (play, elapsed)
+        if len(self.__cache) > self.__max_entries:
+            self.__cache.popitem(last=False)
+
+    #  Bot
+
+    def lookup(self, position: Position, dice: Sequence[int]) -> Optional[Play]:
+        """Jugada cacheada o None (no cuenta en las métricas)."""
+        with self.__lock:
+            entry = self.__cache.get((position, roll_key(dice)))
+        return entry[0] if entry else None
+
+    def choose_play(self, position, dice, cancel=None) -> Play:
+        """
+        Responde desde el cache si la posición se pensó; si no, busca ahora.
+
+        Corta el pondering en curso para no competir con la búsqueda.
+        """
+        self.stop()
+        key = (position, roll_key(dice))
+        with self.__lock:
+            self.__lookups += 1
+            entry = self.__cache.get(key)
+            if entry is not None:
+                self.__hits += 1
+                self.__time_saved += entry[1]
+                self.__cache.move_to_end(key)
+                return entry[0]
+
+        start = time.perf_counter()
+        play = self.__bot.choose_play(position, dice, cancel)
+        with self.__lock:
+            self.__store(key, play, time.perf_counter() - start)
+        return play
+
+    #  Métricas
+
+    def get_metrics(self) -> Dict[str, float]:
+        """
+        Métricas del cache.
+
+        Returns:
+            lookups, hits, hit_rate (0-1), time_saved_s (tiempo de búsqueda
+            que se evitó gracias al cache), ponder_time_s y entries
+        """
+        with self.__lock:
+            return {
+                "lookups": self.__lookups,
+                "hits": self.__hits,
+                "hit_rate": self.__hits / self.__lookups if self.__lookups else 0.0,
+                "time_saved_s": self.__time_saved,
+                "ponder_time_s": self.__ponder_time,
+                "entries": len(self.__cache),
+            }
+
+    def clear(self) -> None:
+        """Vacía el cache y reinicia las métricas."""
+        self.stop()
+        with self.__lock:
+            self.__cache.clear()
+            self.__lookups = self.__hits = 0
+            self.__time_saved = self.__ponder_time = 0.0
@@ -0,0 +1,371 @@
+from __future__ import annotations
+import base64
+from typing import Any, Dict, List, Optional, Sequence, Tuple
+
+from .checker import Checker
+from .engine import BoardEngine, POSICION_INICIAL
+
+"""
+Foto inmutable de una posición de Backgammon.
+
+Position guarda el tablero en tuplas (hasheable, barata de copiar y de
+mandar a otro hilo o proceso) y es la entrada de la generación de
+movimientos, el bot y el protocolo de motor.
+
+Convenciones:
+- points[p] (p = 1..24) es la cantidad de fichas con signo:
+  positivo = blancas, negativo = negras.
+- Un movimiento es una tupla (origen, destino) con puntos 1-24;
+  origen Checker.BAR (-1) entra desde la barra y destino Checker.OFF (0)
+  saca la ficha del tablero.
+- Una jugada (play) es una tupla de movimientos.
+"""
+
+BLANCO = "blanco"
+NEGRO = "negro"
+COLORES = (BLANCO, NEGRO)
+FICHAS_POR_COLOR = 15
+
+Move = Tuple[int, int]
+Play = Tuple[Move, ...]
+
+
+def opponent(color: str) -> str:
+    """Devuelve el color rival."""
+    return NEGRO if color == BLANCO else BLANCO
+
+
+class Position:
+    """
+    Posición del tablero más el color que tiene el turno.
+
+    Se compara y se hashea por valor, así sirve como clave de caches
+    (pondering, transposiciones, render de espectadores).
+    """
+
+    __slots__ = ("__points", "__bar", "__off", "__turn", "__hash")
+
+    def __init__(
+        self,
+        points: Sequence[int],
+        bar: Tuple[int, int] = (0, 0),
+        off: Tuple[int, int] = (0, 0),
+        turn: str = BLANCO,
+    ) -> None:
+        """
+        Args:
+            points: 25 enteros con signo (índice 0 sin uso)
+            bar: Fichas en la barra (blancas, negras)
+            off: Fichas sacadas (blancas, negras)
+            turn: Color que tiene el turno
+
+        Raises:
+            ValueError: Si los datos no forman una posición válida
+        """
+        if len(points) != 25:
+            raise ValueError("points debe tener 25 elementos (índice 0 sin uso)")
+        if turn not in COLORES:
+            raise ValueError(f"Color inválido: {turn}")
+        self.__points: Tuple[int, ...] = (0,) + tuple(int(n) for n in points[1:])
+        self.__bar: Tuple[int, int] = (int(bar[0]), int(bar[1]))
+        self.__off: Tuple[int, int] = (int(off[0]), int(off[1]))
+        self.__turn: str = turn
+        self.__hash: Optional[int] = None
+
+    #  Constructores
+
+    @classmethod
+    def initial(cls, turn: str = BLANCO) -> "Position":
+        """Posición inicial estándar."""
+        points = [0] * 25
+        for owner, point, count in POSICION_INICIAL:
+            points[point] = count if owner == 0 else -count
+        return cls(points, turn=turn)
+
+    @classmethod
+    def from_board(cls, board: Any, turn: str) -> "Position":
+        """
+        Saca una foto de un tablero (Board, BoardEngine o BoardFacade).
+
+        Args:
+            board: Tablero a copiar
+            turn: Color que tiene el turno
+        """
+        points = [0] * 25
+        for point in range(1, 25):
+            count = board.point_count(point)
+            if count:
+                top = board.get_top_checker(point)
+                points[point] = count if top.get_color() == BLANCO else -count
+        bar = (board.get_bar_count(BLANCO), board.get_bar_count(NEGRO))
+        off = (board.get_off_count(BLANCO), board.get_off_count(NEGRO))
+        return cls(points, bar, off, turn)
+
+    @classmethod
+    def from_game(cls, game: Any) -> "Position":
+        """Saca una foto del tablero de un Game o GameFacade con su turno."""
+        return cls.from_board(game.get_board(), game.get_current_player().get_color())
+
+    #  Getters
+
+    def get_points(self) -> Tuple[int, ...]:
+        """Cantidades con signo por punto (índice 0 sin uso)."""
+        return self.__points
+
+    def get_point(self, point: int) -> int:
+        """Cantidad con signo en un punto (positivo = blancas)."""
+        return self.__points[point]
+
+    def get_bar_count(self, color: str) -> int:
+        """Fichas de un color en la barra."""
+        return self.__bar[0] if color == BLANCO else self.__bar[1]
+
+    def get_off_count(self, color: str) -> int:
+        """Fichas de un color sacadas del tablero."""
+        return self.__off[0] if color == BLANCO else self.__off[1]
+
+    def get_turn(self) -> str:
+        """Color que tiene el turno."""
+        return self.__turn
+
+    def with_turn(self, turn: str) -> "Position":
+        """Misma posición con otro color en turno."""
+        return Position(self.__points, self.__bar, self.__off, turn)
+
+    def key(self) -> Tuple[Any, ...]:
+        """Tupla que identifica la posición (para comparar y hashear)."""
+        return (self.__points, self.__bar, self.__off, self.__turn)
+
+    #  Análisis
+
+    def pip_count(self, color: str) -> int:
+        """Pips que le faltan a un color para sacar todas sus fichas."""
+        points = self.__points
+        if color == BLANCO:
+            total = sum(n * (25 - p) for p, n in enumerate(points) if n > 0)
+        else:
+            total = sum(-n * p for p, n in enumerate(points) if n < 0)
+        return total + 25 * self.get_bar_count(color)
+
+    def has_won(self, color: str) -> bool:
+        """True si el color ya sacó sus 15 fichas."""
+        return self.get_off_count(color) >= FICHAS_POR_COLOR
+
+    #  Vista relativa
+
+    def to_relative(self, color: Optional[str] = None) -> List[int]:
+        """
+        Tablero visto por un color (por defecto el que tiene el turno).
+
+        Devuelve 27 enteros: [0] fichas propias sacadas, [1..24] puntos
+        contados desde el propio bear off (propias positivas, rivales
+        negativas), [25] propias en la barra, [26] rivales en la barra.
+        """
+        color = color or self.__turn
+        points = self.__points
+        rel = [0] * 27
+        if color == BLANCO:
+            for r in range(1, 25):
+                rel[r] = points[25 - r]
+        else:
+            for r in range(1, 25):
+                rel[r] = -points[r]
+        rel[0] = self.get_off_count(color)
+        rel[25] = self.get_bar_count(color)
+        rel[26] = self.get_bar_count(opponent(color))
+        return rel
+
+    @classmethod
+    def from_relative(
+        cls, rel: Sequence[int], color: str, turn: str, rival_off: Optional[int] = None
+    ) -> "Position":
+        """
+        Inversa de to_relative.
+
+        Args:
+            rel: 27 enteros vistos por color
+            color: Color desde el que está visto rel
+            turn: Color que tiene el turno en la posición resultante
+            rival_off: Fichas rivales sacadas (rel no las incluye); por
+                defecto se deducen suponiendo 15 fichas por color
+        """
+        points = [0] * 25
+        if color == BLANCO:
+            for r in range(1, 25):
+                points[25 - r] = rel[r]
+            bar = (rel[25], rel[26])
+        else:
+            for r in range(1, 25):
+                points[r] = -rel[r]
+            bar = (rel[26], rel[25])
+        if rival_off is None:
+            rival_on_board = sum(-n for n in rel[1:25] if n < 0) + rel[26]
+            rival_off = FICHAS_POR_COLOR - rival_on_board
+        off = (rel[0], rival_off) if color == BLANCO else (rival_off, rel[0])
+        return cls(points, bar, off, turn)
+
+    def to_absolute_move(self, r_origin: int, r_dest: int, color: Optional[str] = None) -> Move:
+        """Convierte un movimiento relativo (25 = barra, 0 = afuera) a puntos del tablero."""
+        color = color or self.__turn
+        origin = Checker.BAR if r_origin == 25 else (25 - r_origin if color == BLANCO else r_origin)
+        dest = Checker.OFF if r_dest <= 0 else (25 - r_dest if color == BLANCO else r_dest)
+        return (origin, dest)
+
+    #  Position ID
+
+    def position_id(self) -> str:
+        """
+        Identificador de 14 caracteres al estilo del Position ID de GNU Backgammon.
+
+        Para cada jugador (primero el que tiene el turno) se recorren sus
+        puntos 1-24 y la barra escribiendo un 1 por ficha y un 0 por punto;
+        los 80 bits se empaquetan en 10 bytes y se codifican en base64.
+        Supone 15 fichas por color (las sacadas se deducen).
+        """
+        rel = self.to_relative()
+        mine = [max(n, 0) for n in rel[1:25]] + [rel[25]]
+        theirs = [max(-rel[25 - r], 0) for r in range(1, 25)] + [rel[26]]
+        bits: List[int] = []
+        for counts in (mine, theirs):
+            for count in counts:
+                bits.extend([1] * count)
+                bits.append(0)
+        bits.extend([0] * (80 - len(bits)))
+        data = bytearray(10)
+        for i, bit in enumerate(bits[:80]):
+            if bit:
+                data[i // 8] |= 1 << (i % 8)
+        return base64.b64encode(bytes(data)).decode("ascii").rstrip("=")
+
+    @classmethod
+    def from_position_id(cls, position_id: str, turn: str = BLANCO) -> "Position":
+        """
+        Reconstruye una posición desde su position_id.
+
+        Args:
+            position_id: Identificador de 14 caracteres
+            turn: Color que tiene el turno (el ID no lo incluye)
+
+        Raises:
+            ValueError: Si el identificador es inválido
+        """
+        try:
+            data = base64.b64decode(position_id + "==", validate=True)
+        except (ValueError, TypeError) as e:
+            raise ValueError(f"Position ID inválido: {position_id}") from e
+        if len(data) != 10:
+            raise ValueError(f"Position ID inválido: {position_id}")
+
+        bits = [(data[i // 8] >> (i % 8)) & 1 for i in range(80)]
+        counts: List[int] = []
+        current = 0
+        for bit in bits:
+            if len(counts) == 50:
+                break
+            if bit:
+                current += 1
+            else:
+                counts.append(current)
+                current = 0
+        if len(counts) < 50:
+            counts.extend([0] * (50 - len(counts)))
+        mine, theirs = counts[:25], counts[25:]
+        if sum(mine) > FICHAS_POR_COLOR or sum(theirs) > FICHAS_POR_COLOR:
+            raise ValueError(f"Position ID inválido: {position_id}")
+
+        rel = [0] * 27
+        for r in range(1, 25):
+            if mine[r - 1] and theirs[24 - r]:
+                raise ValueError(f"Position ID inválido: {position_id}")
+            rel[r] = mine[r - 1] - theirs[24 - r]
+        rel[25] = mine[24]
+        rel[26] = theirs[24]
+        rel[0] = FICHAS_POR_COLOR - sum(mine)
+        return cls.from_relative(rel, turn, turn)
+
+    #  Tablero
+
+    def to_board(self, board: Any = None, players: Optional[Dict[str, Any]] = None) -> Any:
+        """
+        Vuelca la posición en un tablero.
+
+        Args:
+            board: Tablero a sobrescribir (por defecto un BoardEngine nuevo)
+            players: Jugador dueño de las fichas por color (opcional)
+
+        Returns:
+            El tablero con la posición cargada
+        """
+        board = board if board is not None else BoardEngine()
+        players = players or {}
+        board.clear()
+        for point in range(1, 25):
+            n = self.__points[point]
+            color = BLANCO if n > 0 else NEGRO
+            for _ in range(abs(n)):
+                board.points[point].append(Checker(players.get(color), color))
+        for color in COLORES:
+            for _ in range(self.get_bar_count(color)):
+                board.capture_checker(Checker(players.get(color), color))
+            for _ in range(self.get_off_count(color)):
+                board.bear_off(color)
+        return board
+
+    #  Protocolo de objeto
+
+    def __eq__(self, other: object) -> bool:
+        if not isinstance(other, Position):
+            return NotImplemented
+        return self.key() == other.key()
+
+    def __hash__(self) -> int:
+        if self.__hash is None:
+            self.__hash = hash(self.key())
+        return self.__hash
+
+    def __getstate__(self) -> Tuple[Any, ...]:
+        return self.key()
+
+    def __setstate__(self, state: Tuple[Any, ...]) -> None:
+        points, bar, off, turn = state
+        self.__points, self.__bar, self.__off, self.__turn = points, bar, off, turn
+        self.__hash = None
+
+    def __repr__(self) -> str:
+        return f"Position(id={self.position_id()!r}, turn={self.__turn!r})"
+
+
+def apply_play_to_board(board: Any, play: Play, color: str) -> None:
+    """
+    Aplica una jugada a un tablero real (Board, BoardEngine o BoardFacade).
+
+    Entra desde la barra, captura fichas solitarias rivales y saca fichas
+    del tablero según corresponda.
+
+    Args:
+        board: Tablero a modificar
+        play: Movimientos (origen, destino) en puntos del tablero
+        color: Color que mueve
+
+    Raises:
+        ValueError: Si un movimiento sale de un punto vacío o de una barra vacía
+    """
+    for origin, dest in play:
+        if origin == Checker.BAR:
+            checker = board.remove_from_bar(color)
+            if checker is None:
+                raise ValueError(f"No hay fichas {color} en la barra")
+        else:
+            stack = board.points[origin]
+            if not stack:
+                raise ValueError(f"No hay fichas en el punto {origin}")
+            checker = stack.pop()
+
+        if dest == Checker.OFF:
+            board.bear_off(color)
+            continue
+
+        target = board.points[dest]
+        if len(target) == 1 and target[0].get_color() != color:
+            board.capture_checker(target.pop())
+        target.append(checker)
@@ -0,0 +1,230 @@
+import time
+
+from backgammon.core.movegen import apply_play
+from backgammon.core.position import Position, opponent
+from backgammon.pygame_ui.layout import MAX_VISIBLE_STACK, MAX_BAR_STACK
+
+"""
+Animación de movimientos por tiempo.
+
+El juego se actualiza al instante (el estado del tablero siempre manda);
+el animador solo guarda, para cada movimiento, una foto de cómo se ve el
+tablero con la ficha "en el aire" y el recorrido de esa ficha. La
+posición de la ficha sale del tiempo transcurrido y no de la cantidad de
+cuadros dibujados: si un cuadro tarda, el siguiente salta adelante.
+"""
+
+
+# Duración de cada tramo a velocidad 1 (en segundos)
+MOVE_SECONDS = 0.22
+HIT_SECONDS = 0.16
+
+BAR = -1
+OFF = 0
+
+
+def _ease(t):
+    """Suavizado (arranca y frena despacio)."""
+    return t * t * (3.0 - 2.0 * t)
+
+
+def _lift(position, where, color):
+    """La misma posición con una ficha de color levantada de where (punto, BAR u OFF)."""
+    points = list(position.get_points())
+    bar = [position.get_bar_count("blanco"), position.get_bar_count("negro")]
+    off = [position.get_off_count("blanco"), position.get_off_count("negro")]
+    side = 0 if color == "blanco" else 1
+    if where == BAR:
+        bar[side] -= 1
+    elif where == OFF:
+        off[side] -= 1
+    else:
+        points[where] -= 1 if color == "blanco" else -1
+    return Position(points, tuple(bar), tuple(off), position.get_turn())
+
+
+class _Step:
+    """Un tramo: la foto a dibujar y el recorrido de una ficha."""
+
+    __slots__ = ("display", "color", "origin", "dest", "start", "duration")
+
+    def __init__(self, display, color, origin, dest, start, duration):
+        self.display = display
+        self.color = color
+        # (lugar, índice en la pila): lugar es un punto, BAR u OFF
+        self.origin = origin
+        self.dest = dest
+        self.start = start
+        self.duration = duration
+
+
+class MoveAnimator:
+    """
+    Cola de tramos animados que se reproducen uno detrás de otro.
+
+    Uso por cuadro:
+        display, overlays = animator.frame(layout)
+        renderer.render_position(display or posicion_real, ..., overlays=overlays)
+    """
+
+    def __init__(self, speed=1.0, clock=time.perf_counter, frame_seconds=1 / 60):
+        """
+        Args:
+            speed: Multiplicador de velocidad (10 = diez veces más rápido)
+            clock: Reloj en segundos (se reemplaza en los tests)
+            frame_seconds: Duración esperada de un cuadro, para contar los salteados
+        """
+        self.__speed = speed
+        self.__clock = clock
+        self.__frame_seconds = frame_seconds
+        self.__steps = []
+        self.__end = 0.0
+        self.__last_frame = None
+        self.__frames = 0
+        self.__dropped = 0
+
+    #  Getters
+
+    def get_speed(self):
+        """Getter del multiplicador de velocidad."""
+        return self.__speed
+
+    def set_speed(self, speed):
+        """Setter del multiplicador de velocidad (afecta a los tramos nuevos)."""
+        self.__speed = speed
+
+    def get_frames(self):
+        """Cuadros de animación dibujados."""
+        return self.__frames
+
+    def get_dropped_frames(self):
+        """Cuadros que se saltearon porque un cuadro tardó más de lo previsto."""
+        return self.__dropped
+
+    def is_active(self, now=None):
+        """True si queda algún tramo por reproducir."""
+        now = self.__clock() if now is None else now
+        return bool(self.__steps) and now < self.__end
+
+    #  Encolar
+
+    def enqueue_move(self, before, after, move, color):
+        """
+        Anima un movimiento ya aplicado al juego.
+
+        Args:
+            before: Position antes del movimiento
+            after: Position después del movimiento
+            move: (origen, destino); origen BAR (-1) o destino OFF (0)
+            color: Color que movió
+        """
+        origin, dest = move
+        rival = opponent(color)
+        hit = after.get_bar_count(rival) > before.get_bar_count(rival)
+
+        display = _lift(before, origin, color)
+        if dest == OFF:
+            landing = (OFF, 0)
+        elif hit:
+            landing = (dest, 0)
+        else:
+            landing = (dest, abs(display.get_point(dest)))
+        self.__push(display, color, (origin, self.__height(display, origin, color)), landing, MOVE_SECONDS)
+
+        if hit:
+            # La ficha capturada vuela a la barra después de que llega la otra
+            display = _lift(after, BAR, rival)
+            self.__push(display, rival, (dest, 0), (BAR, display.get_bar_count(rival)), HIT_SECONDS)
+
+    def enqueue_play(self, before, play):
+        """
+        Anima una jugada completa movimiento por movimiento.
+
+        Args:
+            before: Position antes de la jugada (con el color que mueve en turno)
+            play: Movimientos (origen, destino)
+
+        Returns:
+            False si algún movimiento no se pudo aplicar (no se anima nada)
+        """
+        color = before.get_turn()
+        steps = []
+        position = before
+        for move in play:
+            after = apply_play(position, (move,))
+            if after is None:
+                return False
+            after = after.with_turn(color)
+            steps.append((position, after, move))
+            position = after
+        for position, after, move in steps:
+            self.enqueue_move(position, after, move, color)
+        return True
+
+    def clear(self):
+        """Descarta todo lo pendiente (por ejemplo al deshacer)."""
+        self.__steps = []
+        self.__end = 0.0
+        self.__last_frame = None
+
+    def __height(self, display, where, color):
+        if where == BAR:
+            return display.get_bar_count(color)
+        if where == OFF:
+            return 0
+        return abs(display.get_point(where))
+
+    def __push(self, display, color, origin, dest, seconds):
+        now = self.__clock()
+        start = max(now, self.__end)
+        duration = seconds / self.__speed
+        self.__steps.append(_Step(display, color, origin, dest, start, duration))
+        self.__end = start + duration
+
+    #  Cuadros
+
+    def frame(self, layout, now=None):
+        """
+        Calcula el cuadro actual.
+
+        Args:
+            layout: BoardLayout con la geometría de la ventana
+            now: Tiempo actual (por defecto el reloj del animador)
+
+        Returns:
+            (display, overlays): la Position a dibujar (None si no hay
+            animación y hay que dibujar el juego) y la lista de fichas en el
+            aire como (centro, color)
+        """
+        now = self.__clock() if now is None else now
+        steps = self.__steps
+        while steps and now >= steps[0].start + steps[0].duration:
+            steps.pop(0)
+        if not steps:
+            self.__last_frame = None
+            return None, []
+
+        if self.__last_frame is not None:
+            skipped = round((now - self.__last_frame) / self.__frame_seconds) - 1
+            if skipped > 0:
+                self.__dropped += skipped
+        self.__last_frame = now
+        self.__frames += 1
+
+        step = steps[0]
+        t = _ease(max(0.0, min(1.0, (now - step.start) / step.duration)))
+        x0, y0 = self.__anchor(layout, step.origin, step.color)
+        x1, y1 = self.__anchor(layout, step.dest, step.color)
+        center = (round(x0 + (x1 - x0) * t), round(y0 + (y1 - y0) * t))
+        return step.display, [(center, step.color)]
+
+    @staticmethod
+    def __anchor(layout, spot, color):
+        """Centro en pantalla de una ficha según su lugar y su altura en la pila."""
+        where, index = spot
+        if where == BAR:
+            return layout.bar_slots[color][min(index, MAX_BAR_STACK - 1)]
+        if where == OFF:
+            x, y = layout.off_pos[color]
+            return (x + layout.radius, y + layout.font_size // 2)
+        return layout.slots[where][min(index, MAX_VISIBLE_STACK - 1)]
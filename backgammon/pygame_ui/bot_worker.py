@@ -0,0 +1,100 @@
+import queue
+import threading
+
+import pygame
+
+from backgammon.core.bot import HeuristicBot, SearchCancelled
+
+"""
+Hilo de fondo donde piensa el bot de la interfaz gráfica.
+
+La UI le pasa una foto del juego (Position) y la tirada; el hilo busca la
+jugada y la devuelve como un evento BOT_PLAY en la cola de pygame, así el
+loop principal nunca se bloquea esperando al bot.
+"""
+
+
+# Evento con el resultado del bot: atributos job, play y dice
+BOT_PLAY = pygame.USEREVENT + 2
+
+
+class BotWorker:
+    """
+    Un hilo daemon que atiende pedidos de jugada de a uno.
+
+    Cada pedido tiene un número de trabajo. Pedir una jugada nueva, cancel()
+    o shutdown() cancelan el trabajo en curso; un resultado cancelado nunca
+    se publica, y la UI además descarta resultados de trabajos viejos.
+    """
+
+    def __init__(self, bot=None, post=None):
+        """
+        Args:
+            bot: Bot a usar (por defecto HeuristicBot)
+            post: Función que publica el evento (por defecto pygame.event.post)
+        """
+        self.__bot = bot or HeuristicBot()
+        self.__post = post or pygame.event.post
+        self.__requests = queue.Queue()
+        self.__lock = threading.Lock()
+        self.__job = 0
+        self.__cancel = threading.Event()
+        self.__busy = threading.Event()
+        self.__thread = threading.Thread(target=self.__run, name="backgammon-bot", daemon=True)
+        self.__thread.start()
+
+    def request(self, position, dice):
+        """
+        Pide una jugada para una posición.
+
+        Args:
+            position: Position con el color del bot en turno
+            dice: Tirada a jugar
+
+        Returns:
+            Número de trabajo que va a traer el evento BOT_PLAY
+        """
+        with self.__lock:
+            self.__cancel.set()
+            self.__job += 1
+            job = self.__job
+            self.__cancel = threading.Event()
+            self.__requests.put((job, position, tuple(dice), self.__cancel))
+        return job
+
+    def cancel(self):
+        """Cancela el trabajo en curso (si hay) sin publicar su resultado."""
+        with self.__lock:
+            self.__cancel.set()
+
+    def is_busy(self):
+        """True mientras el bot está buscando."""
+        return self.__busy.is_set()
+
+    def get_current_job(self):
+        """Número del último trabajo pedido."""
+        return self.__job
+
+    def shutdown(self, timeout=1.0):
+        """Cancela lo pendiente y termina el hilo."""
+        self.cancel()
+        self.__requests.put(None)
+        self.__thread.join(timeout)
+
+    def __run(self):
+        while True:
+            item = self.__requests.get()
+            if item is None:
+                return
+            job, position, dice, cancel = item
+            if cancel.is_set():
+                continue
+            self.__busy.set()
+            try:
+                play = self.__bot.choose_play(position, dice, cancel)
+            except SearchCancelled:
+                continue
+            finally:
+                self.__busy.clear()
+            if not cancel.is_set():
+                self.__post(pygame.event.Event(BOT_PLAY, job=job, play=play, dice=dice))
@@ -0,0 +1,95 @@
+import time
+
+"""
+Métricas de la UI: tiempo por cuadro y uso de CPU del proceso.
+
+No depende de pygame, así se puede usar desde benchmarks y tests.
+"""
+
+
+class FrameStats:
+    """
+    Acumula tiempos de cuadro, despertares del loop y CPU consumida.
+
+    El uso de CPU es tiempo de CPU del proceso (time.process_time)
+    dividido por el tiempo de reloj entre start y stop: un loop ocioso
+    bien hecho debería quedar cerca de 0%.
+    """
+
+    def __init__(self):
+        self.__frame_times = []
+        self.__wakeups = 0
+        self.__wall_start = None
+        self.__cpu_start = None
+        self.__wall_elapsed = 0.0
+        self.__cpu_elapsed = 0.0
+
+    def start(self):
+        """Empieza a medir tiempo de reloj y de CPU."""
+        self.__wall_start = time.perf_counter()
+        self.__cpu_start = time.process_time()
+
+    def stop(self):
+        """Termina la medición (se puede volver a llamar start después)."""
+        if self.__wall_start is None:
+            return
+        self.__wall_elapsed += time.perf_counter() - self.__wall_start
+        self.__cpu_elapsed += time.process_time() - self.__cpu_start
+        self.__wall_start = None
+        self.__cpu_start = None
+
+    def record_frame(self, seconds):
+        """Registra la duración de un cuadro dibujado."""
+        self.__frame_times.append(seconds)
+
+    def record_wakeup(self):
+        """Registra una vuelta del loop (haya dibujado o no)."""
+        self.__wakeups += 1
+
+    #  Getters
+
+    def get_frames(self):
+        """Cantidad de cuadros dibujados."""
+        return len(self.__frame_times)
+
+    def get_wakeups(self):
+        """Cantidad de vueltas del loop."""
+        return self.__wakeups
+
+    def get_wall_time(self):
+        """Segundos de reloj medidos."""
+        return self.__wall_elapsed
+
+    def get_cpu_time(self):
+        """Segundos de CPU del proceso medidos."""
+        return self.__cpu_elapsed
+
+    def get_cpu_percent(self):
+        """Porcentaje de un core usado durante la medición."""
+        if self.__wall_elapsed <= 0:
+            return 0.0
+        return 100.0 * self.__cpu_elapsed / self.__wall_elapsed
+
+    def get_frame_ms(self, percentile=50):
+        """
+        Percentil del tiempo de cuadro en milisegundos.
+
+        Args:
+            percentile: 0-100 (50 = mediana)
+
+        Returns:
+            Tiempo en ms o 0.0 si no se dibujó ningún cuadro
+        """
+        if not self.__frame_times:
+            return 0.0
+        ordered = sorted(self.__frame_times)
+        index = min(len(ordered) - 1, int(len(ordered) * percentile / 100))
+        return ordered[index] * 1000
+
+    def summary(self):
+        """Resumen de una línea para imprimir al salir."""
+        return (
+            f"cuadros={self.get_frames()} despertares={self.get_wakeups()} "
+            f"cuadro_p50={self.get_frame_ms(50):.2f}ms cuadro_p95={self.get_frame_ms(95):.2f}ms "
+            f"cpu={self.get_cpu_percent():.1f}% en {self.get_wall_time():.1f}s"
+        )
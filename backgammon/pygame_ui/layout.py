@@ -0,0 +1,203 @@
+import pygame
+
+"""
+Geometría precalculada de la ventana.
+
+BoardLayout calcula una sola vez por tamaño de ventana todo lo que el
+renderer y el manejo de clicks necesitan: rectángulos, polígonos de los
+triángulos, centros de cada ficha de cada pila, posiciones de etiquetas
+y una tabla para resolver clicks en O(1). Solo se vuelve a construir
+cuando cambia el tamaño de la ventana.
+"""
+
+
+# Tamaño de referencia: todo se escala a partir de estas medidas
+WIDTH, HEIGHT = 1300, 700
+MARGIN_X, MARGIN_Y = 60, 40
+PANEL_WIDTH = 220
+
+MAX_VISIBLE_STACK = 5
+TRIANGLE_HEIGHT = 0.42
+MAX_BAR_STACK = 3
+
+BUTTON = "button"
+
+
+def point_index_to_display(point):
+    """
+    Convierte punto 1-24 (backgammon) a:
+    - row: 'top' o 'bottom'
+    - col_vis: 0-11 (columna visual)
+
+    Layout:
+    Top:    13 14 15 16 17 18 | BAR | 19 20 21 22 23 24
+    Bottom: 12 11 10  9  8  7 | BAR |  6  5  4  3  2  1
+    """
+    if 13 <= point <= 24:
+        return 'top', point - 13
+    return 'bottom', 12 - point
+
+
+class BoardLayout:
+    """
+    Medidas de la ventana para un tamaño dado.
+
+    Atributos públicos (solo lectura):
+    - size, scale: tamaño de la ventana y escala respecto de 1300x700
+    - board_rect, tri_width, radius, step: tablero y fichas
+    - triangles[p]: polígono del punto p
+    - slots[p]: centros de las fichas visibles del punto p (base primero)
+    - labels[p]: centro de la etiqueta del punto p
+    - bar_slots[color], off_pos[color]: barra y contadores de bear off
+    - button_rect, instructions_pos, message_pos: panel y textos
+    - regions: rectángulos que el renderer redibuja por separado
+    - font_size, small_font_size: tamaños de letra escalados
+    """
+
+    def __init__(self, size=(WIDTH, HEIGHT)):
+        width, height = int(size[0]), int(size[1])
+        sx, sy = width / WIDTH, height / HEIGHT
+        scale = min(sx, sy)
+        self.size = (width, height)
+        self.scale = scale
+
+        board_rect = pygame.Rect(
+            round(MARGIN_X * sx),
+            round((MARGIN_Y + 30) * sy),
+            round(width - (2 * MARGIN_X + PANEL_WIDTH) * sx),
+            round(height - (2 * MARGIN_Y + 60) * sy),
+        )
+        self.board_rect = board_rect
+        tri_width = board_rect.width / 12.0
+        self.tri_width = tri_width
+        self.radius = max(3, min(int(tri_width * 0.38), int(24 * scale)))
+        self.step = self.radius * 2 + max(1, round(3 * scale))
+        self.font_size = max(8, round(20 * scale))
+        self.small_font_size = max(8, round(18 * scale))
+
+        self.__build_points()
+        self.__build_panel(sx, sy)
+        self.__build_regions()
+        self.__build_hit_tables()
+
+    #  Construcción
+
+    def __build_points(self):
+        board_rect = self.board_rect
+        tri_width = self.tri_width
+        radius = self.radius
+        tri_h = board_rect.height * TRIANGLE_HEIGHT
+        pad = max(2, round(8 * self.scale))
+        label_gap = max(6, round(14 * self.scale))
+
+        self.triangles = {}
+        self.slots = {}
+        self.labels = {}
+        for point in range(1, 25):
+            row, col_vis = point_index_to_display(point)
+            x0 = board_rect.left + col_vis * tri_width
+            x1 = x0 + tri_width
+            cx = int(x0 + tri_width / 2)
+            if row == 'top':
+                self.triangles[point] = [(x0, board_rect.top), (x1, board_rect.top), ((x0 + x1) / 2, board_rect.top + tri_h)]
+                base = int(board_rect.top + radius + pad)
+                self.slots[point] = [(cx, base + i * self.step) for i in range(MAX_VISIBLE_STACK)]
+                self.labels[point] = (cx, board_rect.top - label_gap)
+            else:
+                self.triangles[point] = [(x0, board_rect.bottom), (x1, board_rect.bottom), ((x0 + x1) / 2, board_rect.bottom - tri_h)]
+                base = int(board_rect.bottom - radius - pad)
+                self.slots[point] = [(cx, base - i * self.step) for i in range(MAX_VISIBLE_STACK)]
+                self.labels[point] = (cx, board_rect.bottom + label_gap)
+
+    def __build_panel(self, sx, sy):
+        board_rect = self.board_rect
+        mid_y = board_rect.centery
+        width, height = self.size
+        bar_x = board_rect.right + round(30 * sx)
+        bar_offset = round(60 * sy)
+        bar_step = self.radius * 2 + 2
+        self.bar_x = bar_x
+        self.bar_slots = {
+            "blanco": [(bar_x, mid_y - bar_offset + i * bar_step) for i in range(MAX_BAR_STACK)],
+            "negro": [(bar_x, mid_y + bar_offset - i * bar_step) for i in range(MAX_BAR_STACK)],
+        }
+        info_x = board_rect.right + round(80 * sx)
+        self.off_pos = {
+            "blanco": (info_x, board_rect.top + round(20 * sy)),
+            "negro": (info_x, board_rect.bottom - round(40 * sy)),
+        }
+        panel_x = width - round(200 * sx)
+        self.panel_x = panel_x
+        self.turn_pos = (panel_x, round(150 * sy))
+        self.turn_name_pos = (panel_x, round(175 * sy))
+        self.button_rect = pygame.Rect(panel_x, round(210 * sy), round(140 * sx), round(45 * sy))
+        self.dice_origin = (panel_x, round(270 * sy))
+        self.dice_size = max(8, round(35 * self.scale))
+        self.dice_spacing = max(10, round(45 * self.scale))
+        self.instructions_pos = (round(MARGIN_X * sx), round(15 * sy))
+        self.message_pos = (round(MARGIN_X * sx), height - round(35 * sy))
+
+    def __build_regions(self):
+        board_rect = self.board_rect
+        mid_y = board_rect.centery
+        width, height = self.size
+        radius = self.radius
+        regions = {}
+
+        # Cada punto ocupa su media columna, sin pisar la línea central
+        for point in range(1, 25):
+            row, col_vis = point_index_to_display(point)
+            x0 = int(board_rect.left + col_vis * self.tri_width)
+            x1 = int(board_rect.left + (col_vis + 1) * self.tri_width)
+            if row == 'top':
+                regions[f"point_{point}"] = pygame.Rect(x0, board_rect.top + 2, x1 - x0, mid_y - 1 - board_rect.top - 2)
+            else:
+                regions[f"point_{point}"] = pygame.Rect(x0, mid_y + 2, x1 - x0, board_rect.bottom - 2 - mid_y - 2)
+
+        top = self.bar_slots["blanco"][0][1] - radius - 2
+        bottom = self.bar_slots["negro"][0][1] + radius + 2
+        regions["bar"] = pygame.Rect(self.bar_x - radius - 2, top, 2 * radius + 4, bottom - top)
+        off_x = self.off_pos["blanco"][0]
+        regions["off"] = pygame.Rect(off_x, self.off_pos["blanco"][1], self.panel_x - off_x - 2,
+                                     self.off_pos["negro"][1] - self.off_pos["blanco"][1] + self.font_size + 4)
+        regions["info"] = pygame.Rect(self.panel_x, self.turn_pos[1], width - self.panel_x, self.button_rect.top - self.turn_pos[1])
+        regions["dice"] = pygame.Rect(self.panel_x, self.dice_origin[1], width - self.panel_x, self.dice_size + 5)
+        message_top = self.message_pos[1] - 5
+        regions["message"] = pygame.Rect(0, message_top, width, height - message_top)
+        self.regions = regions
+
+    def __build_hit_tables(self):
+        """Tablas por eje: columna de cada x y fila de cada y del tablero."""
+        board_rect = self.board_rect
+        width, height = self.size
+        self.__col_of_x = [-1] * (width + 1)
+        for x in range(max(0, board_rect.left), min(width, board_rect.right) + 1):
+            self.__col_of_x[x] = min(int((x - board_rect.left) / self.tri_width), 11)
+        # 0 = fila de arriba (13-24), 1 = fila de abajo (12-1), -1 = afuera
+        self.__row_of_y = [-1] * (height + 1)
+        for y in range(max(0, board_rect.top), min(height, board_rect.bottom) + 1):
+            self.__row_of_y[y] = 0 if y < board_rect.centery else 1
+
+    #  Clicks
+
+    def hit_test(self, pos):
+        """
+        Resuelve un click en O(1).
+
+        Returns:
+            Punto 1-24, BUTTON si cae en el botón de dados, o None
+        """
+        x, y = int(pos[0]), int(pos[1])
+        if self.button_rect.collidepoint(x, y):
+            return BUTTON
+        if not (0 <= x < len(self.__col_of_x) and 0 <= y < len(self.__row_of_y)):
+            return None
+        col, row = self.__col_of_x[x], self.__row_of_y[y]
+        if col < 0 or row < 0:
+            return None
+        return 13 + col if row == 0 else 12 - col
+
+    def point_at(self, pos):
+        """Punto 1-24 bajo una posición o None."""
+        target = self.hit_test(pos)
+        return None if target is None or target == BUTTON else target
@@ -1,4 +1,5 @@
 import sys
+import time
 import pygame
 
 # SOLID: Usa las clases refactorizadas
@@ -7,6 +8,8 @@ from backgammon.core.board_refactored import BoardWithSetupFacade as BoardWithSe
 from backgammon.core.player_refactored import PlayerFacade as Player
 
 from backgammon.core.dice import Dice
+from backgammon.core.position import Position, apply_play_to_board
+from backgammon.core.ponder import PonderService
 
 
 """
@@ -16,408 +19,435 @@ VERSIÓN FINAL con colores y layout correctos
 
 
 
-#Config visual 
+# La parte visual (colores, layout y dibujo) vive en renderer.py
+from backgammon.pygame_ui.renderer import BoardRenderer, WIDTH, HEIGHT
+from backgammon.pygame_ui.layout import BUTTON
+from backgammon.pygame_ui.frame_stats import FrameStats
+from backgammon.pygame_ui.bot_worker import BotWorker, BOT_PLAY
+from backgammon.pygame_ui.animation import MoveAnimator
 
-WIDTH, HEIGHT = 1300, 700  # MÁS ANCHO
-MARGIN_X, MARGIN_Y = 60, 40  # MÁS MARGEN
-BG_COLOR = (245, 239, 230)
-BOARD_COLOR = (230, 220, 200)
-TRI_A = (170, 120, 90)
-TRI_B = (210, 170, 130)
-LINE_COLOR = (60, 60, 60)
-WHITE = (245, 245, 245)
-BLACK = (30, 30, 30)
-RED = (200, 20, 20)
-TEXT_COLOR = (25, 25, 25)
 
-MAX_VISIBLE_STACK = 5
+# Evento propio: otro hilo (o un timer) avisa que el estado del juego cambió
+STATE_CHANGED = pygame.USEREVENT + 1
 
+# Timeout de pygame.event.wait mientras hay una animación en curso (~60 FPS)
+ANIMATION_FRAME_MS = 16
 
-def point_index_to_display(point):
+
+class BackgammonUI:
     """
-    Convierte punto 1-24 (backgammon) a:
-    - row: 'top' o 'bottom'  
-    - col_vis: 0-11 (columna visual)
-    
-    Layout:
-    Top:    13 14 15 16 17 18 | BAR | 19 20 21 22 23 24
-    Bottom: 12 11 10  9  8  7 | BAR |  6  5  4  3  2  1
+    Estado de la interfaz y manejo de eventos.
+
+    El flag dirty se levanta solo cuando cambia algo visible: el juego
+    (dados, movimientos, turno), la selección o el mensaje. El loop
+    event-driven duerme en pygame.event.wait mientras dirty esté abajo.
+
+    Con bot_color, ese color lo juega la computadora en un BotWorker: la
+    jugada llega como evento BOT_PLAY y la UI sigue dibujando mientras tanto.
+    Durante el turno humano un PonderService va pensando las respuestas.
+
+    Los movimientos se aplican al juego al instante y un MoveAnimator los
+    muestra deslizando la ficha; mientras dura la animación el loop se
+    despierta cada ANIMATION_FRAME_MS.
     """
-    if 13 <= point <= 24:
-        col_vis = point - 13
-        return 'top', col_vis
-    else:
-        col_vis = 12 - point
-        return 'bottom', col_vis
-
-
-def draw_triangle(surface, board_rect, col_vis, row, color):
-    """Dibuja un triángulo LARGO (42% de altura)"""
-    tri_width = board_rect.width / 12.0
-    x0 = board_rect.left + col_vis * tri_width
-    x1 = x0 + tri_width
-    x_mid = (x0 + x1) / 2.0
-    
-    if row == 'top':
-        tip_y = board_rect.top + board_rect.height * 0.42
-        pts = [(x0, board_rect.top), (x1, board_rect.top), (x_mid, tip_y)]
-    else:
-        tip_y = board_rect.bottom - board_rect.height * 0.42
-        pts = [(x0, board_rect.bottom), (x1, board_rect.bottom), (x_mid, tip_y)]
-    
-    pygame.draw.polygon(surface, color, pts)
-    pygame.draw.polygon(surface, LINE_COLOR, pts, 1)
-
-
-def draw_checker(surface, center, color_name, radius, label=None, font=None):
-    """Dibuja una ficha con el color correcto"""
-    if color_name == "blanco":
-        checker_color = WHITE
-        text_color = LINE_COLOR
-    else:  # "negro"
-        checker_color = RED
-        text_color = WHITE
-    
-    pygame.draw.circle(surface, checker_color, (int(center[0]), int(center[1])), radius)
-    pygame.draw.circle(surface, LINE_COLOR, (int(center[0]), int(center[1])), radius, 2)
-    
-    if label and font:
-        txt = font.render(str(label), True, text_color)
-        rect = txt.get_rect(center=(int(center[0]), int(center[1])))
-        surface.blit(txt, rect)
-
-
-def render_board(surface, game, font):
-    """Dibuja el tablero y devuelve hitmap"""
-    surface.fill(BG_COLOR)
-    
-    # Marco del tablero - MÁS ESPACIO
-    board_rect = pygame.Rect(
-        MARGIN_X,
-        MARGIN_Y + 30,
-        WIDTH - 2 * MARGIN_X - 220,
-        HEIGHT - 2 * MARGIN_Y - 60
-    )
-    pygame.draw.rect(surface, BOARD_COLOR, board_rect, border_radius=12)
-    pygame.draw.rect(surface, LINE_COLOR, board_rect, 2, border_radius=12)
-    
-    # Dibujar 24 triángulos
-    for col_vis in range(12):
-        color_top = TRI_A if col_vis % 2 == 0 else TRI_B
-        draw_triangle(surface, board_rect, col_vis, 'top', color_top)
-        
-        color_bottom = TRI_B if col_vis % 2 == 0 else TRI_A
-        draw_triangle(surface, board_rect, col_vis, 'bottom', color_bottom)
-    
-    # Línea divisoria central
-    mid_y = board_rect.centery
-    pygame.draw.line(surface, LINE_COLOR, 
-                     (board_rect.left, mid_y), 
-                     (board_rect.right, mid_y), 2)
-    
-    # Parámetros para fichas
-    tri_width = board_rect.width / 12.0
-    radius = int(tri_width * 0.38)
-    radius = max(14, min(radius, 24))
-    vgap = 3
-    step = radius * 2 + vgap
-    
-    # Etiquetas de puntos - Top: 13-24
-    for col_vis in range(12):
-        point_num = 13 + col_vis
-        x = int(board_rect.left + col_vis * tri_width + tri_width / 2)
-        y = board_rect.top - 14
-        img = font.render(str(point_num), True, TEXT_COLOR)
-        rect = img.get_rect(center=(x, y))
-        surface.blit(img, rect)
-    
-    # Etiquetas de puntos - Bottom: 12-1
-    for col_vis in range(12):
-        point_num = 12 - col_vis
-        x = int(board_rect.left + col_vis * tri_width + tri_width / 2)
-        y = board_rect.bottom + 14
-        img = font.render(str(point_num), True, TEXT_COLOR)
-        rect = img.get_rect(center=(x, y))
-        surface.blit(img, rect)
-    
-    # Hitmap para clicks
-    hitmap = {i: [] for i in range(1, 25)}
-    
-    # Dibujar fichas del tablero
-    board = game.get_board()
-    
-    for point in range(1, 25):
-        count = board.point_count(point)
-        if count == 0:
-            continue
-        
-        top_checker = board.get_top_checker(point)
-        if not top_checker:
-            continue
-        
-        color = top_checker.get_color()
-        row, col_vis = point_index_to_display(point)
-        cx = int(board_rect.left + col_vis * tri_width + tri_width / 2)
-        
-        visibles = min(count, MAX_VISIBLE_STACK)
-        extras = max(0, count - (MAX_VISIBLE_STACK - 1)) if count > MAX_VISIBLE_STACK else 0
-        
-        if row == 'top':
-            start_y = int(board_rect.top + radius + 8)
-            for i in range(visibles):
-                cy = start_y + i * step
-                label = extras if (extras and i == visibles - 1) else None
-                draw_checker(surface, (cx, cy), color, radius, label, font)
-                hitmap[point].append((cx, cy, radius))
+
+    def __init__(self, screen, game, bot_color=None, worker=None, animation_speed=1.0):
+        self.__screen = screen
+        self.__game = game
+        self.__bot_color = bot_color
+        self.__ponder = None
+        if worker is None and bot_color is not None:
+            self.__ponder = PonderService()
+            worker = BotWorker(bot=self.__ponder)
+        self.__worker = worker
+        self.__bot_job = None
+        self.__turn_start = None
+        self.__renderer = BoardRenderer(screen)
+        self.__stats = FrameStats()
+        self.__animator = MoveAnimator(speed=animation_speed, frame_seconds=ANIMATION_FRAME_MS / 1000)
+        self.__animating = False
+        self.dirty = True
+        self.running = True
+
+        self.dice_values = []
+        self.available_moves = []
+        self.selected_point = None
+        self.message = "Presioná ESPACIO o 'Roll Dice' para empezar"
+
+    #  Getters
+
+    def get_game(self):
+        """Getter del juego."""
+        return self.__game
+
+    def get_renderer(self):
+        """Getter del renderer."""
+        return self.__renderer
+
+    def get_stats(self):
+        """Getter de las métricas de cuadros y CPU."""
+        return self.__stats
+
+    def is_animating(self):
+        """True si hay una animación en curso (el loop no debe dormir)."""
+        return self.__animating
+
+    def get_animator(self):
+        """Getter del animador de movimientos."""
+        return self.__animator
+
+    def set_animating(self, animating):
+        """Marca el inicio o el fin de una animación."""
+        self.__animating = animating
+        self.dirty = True
+
+    def get_worker(self):
+        """Getter del hilo del bot (None si no hay bot)."""
+        return self.__worker
+
+    def get_ponder(self):
+        """Getter del servicio de pondering (None si no hay bot propio)."""
+        return self.__ponder
+
+    def is_bot_turn(self):
+        """True si el turno actual lo juega la computadora."""
+        return self.__bot_color is not None and \
+            self.__game.get_current_player().get_color() == self.__bot_color
+
+    def is_bot_thinking(self):
+        """True si hay un pedido al bot sin respuesta."""
+        return self.__bot_job is not None
+
+    #  Eventos
+
+    def handle_event(self, event):
+        """
+        Procesa un evento de pygame.
+
+        Args:
+            event: Evento recibido
+        """
+        if event.type == pygame.QUIT:
+            self.running = False
+
+        elif event.type == STATE_CHANGED:
+            self.dirty = True
+
+        elif event.type == BOT_PLAY:
+            self.apply_bot_play(event.job, event.play)
+
+        elif event.type == pygame.VIDEORESIZE:
+            self.resize(event.size)
+
+        elif event.type == pygame.VIDEOEXPOSE:
+            self.__renderer.invalidate()
+            self.dirty = True
+
+        elif self.is_bot_turn():
+            # Mientras piensa la computadora solo se puede salir o deshacer
+            if event.type == pygame.KEYDOWN and event.key in (pygame.K_ESCAPE, pygame.K_q):
+                self.running = False
+            elif event.type == pygame.KEYDOWN and event.key == pygame.K_u:
+                self.undo()
+
+        elif event.type == pygame.KEYDOWN:
+            if event.key in (pygame.K_ESCAPE, pygame.K_q):
+                self.running = False
+            elif event.key == pygame.K_SPACE:
+                if not self.dice_values:
+                    self.roll()
+            elif event.key == pygame.K_u:
+                self.undo()
+
+        elif event.type == pygame.MOUSEBUTTONDOWN and event.button == 1:
+            target = self.__renderer.get_layout().hit_test(event.pos)
+            if target == BUTTON:
+                if not self.dice_values:
+                    self.roll()
+                else:
+                    self.set_message("Terminá de mover primero")
+            elif target is not None and self.dice_values:
+                self.click_point(target)
+
+    def resize(self, size):
+        """
+        Adapta la interfaz a un nuevo tamaño de ventana.
+
+        Args:
+            size: (ancho, alto) nuevo
+        """
+        screen = pygame.display.get_surface()
+        if screen is None or screen.get_size() != tuple(size):
+            screen = pygame.display.set_mode(size, pygame.RESIZABLE)
+        self.__renderer.set_surface(screen)
+        self.dirty = True
+
+    def set_message(self, message):
+        """Cambia el mensaje inferior."""
+        if message != self.message:
+            self.message = message
+            self.dirty = True
+
+    def roll(self):
+        """Tira los dados del turno actual."""
+        if self.__bot_color is not None:
+            # Foto del comienzo del turno humano para poder deshacer
+            self.__turn_start = (Position.from_game(self.__game), self.__game.get_current_index())
+        self.dice_values = self.__game.roll()
+        self.available_moves = self.dice_values.copy()
+        self.selected_point = None
+        self.message = f"Dados: {self.dice_values}. Click en triángulo con tu ficha"
+        self.dirty = True
+        if self.__turn_start is not None:
+            # Con la tirada conocida el pondering se enfoca en sus jugadas
+            self.start_pondering(self.__turn_start[0], self.dice_values)
+
+    def point_at(self, pos):
+        """
+        Convierte una posición del mouse en un punto del tablero.
+
+        Returns:
+            Punto 1-24 o None si el click quedó fuera del tablero
+        """
+        return self.__renderer.get_layout().point_at(pos)
+
+    def click_point(self, clicked_point):
+        """Selecciona una ficha o mueve la ficha seleccionada."""
+        game = self.__game
+        current_player = game.get_current_player()
+        board_obj = game.get_board()
+        self.dirty = True
+
+        if self.selected_point is None:
+            # SELECCIONAR FICHA
+            if board_obj.point_count(clicked_point) > 0:
+                top = board_obj.get_top_checker(clicked_point)
+                if top and top.get_color() == current_player.get_color():
+                    self.selected_point = clicked_point
+                    self.message = f"Punto {clicked_point} seleccionado. Click en destino."
+                else:
+                    self.message = "Esa no es tu ficha"
+            else:
+                self.message = "Punto vacío - seleccioná uno con tu ficha"
+            return
+
+        # MOVER FICHA
+        selected_point = self.selected_point
+        self.selected_point = None
+        if current_player.get_color() == "blanco":
+            distance = clicked_point - selected_point
         else:
-            start_y = int(board_rect.bottom - radius - 8)
-            for i in range(visibles):
-                cy = start_y - i * step
-                label = extras if (extras and i == visibles - 1) else None
-                draw_checker(surface, (cx, cy), color, radius, label, font)
-                hitmap[point].append((cx, cy, radius))
-    
-    # Dibujar barra
-    bar_x = board_rect.right + 30
-    
-    white_bar = board.get_bar_count("blanco")
-    if white_bar > 0:
-        for i in range(min(white_bar, 3)):
-            cy = mid_y - 60 + i * (radius * 2 + 2)
-            label = white_bar if i == 2 and white_bar > 3 else None
-            draw_checker(surface, (bar_x, cy), "blanco", radius, label, font)
-    
-    black_bar = board.get_bar_count("negro")
-    if black_bar > 0:
-        for i in range(min(black_bar, 3)):
-            cy = mid_y + 60 - i * (radius * 2 + 2)
-            label = black_bar if i == 2 and black_bar > 3 else None
-            draw_checker(surface, (bar_x, cy), "negro", radius, label, font)
-    
-    # Bear off
-    info_x = board_rect.right + 80
-    
-    white_off = board.get_off_count("blanco")
-    off_text = font.render(f"White: {white_off}", True, TEXT_COLOR)
-    surface.blit(off_text, (info_x, board_rect.top + 20))
-    
-    black_off = board.get_off_count("negro")
-    off_text = font.render(f"Black: {black_off}", True, TEXT_COLOR)
-    surface.blit(off_text, (info_x, board_rect.bottom - 40))
-    
-    return hitmap, board_rect
-
-
-def draw_dice(surface, dice_values, x, y, font):
-    """Dibuja los dados"""
-    if not dice_values:
-        return
-    
-    dice_size = 35
-    spacing = 45
-    
-    for i, value in enumerate(dice_values):
-        dice_x = x + i * spacing
-        dice_rect = pygame.Rect(dice_x, y, dice_size, dice_size)
-        
-        pygame.draw.rect(surface, WHITE, dice_rect, border_radius=5)
-        pygame.draw.rect(surface, LINE_COLOR, dice_rect, 2, border_radius=5)
-        
-        text = font.render(str(value), True, LINE_COLOR)
-        text_rect = text.get_rect(center=dice_rect.center)
-        surface.blit(text, text_rect)
-
-
-def draw_game_info(surface, game, font, dice_values, message):
-    """Dibuja info del juego"""
-    info_x = WIDTH - 200
-    info_y = 150
-    
-    current = game.get_current_player()
-    color_name = "Blancas" if current.get_color() == "blanco" else "Negras"
-    text = font.render(f"Turno:", True, TEXT_COLOR)
-    surface.blit(text, (info_x, info_y))
-    
-    text2 = font.render(color_name, True, TEXT_COLOR)
-    surface.blit(text2, (info_x, info_y + 25))
-    
-    # Botón Roll Dice
-    button_rect = pygame.Rect(info_x, info_y + 60, 140, 45)
-    pygame.draw.rect(surface, TRI_A, button_rect, border_radius=8)
-    pygame.draw.rect(surface, LINE_COLOR, button_rect, 2, border_radius=8)
-    
-    btn_text = font.render("Roll Dice", True, TEXT_COLOR)
-    btn_rect = btn_text.get_rect(center=button_rect.center)
-    surface.blit(btn_text, btn_rect)
-    
-    # Dados
-    if dice_values:
-        draw_dice(surface, dice_values, info_x, info_y + 120, font)
-    
-    # Mensaje
-    if message:
-        msg_font = pygame.font.SysFont(None, 18)
-        msg_text = msg_font.render(message, True, TEXT_COLOR)
-        surface.blit(msg_text, (MARGIN_X, HEIGHT - 35))
-    
-    return button_rect
-
-
-def main():
-    """Main loop"""
-    pygame.init()
-    pygame.display.set_caption("Backgammon (Pygame)")
-    screen = pygame.display.set_mode((WIDTH, HEIGHT))
-    clock = pygame.time.Clock()
-    font = pygame.font.SysFont(None, 20)
-    
-    # Crear juego
+            distance = selected_point - clicked_point
+
+        if distance not in self.available_moves:
+            destinos = []
+            for d in self.available_moves:
+                if current_player.get_color() == "blanco":
+                    destinos.append(f"{selected_point + d}")
+                else:
+                    destinos.append(f"{selected_point - d}")
+            self.message = f"Destinos válidos: {', '.join(destinos)}"
+            return
+
+        if not game.is_valid_move(selected_point, clicked_point, distance):
+            self.message = "Movimiento bloqueado (2+ fichas enemigas)"
+            return
+
+        before = Position.from_game(game)
+        try:
+            board_obj.mover_ficha(selected_point, clicked_point)
+        except Exception as e:
+            self.message = f"Error: {str(e)}"
+            return
+        self.__animator.enqueue_move(before, Position.from_game(game), (selected_point, clicked_point),
+                                     current_player.get_color())
+        self.set_animating(True)
+
+        self.available_moves.remove(distance)
+        self.message = f"✓ Moviste {selected_point} → {clicked_point}"
+        if not self.available_moves:
+            game.next_turn()
+            self.dice_values = []
+            self.message = f"Turno de {game.get_current_player().get_nombre()}. Presiona ESPACIO"
+            self.start_bot_turn()
+
+    #  Bot
+
+    def start_pondering(self, position=None, dice=None):
+        """Empieza a pensar las respuestas del bot durante el turno humano."""
+        if self.__ponder is None or self.is_bot_turn():
+            return
+        self.__ponder.start(position or Position.from_game(self.__game), dice)
+
+    def start_bot_turn(self):
+        """Si le toca a la computadora, tira y le pide la jugada al hilo del bot."""
+        if not self.is_bot_turn():
+            self.start_pondering()
+            return
+        if self.__bot_job is not None:
+            return
+        game = self.__game
+        self.dice_values = game.roll()
+        self.available_moves = self.dice_values.copy()
+        self.selected_point = None
+        self.__bot_job = self.__worker.request(Position.from_game(game), self.dice_values)
+        self.message = f"La computadora piensa (dados {self.dice_values})..."
+        self.dirty = True
+
+    def apply_bot_play(self, job, play):
+        """
+        Aplica la jugada que mandó el hilo del bot.
+
+        Los resultados de pedidos viejos (cancelados por deshacer o por un
+        pedido nuevo) se descartan.
+        """
+        if job != self.__bot_job:
+            return
+        self.__bot_job = None
+        game = self.__game
+        before = Position.from_game(game)
+        apply_play_to_board(game.get_board(), play, self.__bot_color)
+        if self.__animator.enqueue_play(before, play):
+            self.set_animating(True)
+        jugada = " ".join(f"{'bar' if o < 0 else o}/{'off' if d == 0 else d}" for o, d in play) or "nada"
+        game.next_turn()
+        self.dice_values = []
+        self.available_moves = []
+        self.message = f"La computadora jugó {jugada}. Turno de {game.get_current_player().get_nombre()}. Presiona ESPACIO"
+        self.dirty = True
+        self.start_pondering()
+
+    def undo(self):
+        """Vuelve al comienzo del último turno humano y cancela al bot."""
+        if self.__turn_start is None:
+            return
+        if self.__worker is not None:
+            self.__worker.cancel()
+        self.__bot_job = None
+        self.__animator.clear()
+        self.__animating = False
+        position, index = self.__turn_start
+        self.__turn_start = None
+        game = self.__game
+        players = {p.get_color(): p for p in game.get_players()}
+        position.to_board(game.get_board(), players)
+        game.set_current_index(index)
+        self.dice_values = []
+        self.available_moves = []
+        self.selected_point = None
+        self.message = "Jugada deshecha. Presioná ESPACIO"
+        self.dirty = True
+        self.start_pondering()
+
+    def close(self):
+        """Cancela y termina los hilos del bot y del pondering."""
+        if self.__ponder is not None:
+            self.__ponder.stop()
+        if self.__worker is not None:
+            self.__worker.shutdown()
+
+    #  Render
+
+    def render(self):
+        """Dibuja las regiones que cambiaron y baja el flag dirty."""
+        start = time.perf_counter()
+        display, overlays = None, []
+        if self.__animating:
+            display, overlays = self.__animator.frame(self.__renderer.get_layout(), start)
+            if display is None:
+                self.__animating = False
+        if display is None:
+            display = Position.from_game(self.__game)
+        rects = self.__renderer.render_position(display, self.available_moves, self.message,
+                                                self.selected_point, overlays)
+        if rects:
+            pygame.display.update(rects)
+        self.dirty = False
+        self.__stats.record_frame(time.perf_counter() - start)
+
+    #  Loops
+
+    def run_event_driven(self):
+        """
+        Loop que duerme hasta que llega un evento.
+
+        Bloquea en pygame.event.wait; con una animación en curso usa un
+        timeout de un cuadro. Solo dibuja cuando el flag dirty está arriba.
+        """
+        self.__stats.start()
+        self.start_bot_turn()
+        while self.running:
+            if self.dirty or self.__animating:
+                self.render()
+            timeout = ANIMATION_FRAME_MS if self.__animating else 0
+            event = pygame.event.wait(timeout)
+            self.__stats.record_wakeup()
+            if event.type != pygame.NOEVENT:
+                self.handle_event(event)
+                # Se drena la cola para dibujar una sola vez por tanda
+                for event in pygame.event.get():
+                    self.handle_event(event)
+        self.__stats.stop()
+
+    def run_polling(self, fps=60):
+        """Loop clásico: procesa eventos y dibuja a fps fijos."""
+        clock = pygame.time.Clock()
+        self.__stats.start()
+        self.start_bot_turn()
+        while self.running:
+            for event in pygame.event.get():
+                self.handle_event(event)
+            self.__stats.record_wakeup()
+            self.render()
+            clock.tick(fps)
+        self.__stats.stop()
+
+
+def create_game():
+    """Crea la partida con la posición inicial."""
     p1 = Player("Blancas", color="blanco")
     p2 = Player("Negras", color="negro")
     board = BoardWithSetup()
     board.setup_initial_position(p1, p2)
     dice = Dice()
-    
-    game = Game(p1, p2, board=board, dice=dice)
-    
-    dice_values = []
-    available_moves = []
-    selected_point = None
-    message = "Presioná ESPACIO o 'Roll Dice' para empezar"
-    hitmap = {}
-    board_rect = None
-    
-    running = True
-    while running:
-        for event in pygame.event.get():
-            if event.type == pygame.QUIT:
-                running = False
-            
-            elif event.type == pygame.KEYDOWN:
-                if event.key in (pygame.K_ESCAPE, pygame.K_q):
-                    running = False
-                elif event.key == pygame.K_SPACE:
-                    if not dice_values:
-                        dice_values = game.roll()
-                        available_moves = dice_values.copy()
-                        selected_point = None
-                        message = f"Dados: {dice_values}. Click en triángulo con tu ficha"
-            
-            elif event.type == pygame.MOUSEBUTTONDOWN and event.button == 1:
-                button_rect = pygame.Rect(WIDTH - 200, 210, 140, 45)
-                
-                if button_rect.collidepoint(event.pos):
-                    if not dice_values:
-                        dice_values = game.roll()
-                        available_moves = dice_values.copy()
-                        selected_point = None
-                        message = f"Dados: {dice_values}. Click en triángulo con tu ficha"
-                    else:
-                        message = "Terminá de mover primero"
-                
-                else:
-                    if dice_values and board_rect:
-                        current_player = game.get_current_player()
-                        board_obj = game.get_board()
-                        
-                        # Detectar click en triángulo
-                        tri_width = board_rect.width / 12.0
-                        mx, my = event.pos
-                        
-                        clicked_point = None
-                        
-                        if board_rect.left <= mx <= board_rect.right and board_rect.top <= my <= board_rect.bottom:
-                            col = int((mx - board_rect.left) / tri_width)
-                            
-                            # Determinar si es top o bottom
-                            mid_y = board_rect.centery
-                            if my < mid_y:
-                                # Top row (puntos 13-24)
-                                clicked_point = 13 + col
-                            else:
-                                # Bottom row (puntos 12-1)
-                                clicked_point = 12 - col
-                        
-                        if clicked_point:
-                            if selected_point is None:
-                                # SELECCIONAR FICHA
-                                if board_obj.point_count(clicked_point) > 0:
-                                    top = board_obj.get_top_checker(clicked_point)
-                                    if top and top.get_color() == current_player.get_color():
-                                        selected_point = clicked_point
-                                        message = f"Punto {clicked_point} seleccionado. Click en destino."
-                                    else:
-                                        message = "Esa no es tu ficha"
-                                else:
-                                    message = "Punto vacío - seleccioná uno con tu ficha"
-                            
-                            else:
-                                # MOVER FICHA
-                                if current_player.get_color() == "blanco":
-                                    distance = clicked_point - selected_point
-                                else:
-                                    distance = selected_point - clicked_point
-                                
-                                if distance in available_moves:
-                                    if game.is_valid_move(selected_point, clicked_point, distance):
-                                        try:
-                                            board_obj.mover_ficha(selected_point, clicked_point)
-                                            available_moves.remove(distance)
-                                            message = f"✓ Moviste {selected_point} → {clicked_point}"
-                                            selected_point = None
-                                            
-                                            if not available_moves:
-                                                game.next_turn()
-                                                dice_values = []
-                                                message = f"Turno de {game.get_current_player().get_nombre()}. Presiona ESPACIO"
-                                        
-                                        except Exception as e:
-                                            message = f"Error: {str(e)}"
-                                            selected_point = None
-                                    else:
-                                        message = "Movimiento bloqueado (2+ fichas enemigas)"
-                                        selected_point = None
-                                else:
-                                    destinos = []
-                                    for d in available_moves:
-                                        if current_player.get_color() == "blanco":
-                                            destinos.append(f"{selected_point + d}")
-                                        else:
-                                            destinos.append(f"{selected_point - d}")
-                                    message = f"Destinos válidos: {', '.join(destinos)}"
-                                    selected_point = None
-        
-        # RENDER
-        hitmap, board_rect = render_board(screen, game, font)
-        draw_game_info(screen, game, font, available_moves, message)
-        
-        # Highlight punto seleccionado
-        if selected_point and board_rect:
-            row, col_vis = point_index_to_display(selected_point)
-            tri_width = board_rect.width / 12.0
-            x = board_rect.left + col_vis * tri_width
-            
-            if row == 'top':
-                y = board_rect.top
-                h = board_rect.height * 0.42
-            else:
-                y = board_rect.bottom - board_rect.height * 0.42
-                h = board_rect.height * 0.42
-            
-            highlight = pygame.Rect(x, y, tri_width, h)
-            pygame.draw.rect(screen, (255, 255, 0), highlight, 3)
-        
-        # Instrucciones
-        inst_font = pygame.font.SysFont(None, 18)
-        inst = inst_font.render("ESPACIO = tirar dados | Click en triángulo = seleccionar/mover | ESC = salir", True, TEXT_COLOR)
-        screen.blit(inst, (MARGIN_X, 15))
-        
-        pygame.display.flip()
-        clock.tick(60)
-    
+
+    # fast_path: la UI consulta al juego en cada click y cuadro
+    return Game(p1, p2, board=board, dice=dice, fast_path=True)
+
+
+def main(argv=None):
+    """
+    Main loop.
+
+    Args:
+        argv: Argumentos (--polling para el loop clásico a 60 FPS,
+            --stats para imprimir tiempos de cuadro y uso de CPU al salir,
+            --bot para jugar contra la computadora con las negras)
+    """
+    argv = sys.argv[1:] if argv is None else argv
+    pygame.init()
+    pygame.display.set_caption("Backgammon (Pygame)")
+    screen = pygame.display.set_mode((WIDTH, HEIGHT), pygame.RESIZABLE)
+
+    ui = BackgammonUI(screen, create_game(), bot_color="negro" if "--bot" in argv else None)
+    if "--polling" in argv:
+        ui.run_polling()
+    else:
+        ui.run_event_driven()
+    ui.close()
+
+    if "--stats" in argv:
+        print(ui.get_stats().summary())
+        animator = ui.get_animator()
+        print(f"animación: cuadros={animator.get_frames()} salteados={animator.get_dropped_frames()}")
+        if ui.get_ponder() is not None:
+            m = ui.get_ponder().get_metrics()
+            print(f"pondering: aciertos={m['hits']}/{m['lookups']} ({m['hit_rate']:.0%}) "
+                  f"ahorrado={m['time_saved_s'] * 1000:.0f}ms")
+
     pygame.quit()
     sys.exit()
 
 
 if __name__ == "__main__":
-    main()
\ No newline at end of file
+    main()
@@ -0,0 +1,453 @@
+import pygame
+
+from backgammon.core.position import Position
+from backgammon.pygame_ui.layout import (
+    BoardLayout, point_index_to_display, WIDTH, HEIGHT, MAX_VISIBLE_STACK, MAX_BAR_STACK,
+)
+
+"""
+Renderer del tablero con superficie estática cacheada y dirty rects.
+
+El fondo (marco, triángulos, etiquetas de puntos, botón e instrucciones)
+se dibuja una sola vez por tamaño de ventana. En cada cuadro se calcula
+una clave por región (cada punto, la barra, el bear off, el panel de
+turno/dados y el mensaje) y solo se redibujan las regiones cuya clave
+cambió. render devuelve los rectángulos modificados para pasarlos a
+pygame.display.update. Toda la geometría sale de BoardLayout.
+"""
+
+
+#Config visual
+
+BG_COLOR = (245, 239, 230)
+BOARD_COLOR = (230, 220, 200)
+TRI_A = (170, 120, 90)
+TRI_B = (210, 170, 130)
+LINE_COLOR = (60, 60, 60)
+WHITE = (245, 245, 245)
+BLACK = (30, 30, 30)
+RED = (200, 20, 20)
+TEXT_COLOR = (25, 25, 25)
+HIGHLIGHT_COLOR = (255, 255, 0)
+
+INSTRUCCIONES = "ESPACIO = tirar dados | Click en triángulo = seleccionar/mover | ESC = salir"
+
+# Clave de cache de cada región: los puntos por número, el resto por nombre
+_REGION_KEYS = tuple((point, f"point_{point}") for point in range(1, 25)) + tuple(
+    (name, name) for name in ("bar", "off", "info", "dice", "message")
+)
+
+
+class GlyphCache:
+    """
+    Cache de fuentes y de textos ya renderizados.
+
+    pygame.font.SysFont busca la fuente en el sistema y Font.render
+    rasteriza el texto: las dos cosas son caras para hacerlas cada cuadro.
+    """
+
+    MAX_GLYPHS = 512
+
+    def __init__(self):
+        self.__fonts = {}
+        self.__glyphs = {}
+
+    def get_font(self, size):
+        """Obtiene (y cachea) la fuente del sistema de un tamaño."""
+        font = self.__fonts.get(size)
+        if font is None:
+            font = self.__fonts[size] = pygame.font.SysFont(None, size)
+        return font
+
+    def render(self, text, color, size=20):
+        """
+        Obtiene la superficie de un texto, rasterizándolo una sola vez.
+
+        Args:
+            text: Texto a dibujar
+            color: Color RGB del texto
+            size: Tamaño de la fuente
+
+        Returns:
+            Superficie con el texto
+        """
+        key = (text, color, size)
+        glyph = self.__glyphs.get(key)
+        if glyph is None:
+            # Los mensajes cambian con los dados: se evita que crezca sin límite
+            if len(self.__glyphs) >= self.MAX_GLYPHS:
+                self.__glyphs.clear()
+            glyph = self.__glyphs[key] = self.get_font(size).render(str(text), True, color)
+        return glyph
+
+    def size(self):
+        """Cantidad de textos cacheados."""
+        return len(self.__glyphs)
+
+
+class CheckerAtlas:
+    """
+    Una sola superficie con todos los sprites que se repiten en el tablero.
+
+    Contiene cada ficha (blanca y negra, normal y resaltada) sin número y
+    con los números de pila 2..15, y las seis caras del dado. Se construye
+    una vez por tamaño de ventana; dibujar una ficha es copiar un
+    rectángulo del atlas en lugar de dibujar círculos y rasterizar texto.
+    """
+
+    COLORKEY = (255, 0, 255)
+    LABELS = (None,) + tuple(range(2, 16))
+
+    def __init__(self, layout, glyphs):
+        """
+        Args:
+            layout: BoardLayout con el radio de ficha y el tamaño de los dados
+            glyphs: GlyphCache para los números
+        """
+        radius = layout.radius
+        self.__sprite = 2 * radius + 2
+        self.__offset = radius + 1
+        self.__dice_size = layout.dice_size
+        rows = (("blanco", False), ("blanco", True), ("negro", False), ("negro", True))
+
+        width = max(len(self.LABELS) * self.__sprite, 6 * self.__dice_size)
+        height = len(rows) * self.__sprite + self.__dice_size
+        atlas = pygame.Surface((width, height))
+        if pygame.display.get_surface() is not None:
+            atlas = atlas.convert()
+        atlas.fill(self.COLORKEY)
+        atlas.set_colorkey(self.COLORKEY, pygame.RLEACCEL)
+
+        self.__checkers = {}
+        for row, (color, highlighted) in enumerate(rows):
+            if color == "blanco":
+                fill, text_color = WHITE, LINE_COLOR
+            else:
+                fill, text_color = RED, WHITE
+            for col, label in enumerate(self.LABELS):
+                area = pygame.Rect(col * self.__sprite, row * self.__sprite, self.__sprite, self.__sprite)
+                center = area.center
+                pygame.draw.circle(atlas, fill, center, radius)
+                if highlighted:
+                    pygame.draw.circle(atlas, HIGHLIGHT_COLOR, center, radius, 3)
+                else:
+                    pygame.draw.circle(atlas, LINE_COLOR, center, radius, 2)
+                if label is not None:
+                    txt = glyphs.render(str(label), text_color, layout.font_size)
+                    atlas.blit(txt, txt.get_rect(center=center))
+                self.__checkers[(color, label, highlighted)] = area
+
+        self.__dice = {}
+        top = len(rows) * self.__sprite
+        for value in range(1, 7):
+            area = pygame.Rect((value - 1) * self.__dice_size, top, self.__dice_size, self.__dice_size)
+            pygame.draw.rect(atlas, WHITE, area, border_radius=5)
+            pygame.draw.rect(atlas, LINE_COLOR, area, 2, border_radius=5)
+            txt = glyphs.render(str(value), LINE_COLOR, layout.font_size)
+            atlas.blit(txt, txt.get_rect(center=area.center))
+            self.__dice[value] = area
+
+        self.__surface = atlas
+
+    def get_surface(self):
+        """Getter de la superficie del atlas."""
+        return self.__surface
+
+    def checker(self, center, color, label=None, highlighted=False):
+        """
+        Blit de una ficha centrada en center.
+
+        Args:
+            center: Centro de la ficha en pantalla
+            color: 'blanco' o 'negro'
+            label: Número de la pila (2..15) o None
+            highlighted: True para la ficha resaltada
+
+        Returns:
+            Tupla (superficie, destino, área) para Surface.blits
+        """
+        area = self.__checkers[(color, label, highlighted)]
+        return (self.__surface, (center[0] - self.__offset, center[1] - self.__offset), area)
+
+    def die(self, pos, value):
+        """Blit de la cara de un dado con la esquina superior izquierda en pos."""
+        return (self.__surface, pos, self.__dice[value])
+
+    def size(self):
+        """Cantidad de sprites del atlas."""
+        return len(self.__checkers) + len(self.__dice)
+
+
+class BoardRenderer:
+    """
+    Dibuja el juego sobre una superficie redibujando solo lo que cambió.
+
+    La superficie puede ser la ventana o una Surface fuera de pantalla
+    (miniaturas, espectadores). Uso:
+        renderer = BoardRenderer(screen)
+        rects = renderer.render(game, dice_values, message, selected_point)
+        pygame.display.update(rects)
+    """
+
+    def __init__(self, surface, glyphs=None):
+        self.__glyphs = glyphs or GlyphCache()
+        self.__keys = {}
+        self.__overlay_rects = []
+        self.set_surface(surface)
+
+    #  Getters
+
+    def get_surface(self):
+        """Getter de la superficie donde se dibuja."""
+        return self.__surface
+
+    def get_layout(self):
+        """Getter de la geometría precalculada."""
+        return self.__layout
+
+    def get_board_rect(self):
+        """Getter del rectángulo del tablero."""
+        return self.__layout.board_rect
+
+    def get_button_rect(self):
+        """Getter del rectángulo del botón de dados."""
+        return self.__layout.button_rect
+
+    def get_glyphs(self):
+        """Getter del cache de textos."""
+        return self.__glyphs
+
+    def get_atlas(self):
+        """Getter del atlas de sprites."""
+        return self.__atlas
+
+    def get_region(self, name):
+        """Rectángulo de una región ('point_N', 'bar', 'off', 'info', 'dice', 'message')."""
+        return self.__layout.regions[name]
+
+    def set_surface(self, surface):
+        """
+        Cambia la superficie de destino (por ejemplo al redimensionar).
+
+        Si cambió el tamaño se recalculan la geometría y el fondo; en
+        cualquier caso el próximo render dibuja todo.
+        """
+        self.__surface = surface
+        size = surface.get_size()
+        if getattr(self, "_BoardRenderer__layout", None) is None or self.__layout.size != size:
+            self.__layout = BoardLayout(size)
+            self.__background = self.__build_background()
+            self.__atlas = CheckerAtlas(self.__layout, self.__glyphs)
+        self.invalidate()
+
+    #  Construcción
+
+    def __build_background(self):
+        """Pre-renderiza todo lo que no cambia durante la partida."""
+        layout = self.__layout
+        background = pygame.Surface(layout.size)
+        if pygame.display.get_surface() is not None:
+            # Mismo formato de píxel que la ventana: blits sin conversión
+            background = background.convert()
+        background.fill(BG_COLOR)
+
+        board_rect = layout.board_rect
+        pygame.draw.rect(background, BOARD_COLOR, board_rect, border_radius=12)
+        pygame.draw.rect(background, LINE_COLOR, board_rect, 2, border_radius=12)
+
+        for point in range(1, 25):
+            _, col_vis = point_index_to_display(point)
+            top = point >= 13
+            color = TRI_A if (col_vis % 2 == 0) == top else TRI_B
+            pygame.draw.polygon(background, color, layout.triangles[point])
+            pygame.draw.polygon(background, LINE_COLOR, layout.triangles[point], 1)
+
+        mid_y = board_rect.centery
+        pygame.draw.line(background, LINE_COLOR, (board_rect.left, mid_y), (board_rect.right, mid_y), 2)
+
+        # Etiquetas de puntos: 13-24 arriba, 12-1 abajo
+        for point, center in layout.labels.items():
+            img = self.__glyphs.render(str(point), TEXT_COLOR, layout.font_size)
+            background.blit(img, img.get_rect(center=center))
+
+        # Botón Roll Dice
+        button_rect = layout.button_rect
+        pygame.draw.rect(background, TRI_A, button_rect, border_radius=8)
+        pygame.draw.rect(background, LINE_COLOR, button_rect, 2, border_radius=8)
+        btn_text = self.__glyphs.render("Roll Dice", TEXT_COLOR, layout.font_size)
+        background.blit(btn_text, btn_text.get_rect(center=button_rect.center))
+
+        background.blit(self.__glyphs.render(INSTRUCCIONES, TEXT_COLOR, layout.small_font_size),
+                        layout.instructions_pos)
+        return background
+
+    #  Render
+
+    def invalidate(self):
+        """Fuerza a redibujar toda la superficie en el próximo render."""
+        self.__keys.clear()
+        self.__overlay_rects = []
+
+    def render(self, game, dice_values, message, selected_point=None, overlays=()):
+        """
+        Dibuja el estado de un juego redibujando solo las regiones que cambiaron.
+
+        Args:
+            game: Juego (GameFacade o Game)
+            dice_values: Movimientos de dados disponibles
+            message: Mensaje de la línea inferior
+            selected_point: Punto seleccionado o None
+            overlays: Fichas sueltas (centro, color) a dibujar encima
+
+        Returns:
+            Lista de rectángulos modificados (vacía si no cambió nada)
+        """
+        return self.render_position(Position.from_game(game), dice_values, message, selected_point, overlays)
+
+    def render_position(self, position, dice_values=(), message="", selected_point=None, overlays=()):
+        """
+        Dibuja una Position redibujando solo las regiones que cambiaron.
+
+        Todas las copias del cuadro (fondo de cada región, fichas, dados y
+        textos) se juntan en una lista y se hacen con un único Surface.blits.
+
+        Args:
+            position: Posición a dibujar (su turno va al panel)
+            dice_values: Dados a mostrar
+            message: Mensaje de la línea inferior
+            selected_point: Punto resaltado o None
+            overlays: Fichas en movimiento como (centro, color), dibujadas
+                encima de todo; las regiones que pisan (antes y ahora) se
+                redibujan
+
+        Returns:
+            Lista de rectángulos modificados (vacía si no cambió nada)
+        """
+        surface = self.__surface
+        first = not self.__keys
+        batch = []
+        if first:
+            batch.append((self.__background, (0, 0)))
+
+        dirty = []
+        sprites = [self.__atlas.checker(center, color) for center, color in overlays]
+        if sprites or self.__overlay_rects:
+            dirty.extend(self.__clear_overlays(batch, sprites))
+        points = position.get_points()
+        for point in range(1, 25):
+            key = (points[point], point == selected_point)
+            if self.__update_key(point, key):
+                dirty.append(self.__draw_point(batch, point, *key))
+
+        bar_key = (position.get_bar_count("blanco"), position.get_bar_count("negro"))
+        if self.__update_key("bar", bar_key):
+            dirty.append(self.__draw_bar(batch, *bar_key))
+
+        off_key = (position.get_off_count("blanco"), position.get_off_count("negro"))
+        if self.__update_key("off", off_key):
+            dirty.append(self.__draw_off(batch, *off_key))
+
+        turn = position.get_turn()
+        if self.__update_key("info", turn):
+            dirty.append(self.__draw_info(batch, turn))
+
+        dice_key = tuple(dice_values or ())
+        if self.__update_key("dice", dice_key):
+            dirty.append(self.__draw_dice(batch, dice_key))
+
+        if self.__update_key("message", message):
+            dirty.append(self.__draw_message(batch, message))
+
+        batch.extend(sprites)
+        if batch:
+            surface.blits(batch, doreturn=False)
+        if first:
+            return [surface.get_rect()]
+        return dirty
+
+    def __clear_overlays(self, batch, sprites):
+        """
+        Borra las fichas en movimiento del cuadro anterior.
+
+        Restaura el fondo donde estaban y olvida la clave de cada región
+        que pisaban o van a pisar, para que se redibuje debajo.
+        """
+        old = self.__overlay_rects
+        new = [pygame.Rect(dest, area.size) for _, dest, area in sprites]
+        for rect in old:
+            batch.append((self.__background, rect, rect))
+        touched = old + new
+        regions = self.__layout.regions
+        for key, name in _REGION_KEYS:
+            if regions[name].collidelist(touched) != -1:
+                self.__keys.pop(key, None)
+        self.__overlay_rects = new
+        return touched
+
+    def __update_key(self, name, key):
+        if self.__keys.get(name, self) == key:
+            return False
+        self.__keys[name] = key
+        return True
+
+    def __restore(self, batch, name):
+        """Agrega al lote la copia del fondo de una región."""
+        rect = self.__layout.regions[name]
+        batch.append((self.__background, rect, rect))
+        return rect
+
+    def __draw_point(self, batch, point, signed_count, selected):
+        rect = self.__restore(batch, f"point_{point}")
+        count = abs(signed_count)
+        if count:
+            color = "blanco" if signed_count > 0 else "negro"
+            visibles = min(count, MAX_VISIBLE_STACK)
+            extras = count - (MAX_VISIBLE_STACK - 1) if count > MAX_VISIBLE_STACK else 0
+            slots = self.__layout.slots[point]
+            atlas = self.__atlas
+            for i in range(visibles):
+                top = i == visibles - 1
+                label = extras if (extras and top) else None
+                # La ficha de arriba es la que se mueve: esa se resalta
+                batch.append(atlas.checker(slots[i], color, label, selected and top))
+        return rect
+
+    def __draw_bar(self, batch, white_bar, black_bar):
+        rect = self.__restore(batch, "bar")
+        for color, count in (("blanco", white_bar), ("negro", black_bar)):
+            slots = self.__layout.bar_slots[color]
+            for i in range(min(count, MAX_BAR_STACK)):
+                label = count if i == MAX_BAR_STACK - 1 and count > MAX_BAR_STACK else None
+                batch.append(self.__atlas.checker(slots[i], color, label))
+        return rect
+
+    def __draw_off(self, batch, white_off, black_off):
+        rect = self.__restore(batch, "off")
+        layout = self.__layout
+        size = layout.font_size
+        batch.append((self.__glyphs.render(f"White: {white_off}", TEXT_COLOR, size), layout.off_pos["blanco"]))
+        batch.append((self.__glyphs.render(f"Black: {black_off}", TEXT_COLOR, size), layout.off_pos["negro"]))
+        return rect
+
+    def __draw_info(self, batch, current_color):
+        rect = self.__restore(batch, "info")
+        layout = self.__layout
+        color_name = "Blancas" if current_color == "blanco" else "Negras"
+        batch.append((self.__glyphs.render("Turno:", TEXT_COLOR, layout.font_size), layout.turn_pos))
+        batch.append((self.__glyphs.render(color_name, TEXT_COLOR, layout.font_size), layout.turn_name_pos))
+        return rect
+
+    def __draw_dice(self, batch, dice_values):
+        rect = self.__restore(batch, "dice")
+        layout = self.__layout
+        x, y = layout.dice_origin
+        for i, value in enumerate(dice_values):
+            batch.append(self.__atlas.die((x + i * layout.dice_spacing, y), value))
+        return rect
+
+    def __draw_message(self, batch, message):
+        rect = self.__restore(batch, "message")
+        if message:
+            layout = self.__layout
+            batch.append((self.__glyphs.render(message, TEXT_COLOR, layout.small_font_size), layout.message_pos))
+        return rect
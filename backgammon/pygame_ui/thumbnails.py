@@ -0,0 +1,164 @@
+import argparse
+import multiprocessing
+import os
+import sys
+import time
+
+from backgammon.core.position import Position
+
+"""
+Render por lotes de posiciones a PNG, sin ventana.
+
+Usa el mismo BoardRenderer que la interfaz, dibujando sobre una Surface
+fuera de pantalla con el driver de video 'dummy' de SDL. Cada proceso
+trabajador arma su renderer una vez y lo reutiliza: como el renderer
+recuerda lo que dibujó, entre una posición y la siguiente solo se
+redibujan los puntos que cambiaron. Los trabajadores se lanzan con
+'spawn': el proceso que los pide puede tener pygame inicializado e
+hilos vivos (bot, pondering), y un fork en ese estado se puede colgar.
+
+Uso:
+    python -m backgammon.pygame_ui.thumbnails posiciones.txt --salida thumbs/ [--tamano 325x175] [--procesos 4]
+
+Cada línea de la entrada es un Position ID, opcionalmente seguido del
+color en turno y de un nombre para el archivo.
+"""
+
+
+THUMB_SIZE = (325, 175)
+
+# Estado de cada proceso trabajador (se arma en _init_worker)
+_renderer = None
+
+
+def _headless():
+    """Inicializa pygame sin ventana (driver 'dummy')."""
+    os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+    os.environ.setdefault("PYGAME_HIDE_SUPPORT_PROMPT", "1")
+    import pygame
+    pygame.display.init()
+    pygame.font.init()
+    return pygame
+
+
+class ThumbnailRenderer:
+    """Dibuja posiciones en una Surface fuera de pantalla y las guarda como PNG."""
+
+    def __init__(self, size=THUMB_SIZE):
+        """
+        Args:
+            size: (ancho, alto) de las imágenes
+        """
+        self.__pygame = _headless()
+        from backgammon.pygame_ui.renderer import BoardRenderer
+        self.__surface = self.__pygame.Surface(size)
+        self.__renderer = BoardRenderer(self.__surface)
+
+    def get_surface(self):
+        """Getter de la superficie donde se dibuja."""
+        return self.__surface
+
+    def render(self, position, dice=(), message=""):
+        """Dibuja una posición y devuelve la superficie."""
+        self.__renderer.render_position(position, dice, message)
+        return self.__surface
+
+    def save(self, position, path, dice=(), message=""):
+        """Dibuja una posición y la guarda en path (el formato sale de la extensión)."""
+        self.__pygame.image.save(self.render(position, dice, message), path)
+        return path
+
+
+def parse_line(line, index):
+    """
+    Interpreta una línea de la entrada.
+
+    Args:
+        line: "<position_id> [blanco|negro] [nombre]"
+        index: Número de línea (para el nombre por defecto)
+
+    Returns:
+        (nombre, Position) o None si la línea está vacía o es un comentario
+
+    Raises:
+        ValueError: Si el Position ID o el color son inválidos
+    """
+    parts = line.split()
+    if not parts or parts[0].startswith("#"):
+        return None
+    turn = parts[1] if len(parts) > 1 else "blanco"
+    name = parts[2] if len(parts) > 2 else f"posicion_{index:06d}"
+    return name, Position.from_position_id(parts[0], turn)
+
+
+def _init_worker(size):
+    global _renderer
+    _renderer = ThumbnailRenderer(size)
+
+
+def _render_job(job):
+    path, position = job
+    return _renderer.save(position, path)
+
+
+def render_batch(items, out_dir, size=THUMB_SIZE, processes=None, chunksize=64):
+    """
+    Renderiza un flujo de posiciones a PNG en procesos paralelos.
+
+    Args:
+        items: Iterable de (nombre, Position); se consume a medida que avanza
+        out_dir: Carpeta de salida (se crea si no existe)
+        size: (ancho, alto) de las imágenes
+        processes: Procesos trabajadores (None = uno por núcleo; 0 = en este proceso)
+        chunksize: Posiciones que se mandan juntas a cada proceso
+
+    Returns:
+        Cantidad de imágenes escritas
+    """
+    os.makedirs(out_dir, exist_ok=True)
+    jobs = ((os.path.join(out_dir, f"{name}.png"), position) for name, position in items)
+
+    if processes == 0:
+        _init_worker(size)
+        return sum(1 for _ in map(_render_job, jobs))
+
+    count = 0
+    context = multiprocessing.get_context("spawn")
+    with context.Pool(processes, initializer=_init_worker, initargs=(size,)) as pool:
+        for _ in pool.imap_unordered(_render_job, jobs, chunksize):
+            count += 1
+    return count
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Render de posiciones a PNG sin ventana")
+    parser.add_argument("entrada", help="Archivo con un Position ID por línea ('-' = stdin)")
+    parser.add_argument("--salida", default="thumbnails")
+    parser.add_argument("--tamano", default=f"{THUMB_SIZE[0]}x{THUMB_SIZE[1]}", help="ANCHOxALTO")
+    parser.add_argument("--procesos", type=int, default=None, help="0 = sin procesos extra")
+    args = parser.parse_args(argv)
+
+    try:
+        width, height = (int(v) for v in args.tamano.lower().split("x"))
+    except ValueError:
+        parser.error(f"Tamaño inválido: {args.tamano}")
+
+    try:
+        stream = sys.stdin if args.entrada == "-" else open(args.entrada, encoding="utf-8")
+    except OSError as e:
+        parser.error(f"No se puede leer {args.entrada}: {e.strerror}")
+    with stream:
+        items = (item for item in (parse_line(line, i) for i, line in enumerate(stream, 1)) if item)
+        start = time.perf_counter()
+        try:
+            count = render_batch(items, args.salida, (width, height), args.procesos)
+        except ValueError as e:
+            print(f"Error: {e}", file=sys.stderr)
+            return 1
+        elapsed = time.perf_counter() - start
+    print(f"{count} imágenes en {elapsed:.2f}s ({count / elapsed if elapsed else 0:.0f}/s)")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
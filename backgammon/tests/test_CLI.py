@@ -501,6 +501,58 @@ class TestMainCompleto(unittest.TestCase):
         self.assertEqual(result, 0)
 
 
+class TestArranqueLiviano(unittest.TestCase):
+    """Tests del arranque perezoso del CLI (imports y colores)"""
+    
+    def _modulos_cargados(self, codigo):
+        import subprocess
+        import os
+        raiz = os.path.abspath(os.path.join(os.path.dirname(__file__), '..', '..'))
+        env = dict(os.environ, PYTHONPATH=raiz)
+        proc = subprocess.run(
+            [sys.executable, "-c", codigo + "\nimport sys; print(' '.join(sorted(sys.modules)))"],
+            capture_output=True, text=True, env=env, check=True,
+        )
+        return set(proc.stdout.splitlines()[-1].split())
+    
+    def test_importar_cli_no_carga_core_ni_colorama(self):
+        """Importar el CLI no debe traer colorama, argparse ni el core"""
+        cargados = self._modulos_cargados("import backgammon.cli.__main__")
+        self.assertNotIn("colorama", cargados)
+        self.assertNotIn("argparse", cargados)
+        self.assertFalse(any(m.startswith("backgammon.core") for m in cargados))
+    
+    def test_roll_solo_importa_dados(self):
+        """El comando roll solo necesita Dice (y sin TTY no carga colorama)"""
+        cargados = self._modulos_cargados(
+            "import io, contextlib\n"
+            "from backgammon.cli.__main__ import main\n"
+            "with contextlib.redirect_stdout(io.StringIO()):\n"
+            "    main(['roll'])"
+        )
+        self.assertIn("backgammon.core.dice", cargados)
+        self.assertNotIn("backgammon.core.game", cargados)
+        self.assertNotIn("colorama", cargados)
+        self.assertNotIn("argparse", cargados)
+    
+    @patch('builtins.print')
+    def test_main_acepta_argv_explicito(self, mock_print):
+        """main puede recibir argv en lugar de leer sys.argv"""
+        from backgammon.cli.__main__ import main
+        
+        self.assertEqual(main(["info"]), 0)
+    
+    def test_sin_tty_no_hay_colores(self):
+        """Con stdout redirigido la paleta queda vacía"""
+        from backgammon.cli import __main__ as cli
+        
+        with patch('sys.stdout', new_callable=StringIO):
+            cli._PALETA = None
+            self.assertFalse(cli._colores_activos())
+            self.assertEqual(cli.Fore.RED, "")
+        cli._PALETA = None
+
+
 if __name__ == '__main__':
     unittest.main()
     
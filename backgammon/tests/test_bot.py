@@ -0,0 +1,77 @@
+"""
+Tests de los bots y de la evaluación heurística.
+"""
+import random
+import threading
+
+import pytest
+
+from backgammon.core.bot import Bot, HeuristicBot, RandomBot, SearchCancelled, evaluate
+from backgammon.core.movegen import apply_play, legal_plays
+from backgammon.core.position import BLANCO, NEGRO, Position
+
+
+def _pos(turn=BLANCO, bar=(0, 0), off=(0, 0), **puntos):
+    points = [0] * 25
+    for nombre, n in puntos.items():
+        points[int(nombre[1:])] = n
+    return Position(points, bar, off, turn)
+
+
+def test_evaluacion_simetrica_en_la_apertura():
+    pos = Position.initial()
+    assert evaluate(pos, BLANCO) == evaluate(pos, NEGRO)
+
+
+def test_carrera_premia_pips_y_fichas_sacadas():
+    adelante = _pos(p23=2, p3=-2)
+    atras = _pos(p19=2, p6=-2)
+    assert evaluate(adelante, BLANCO) > evaluate(atras, BLANCO)
+
+
+def test_blot_a_tiro_penaliza():
+    seguro = _pos(p10=2, p15=-2)
+    expuesto = _pos(p10=1, p12=1, p15=-2)
+    assert evaluate(seguro, BLANCO) > evaluate(expuesto, BLANCO)
+    # Fichas en la barra
+    assert evaluate(_pos(bar=(0, 1), p10=2, p5=-1), BLANCO) > evaluate(_pos(bar=(1, 0), p10=1, p5=-2), BLANCO)
+
+
+def test_heuristico_prefiere_hacer_punto():
+    plays = HeuristicBot().rank_plays(Position.initial(), (3, 1))
+    mejor = tuple(sorted(plays[0][1]))
+    assert mejor == ((17, 20), (19, 20))
+    assert plays[0][0] >= plays[-1][0]
+
+
+def test_heuristico_le_gana_al_azar():
+    rng = random.Random(5)
+    bots = {BLANCO: HeuristicBot(), NEGRO: RandomBot(random.Random(6))}
+    ganadas = 0
+    for partida in range(6):
+        pos = Position.initial(BLANCO if partida % 2 else NEGRO)
+        while not (pos.has_won(BLANCO) or pos.has_won(NEGRO)):
+            dice = (rng.randint(1, 6), rng.randint(1, 6))
+            pos = apply_play(pos, bots[pos.get_turn()].choose_play(pos, dice))
+        ganadas += pos.has_won(BLANCO)
+    assert ganadas >= 5
+
+
+def test_jugada_legal_y_vacia_si_no_hay_movimientos():
+    pos = _pos(NEGRO, bar=(0, 1), p24=2, p23=2, p22=2, p21=2, p20=2, p19=2)
+    assert HeuristicBot().choose_play(pos, (3, 4)) == ()
+    play = RandomBot(random.Random(1)).choose_play(Position.initial(), (6, 5))
+    assert play in [p for p, _ in legal_plays(Position.initial(), (6, 5))]
+
+
+@pytest.mark.parametrize("bot", [HeuristicBot(), RandomBot()])
+def test_cancelacion(bot):
+    cancel = threading.Event()
+    cancel.set()
+    with pytest.raises(SearchCancelled):
+        bot.choose_play(Position.initial(), (3, 1), cancel)
+
+
+def test_bot_base_es_abstracto():
+    with pytest.raises(NotImplementedError):
+        Bot().choose_play(Position.initial(), (3, 1))
@@ -0,0 +1,252 @@
+"""
+Suite de paridad del motor único del tablero.
+
+Las expectativas de test_board y test_board_refactored se corren contra
+todas las formas de construir un tablero: Board, BoardEngine directo,
+BoardFacade ligado al motor y BoardFacade con componentes a medida
+(delegación clásica por componente).
+"""
+import pytest
+
+from backgammon.core.engine import BoardEngine, POSICION_INICIAL
+from backgammon.core.board import Board, BoardWithSetup
+from backgammon.core.board_refactored import (
+    BoardFacade, BoardWithSetupFacade, BoardPoints, BarManager, BearOffManager,
+)
+from backgammon.core.checker import Checker
+from backgammon.core.player import Player
+
+
+FABRICAS = {
+    "board": Board,
+    "engine": BoardEngine,
+    "facade": BoardFacade,
+    "facade_componentes": lambda: BoardFacade(
+        points=BoardPoints(), bar=BarManager(), bear_off=BearOffManager()
+    ),
+}
+
+
+@pytest.fixture(params=list(FABRICAS))
+def tablero(request):
+    return FABRICAS[request.param]()
+
+
+@pytest.fixture
+def blanco():
+    return Player("W", color="blanco")
+
+
+@pytest.fixture
+def negro():
+    return Player("B", color="negro")
+
+
+class TestParidadPuntos:
+    """Colocar, contar y mover fichas."""
+
+    def test_tablero_vacio(self, tablero):
+        assert len(tablero.points) == 25
+        for i in range(1, 25):
+            assert tablero.point_count(i) == 0
+            assert tablero.is_empty(i)
+            assert tablero.get_point_color(i) is None
+        assert tablero.get_bar_count("blanco") == 0
+        assert tablero.get_off_count("negro") == 0
+
+    def test_colocar_y_top_checker(self, tablero, blanco):
+        tablero.colocar_ficha(blanco, 5)
+        tablero.colocar_ficha(blanco, 5)
+        assert tablero.point_count(5) == 2
+        assert tablero.get_top_checker(5).get_color() == "blanco"
+        assert tablero.get_point_color(5) == "blanco"
+        assert tablero.get_top_checker(6) is None
+
+    @pytest.mark.parametrize("punto", [0, 25, -1])
+    def test_colocar_fuera_de_rango(self, tablero, blanco, punto):
+        with pytest.raises(ValueError):
+            tablero.colocar_ficha(blanco, punto)
+        assert tablero.point_count(punto) == 0
+        assert tablero.get_top_checker(punto) is None
+        assert tablero.is_empty(punto)
+
+    def test_mover_ficha(self, tablero, blanco):
+        tablero.colocar_ficha(blanco, 1)
+        tablero.mover_ficha(1, 4)
+        assert tablero.point_count(1) == 0
+        assert tablero.point_count(4) == 1
+
+    @pytest.mark.parametrize("origen,destino", [(0, 5), (5, 25), (3, 4)])
+    def test_mover_invalido(self, tablero, origen, destino):
+        with pytest.raises(ValueError):
+            tablero.mover_ficha(origen, destino)
+
+
+class TestParidadCaptura:
+    """Captura de fichas solitarias."""
+
+    def test_captura_ficha_solitaria(self, tablero, blanco, negro):
+        tablero.colocar_ficha(blanco, 3)
+        tablero.colocar_ficha(negro, 5)
+        tablero.mover_ficha(3, 5)
+        assert tablero.point_count(5) == 1
+        assert tablero.get_point_color(5) == "blanco"
+        assert tablero.get_bar_count("negro") == 1
+        assert tablero.get_bar_count("blanco") == 0
+
+    def test_no_captura_propia_ni_multiples(self, tablero, blanco, negro):
+        tablero.colocar_ficha(blanco, 3)
+        tablero.colocar_ficha(blanco, 3)
+        tablero.colocar_ficha(blanco, 5)
+        tablero.mover_ficha(3, 5)
+        assert tablero.point_count(5) == 2
+        tablero.colocar_ficha(negro, 8)
+        tablero.colocar_ficha(negro, 8)
+        assert tablero.can_place_checker(8, "blanco") is False
+        assert tablero.get_bar_count("negro") == 0
+
+    def test_can_place_checker(self, tablero, blanco, negro):
+        assert tablero.can_place_checker(0, "blanco") is False
+        assert tablero.can_place_checker(7, "blanco") is True
+        tablero.colocar_ficha(negro, 7)
+        assert tablero.can_place_checker(7, "blanco") is True
+        assert tablero.can_place_checker(7, "negro") is True
+
+
+class TestParidadBarraYBearOff:
+    """Barra, bear off y victoria."""
+
+    def test_barra(self, tablero, blanco):
+        tablero.capture_checker(Checker(blanco, "blanco"))
+        tablero.capture_checker(Checker(blanco, "negro"))
+        assert tablero.get_bar_count("blanco") == 1
+        sacada = tablero.remove_from_bar("blanco")
+        assert sacada.get_color() == "blanco"
+        assert tablero.remove_from_bar("blanco") is None
+        assert tablero.get_bar_count("negro") == 1
+
+    def test_bear_off_y_victoria(self, tablero):
+        for _ in range(14):
+            tablero.bear_off("blanco")
+        assert tablero.has_won("blanco") is False
+        tablero.bear_off("blanco")
+        assert tablero.get_off_count("blanco") == 15
+        assert tablero.has_won("blanco") is True
+        assert tablero.has_won("negro") is False
+
+
+class TestParidadHomeBoard:
+    """Home board y listado de fichas."""
+
+    @pytest.mark.parametrize("punto,color,esperado", [
+        (19, "blanco", True), (18, "blanco", False), (6, "negro", True), (7, "negro", False),
+    ])
+    def test_is_in_home_board(self, tablero, punto, color, esperado):
+        assert tablero.is_in_home_board(punto, color) is esperado
+
+    def test_all_in_home_board(self, tablero, blanco):
+        assert tablero.all_in_home_board("blanco") is True
+        tablero.colocar_ficha(blanco, 19)
+        tablero.colocar_ficha(blanco, 24)
+        assert tablero.all_in_home_board("blanco") is True
+        assert tablero.get_all_checkers("blanco") == [(19, 1), (24, 1)]
+        tablero.capture_checker(Checker(blanco, "blanco"))
+        assert tablero.all_in_home_board("blanco") is False
+        tablero.colocar_ficha(blanco, 10)
+        assert tablero.all_in_home_board("blanco") is False
+
+    def test_clear(self, tablero, blanco):
+        tablero.colocar_ficha(blanco, 19)
+        tablero.capture_checker(Checker(blanco, "negro"))
+        tablero.bear_off("blanco")
+        tablero.clear()
+        assert all(len(p) == 0 for p in tablero.points)
+        assert tablero.get_bar_count("negro") == 0
+        assert tablero.get_off_count("blanco") == 0
+
+
+@pytest.mark.parametrize("fabrica", [
+    BoardWithSetup,
+    BoardWithSetupFacade,
+    lambda: BoardWithSetupFacade(points=BoardPoints(), bar=BarManager(), bear_off=BearOffManager()),
+])
+def test_setup_inicial_identico(fabrica, blanco, negro):
+    tablero = fabrica()
+    tablero.setup_initial_position(blanco, negro)
+    colores = ("blanco", "negro")
+    for owner, punto, cantidad in POSICION_INICIAL:
+        assert tablero.point_count(punto) == cantidad
+        assert tablero.get_point_color(punto) == colores[owner]
+    assert sum(tablero.point_count(p) for p in range(1, 25)) == 30
+
+
+def test_descripcion_comun_a_board_y_facade(blanco, negro):
+    b, f = Board(), BoardFacade()
+    for t in (b, f):
+        t.colocar_ficha(blanco, 13)
+        t.colocar_ficha(negro, 2)
+        t.bear_off("negro")
+    cuerpo_b = str(b).splitlines()[1:]
+    cuerpo_f = str(f).splitlines()[1:]
+    assert cuerpo_b == cuerpo_f
+
+
+def test_facade_ligada_al_motor_sin_saltos():
+    f = BoardFacade()
+    motor = f.get_engine()
+    assert isinstance(motor, BoardEngine)
+    assert f.mover_ficha.__self__ is motor
+    assert f.get_points_component().get_engine() is motor
+    assert f.get_bar_component().get_engine() is motor
+
+
+def test_facade_con_componentes_a_medida_delega():
+    f = BoardFacade(points=BoardPoints())
+    assert f.get_engine() is None
+    assert "mover_ficha" not in vars(f)
+
+
+def test_facade_vuelve_a_ligar_tras_setters(blanco):
+    f = BoardFacade()
+    motor = f.get_engine()
+    f.set_points_component(BoardPoints())
+    assert f.get_engine() is None
+    f.colocar_ficha(blanco, 3)
+    assert f.point_count(3) == 1
+
+    f.set_points_component(BoardPoints(motor))
+    assert f.get_engine() is motor
+    assert f.point_count(3) == 0
+
+
+class TestBarraPorColor:
+    """La barra se guarda como una pila por color."""
+
+    def test_pilas_independientes_por_color(self, tablero, blanco):
+        fichas = [Checker(blanco, "blanco"), Checker(blanco, "negro"), Checker(blanco, "blanco")]
+        for ficha in fichas:
+            tablero.capture_checker(ficha)
+        assert tablero.get_bar_count("blanco") == 2
+        assert tablero.get_bar_count("negro") == 1
+        assert tablero.get_bar_count("verde") == 0
+        # La vista combinada conserva todas las fichas
+        assert sorted(id(c) for c in tablero.bar) == sorted(id(c) for c in fichas)
+        # Sacar devuelve el objeto Checker (la última capturada de ese color)
+        assert tablero.remove_from_bar("blanco") is fichas[2]
+        assert tablero.remove_from_bar("negro") is fichas[1]
+        assert tablero.remove_from_bar("negro") is None
+
+    def test_vista_bar_es_copia(self, tablero, blanco):
+        tablero.capture_checker(Checker(blanco, "blanco"))
+        vista = tablero.bar
+        vista.clear()
+        assert tablero.get_bar_count("blanco") == 1
+
+    def test_color_desconocido_tiene_su_pila(self):
+        motor = BoardEngine()
+        ficha = type("C", (), {"get_color": lambda self: "verde"})()
+        motor.capture_checker(ficha)
+        assert motor.get_bar_count("verde") == 1
+        motor.clear_bar()
+        assert motor.get_bar_count("verde") == 0
+        assert motor.bar == []
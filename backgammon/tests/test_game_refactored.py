@@ -329,3 +329,85 @@ def test_facade_properties_and_repr_str(facade):
     r = repr(facade)
     assert "SOLID" in s
     assert "SOLID=True" in r
+
+
+# GameFacade: camino rápido 
+
+def test_facade_fast_path_liga_metodos_al_game(players, empty_board):
+    w, b = players
+    gf = GameFacade(w, b, board=empty_board, dice=Dice.from_seed(3), fast_path=True)
+    game = gf._GameFacade__game
+
+    assert gf.is_fast_path() is True
+    for nombre in ("is_valid_move", "move", "roll", "next_turn", "get_current_player"):
+        assert getattr(gf, nombre).__self__ is game
+    assert GameFacade(w, b).is_fast_path() is False
+
+
+def test_facade_fast_path_misma_conducta_que_facade(players):
+    w, b = players
+    resultados = []
+    for fast in (False, True):
+        board = Board()
+        colocar_ficha_safe(board, w, 6)
+        colocar_ficha_safe(board, b, 9)
+        gf = GameFacade(w, b, board=board, dice=Dice.from_seed(7), fast_path=fast)
+        validez = (gf.is_valid_move(6, 9, 3), gf.is_valid_move(6, 8, 3))
+        gf.move(6, 9)
+        tirada = gf.roll()
+        siguiente = gf.next_turn()
+        resultados.append((
+            validez, tirada, siguiente, gf.get_current_index(),
+            gf.current_player, board.get_bar_count("negro"), gf.is_valid_move(9, 6, 3),
+        ))
+    assert resultados[0] == resultados[1]
+
+
+def test_facade_fast_path_respeta_set_board(players):
+    w, b = players
+    gf = GameFacade(w, b, fast_path=True)
+    nuevo = Board()
+    colocar_ficha_safe(nuevo, w, 1)
+    gf.set_board(nuevo)
+    assert gf.get_board() is nuevo
+    assert gf.is_valid_move(1, 4, 3) is True
+
+
+def test_facade_fast_path_rechaza_componentes_propios(players):
+    w, b = players
+    with pytest.raises(ValueError):
+        GameFacade(w, b, validator=MoveValidator(Board(), w), fast_path=True)
+    with pytest.raises(ValueError):
+        GameFacade(w, b, turn_manager=TurnManager([w, b]), fast_path=True)
+
+
+def test_facade_fast_path_turn_manager_sincronizado(players):
+    w, b = players
+    gf = GameFacade(w, b, fast_path=True)
+    gf.next_turn()
+    assert gf.get_turn_manager().get_current_index() == 1
+    assert gf.get_turn_manager().get_current_player() is b
+
+
+def test_facade_fast_path_se_desactiva_con_setters(players):
+    w, b = players
+    gf = GameFacade(w, b, fast_path=True)
+    gf.next_turn()
+
+    propio = TurnManager([w, b])
+    gf.set_turn_manager(propio)
+    assert gf.is_fast_path() is False
+    assert propio.get_current_index() == 1
+    gf.next_turn()
+    assert propio.get_current_index() == 0
+    assert gf.get_current_player() is w
+
+    gf = GameFacade(w, b, fast_path=True)
+
+    class SiempreNo(MoveValidator):
+        def is_valid_move(self, origin, dest, dice_value):
+            return False
+
+    gf.set_validator(SiempreNo(gf.get_board(), w))
+    assert gf.is_fast_path() is False
+    assert gf.is_valid_move(1, 4, 3) is False
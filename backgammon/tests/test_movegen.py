@@ -0,0 +1,96 @@
+"""
+Tests de la generación de jugadas legales.
+"""
+import random
+
+import pytest
+
+from backgammon.core.checker import Checker
+from backgammon.core.movegen import apply_play, find_play, legal_plays
+from backgammon.core.position import BLANCO, NEGRO, Position
+
+BAR, OFF = Checker.BAR, Checker.OFF
+
+
+def _pos(turn=BLANCO, bar=(0, 0), off=(0, 0), **puntos):
+    points = [0] * 25
+    for nombre, n in puntos.items():
+        points[int(nombre[1:])] = n
+    return Position(points, bar, off, turn)
+
+
+@pytest.mark.parametrize("dice,esperadas", [((3, 1), 16), ((2, 1), 15), ((6, 6), 11), ((5, 5), 4)])
+def test_cantidad_de_jugadas_de_apertura(dice, esperadas):
+    assert len(legal_plays(Position.initial(), dice)) == esperadas
+    assert len(legal_plays(Position.initial(NEGRO), dice)) == esperadas
+
+
+def test_resultados_tienen_turno_rival_y_sin_repetir():
+    plays = legal_plays(Position.initial(), (3, 1))
+    resultados = [pos for _, pos in plays]
+    assert len(set(resultados)) == len(resultados)
+    assert all(pos.get_turn() == NEGRO for pos in resultados)
+    assert ((17, 20), (19, 20)) in [tuple(sorted(p)) for p, _ in plays]
+
+
+def test_barra_primero_y_captura():
+    pos = _pos(BLANCO, bar=(1, 0), p3=-1, p5=-2, p10=2)
+    plays = legal_plays(pos, (3, 5))
+    # Con el 5 no entra (punto 5 bloqueado); entra con el 3 capturando
+    assert all(play[0] == (BAR, 3) for play, _ in plays)
+    assert all(res.get_bar_count(NEGRO) == 1 for _, res in plays)
+
+
+def test_barra_bloqueada_no_mueve():
+    pos = _pos(NEGRO, bar=(0, 1), p24=2, p23=2, p10=-3)
+    assert legal_plays(pos, (1, 2)) == [((), pos.with_turn(BLANCO))]
+
+
+def test_bear_off_exacto_y_con_dado_mayor():
+    pos = _pos(BLANCO, off=(13, 0), p22=1, p20=1)
+    plays = {tuple(sorted(p)) for p, _ in legal_plays(pos, (6, 3))}
+    # El 6 saca desde el punto más alto (20); el 3 saca la del 22
+    assert ((20, OFF), (22, OFF)) in plays
+    ganadora = [res for _, res in legal_plays(pos, (6, 3)) if res.has_won(BLANCO)]
+    assert ganadora
+
+
+def test_no_bear_off_con_fichas_afuera():
+    pos = _pos(BLANCO, p24=1, p10=1)
+    for play, _ in legal_plays(pos, (1, 2)):
+        assert (24, OFF) not in play
+
+
+def test_dado_mayor_obligatorio():
+    # Una sola ficha: el 6 y el 1 entran por separado pero no juntos
+    pos = _pos(BLANCO, p1=1, p3=-2, p8=-2, p9=-2)
+    plays = legal_plays(pos, (6, 1))
+    assert [p for p, _ in plays] == [((1, 7),)]
+
+
+def test_find_y_apply_play():
+    pos = Position.initial()
+    assert find_play(pos, (3, 1), ((19, 20), (17, 20))) is not None
+    # El orden y los pasos intermedios no importan: 1/5 es 1/4/5
+    assert find_play(pos, (3, 1), ((1, 5),)) is not None
+    assert find_play(pos, (3, 1), ((1, 7),)) is None
+    assert find_play(pos, (3, 1), ((2, 5),)) is None
+    assert apply_play(pos, ((24, 20),)) is None
+    assert apply_play(pos, ((1, 6),)) is None
+    assert apply_play(pos, ((5, 3),)) is None
+    res = apply_play(_pos(NEGRO, bar=(0, 1), p20=1), ((BAR, 20),))
+    assert res.get_point(20) == -1 and res.get_bar_count(BLANCO) == 1
+
+
+def test_partidas_al_azar_conservan_fichas():
+    rng = random.Random(7)
+    for _ in range(5):
+        pos = Position.initial()
+        for _ in range(300):
+            plays = legal_plays(pos, (rng.randint(1, 6), rng.randint(1, 6)))
+            _, pos = rng.choice(plays)
+            total = sum(abs(n) for n in pos.get_points())
+            total += sum(pos.get_bar_count(c) + pos.get_off_count(c) for c in (BLANCO, NEGRO))
+            assert total == 30
+            if pos.has_won(BLANCO) or pos.has_won(NEGRO):
+                break
@@ -0,0 +1,76 @@
+"""
+Tests del servicio de pondering.
+"""
+from backgammon.core.bot import HeuristicBot
+from backgammon.core.movegen import legal_plays
+from backgammon.core.ponder import ALL_ROLLS, PonderService, roll_key
+from backgammon.core.position import Position
+
+
+def test_todas_las_tiradas():
+    assert len(ALL_ROLLS) == 21
+    assert len(set(ALL_ROLLS)) == 21
+    assert roll_key((2, 5)) == roll_key((5, 2)) == (5, 2)
+
+
+def test_pondering_con_tirada_conocida_acierta():
+    servicio = PonderService(max_replies=1)
+    humano = Position.initial()
+    servicio.start(humano, (3, 1))
+    assert servicio.wait(30)
+    assert not servicio.is_pondering()
+    assert servicio.get_metrics()["entries"] == 21
+
+    # El humano juega lo que el pondering consideró más probable
+    bot = HeuristicBot()
+    mejor_humana = bot.rank_plays(humano, (3, 1))[0][2]
+    for roll in ((6, 5), (2, 2)):
+        esperado = bot.choose_play(mejor_humana, roll)
+        assert servicio.lookup(mejor_humana, roll) == esperado
+        assert servicio.choose_play(mejor_humana, roll) == esperado
+
+    m = servicio.get_metrics()
+    assert m["lookups"] == 2 and m["hits"] == 2
+    assert m["hit_rate"] == 1.0
+    assert m["time_saved_s"] > 0
+    assert m["ponder_time_s"] >= m["time_saved_s"]
+
+
+def test_fallo_de_cache_busca_y_guarda():
+    servicio = PonderService()
+    pos = Position.initial()
+    play = servicio.choose_play(pos, (4, 2))
+    assert play in [p for p, _ in legal_plays(pos, (4, 2))]
+    assert servicio.lookup(pos, (2, 4)) == play
+    m = servicio.get_metrics()
+    assert (m["lookups"], m["hits"], m["hit_rate"]) == (1, 0, 0.0)
+
+
+def test_stop_corta_y_clear_reinicia():
+    servicio = PonderService(max_replies_per_roll=3)
+    servicio.start(Position.initial())
+    servicio.stop()
+    assert not servicio.is_pondering()
+    assert servicio.wait(1)
+    entradas = servicio.get_metrics()["entries"]
+    assert entradas < 21 * 21 * 3
+    servicio.clear()
+    assert servicio.get_metrics()["entries"] == 0
+    assert servicio.get_metrics()["lookups"] == 0
+
+
+def test_cache_acotado():
+    servicio = PonderService(max_entries=2)
+    pos = Position.initial()
+    for dice in ((1, 2), (3, 4), (5, 6)):
+        servicio.choose_play(pos, dice)
+    assert servicio.get_metrics()["entries"] == 2
+    assert servicio.lookup(pos, (1, 2)) is None
+
+
+def test_pondering_sin_tirada_cubre_varias_respuestas():
+    servicio = PonderService(max_replies_per_roll=1)
+    servicio.start(Position.initial())
+    assert servicio.wait(60)
+    # Una respuesta humana por tirada (algunas coinciden) x 21 tiradas del bot
+    assert servicio.get_metrics()["entries"] >= 21 * 10
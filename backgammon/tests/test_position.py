@@ -0,0 +1,145 @@
+"""
+Tests de Position: foto inmutable, vista relativa y position ID.
+"""
+import base64
+import pickle
+
+import pytest
+
+from backgammon.core.board import BoardWithSetup
+from backgammon.core.board_refactored import BoardWithSetupFacade
+from backgammon.core.checker import Checker
+from backgammon.core.engine import BoardEngine
+from backgammon.core.game_refactored import GameFacade
+from backgammon.core.player import Player
+from backgammon.core.position import (
+    BLANCO, NEGRO, Position, apply_play_to_board, opponent,
+)
+
+
+@pytest.fixture
+def jugadores():
+    return Player("W", color="blanco"), Player("B", color="negro")
+
+
+def test_posicion_inicial_y_pips():
+    pos = Position.initial()
+    assert pos.get_point(1) == 2
+    assert pos.get_point(24) == -2
+    assert pos.pip_count(BLANCO) == pos.pip_count(NEGRO) == 167
+    assert pos.get_turn() == BLANCO
+    assert opponent(BLANCO) == NEGRO and opponent(NEGRO) == BLANCO
+
+
+@pytest.mark.parametrize("fabrica", [BoardWithSetup, BoardWithSetupFacade])
+def test_from_board_igual_a_inicial(fabrica, jugadores):
+    board = fabrica()
+    board.setup_initial_position(*jugadores)
+    assert Position.from_board(board, BLANCO) == Position.initial()
+
+
+def test_from_game(jugadores):
+    board = BoardWithSetupFacade()
+    board.setup_initial_position(*jugadores)
+    game = GameFacade(*jugadores, board=board)
+    game.next_turn()
+    assert Position.from_game(game) == Position.initial(NEGRO)
+
+
+def test_hash_igualdad_y_pickle():
+    a, b = Position.initial(), Position.initial()
+    assert a == b and hash(a) == hash(b)
+    assert a != a.with_turn(NEGRO)
+    assert a != "no es posicion"
+    assert len({a, b, a.with_turn(NEGRO)}) == 2
+    assert pickle.loads(pickle.dumps(a)) == a
+
+
+@pytest.mark.parametrize("datos", [
+    dict(points=[0] * 24),
+    dict(points=[0] * 25, turn="verde"),
+])
+def test_datos_invalidos(datos):
+    with pytest.raises(ValueError):
+        Position(**datos)
+
+
+@pytest.mark.parametrize("color", [BLANCO, NEGRO])
+def test_relativa_ida_y_vuelta(color):
+    points = [0] * 25
+    points[3], points[20], points[5] = 4, -2, -1
+    pos = Position(points, bar=(1, 2), off=(10, 12), turn=color)
+    rel = pos.to_relative()
+    assert rel[25] == pos.get_bar_count(color)
+    assert rel[26] == pos.get_bar_count(opponent(color))
+    assert rel[0] == pos.get_off_count(color)
+    vuelta = Position.from_relative(rel, color, color, pos.get_off_count(opponent(color)))
+    assert vuelta == pos
+
+
+def test_movimientos_absolutos():
+    pos = Position.initial()
+    assert pos.to_absolute_move(25, 22, BLANCO) == (Checker.BAR, 3)
+    assert pos.to_absolute_move(3, 0, BLANCO) == (22, Checker.OFF)
+    assert pos.to_absolute_move(25, 22, NEGRO) == (Checker.BAR, 22)
+    assert pos.to_absolute_move(3, 0, NEGRO) == (3, Checker.OFF)
+
+
+class TestPositionId:
+    def test_inicial_conocido(self):
+        assert Position.initial().position_id() == "4HPwATDgc/ABMA"
+
+    @pytest.mark.parametrize("turn", [BLANCO, NEGRO])
+    def test_ida_y_vuelta(self, turn):
+        points = [0] * 25
+        points[1], points[24], points[12], points[7] = 3, -5, 2, -4
+        pos = Position(points, bar=(1, 2), off=(9, 4), turn=turn)
+        assert Position.from_position_id(pos.position_id(), turn) == pos
+
+    @pytest.mark.parametrize("pid", ["???", "AAAA", "////////////////////"])
+    def test_invalidos(self, pid):
+        with pytest.raises(ValueError):
+            Position.from_position_id(pid)
+
+    def test_mismo_punto_ocupado_por_ambos(self):
+        # Una ficha propia en el punto 1 y una rival en su punto 24 (el mismo)
+        data = bytearray(10)
+        bits = [1, 0] + [0] * 24 + [0] * 23 + [1, 0]
+        for i, bit in enumerate(bits):
+            if bit:
+                data[i // 8] |= 1 << (i % 8)
+        pid = base64.b64encode(bytes(data)).decode().rstrip("=")
+        with pytest.raises(ValueError):
+            Position.from_position_id(pid)
+
+
+class TestTablero:
+    def test_to_board_ida_y_vuelta(self, jugadores):
+        points = [0] * 25
+        points[19], points[6] = 3, -2
+        pos = Position(points, bar=(1, 0), off=(11, 13), turn=NEGRO)
+        board = pos.to_board(players={"blanco": jugadores[0]})
+        assert isinstance(board, BoardEngine)
+        assert board.get_top_checker(19).get_player() is jugadores[0]
+        assert Position.from_board(board, NEGRO) == pos
+        facade = pos.to_board(BoardWithSetupFacade())
+        assert Position.from_board(facade, NEGRO) == pos
+
+    def test_apply_play_entrada_captura_y_bear_off(self, jugadores):
+        board = BoardEngine()
+        blanco, negro = jugadores
+        board.capture_checker(Checker(blanco, "blanco"))
+        board.colocar_ficha(negro, 3)
+        board.colocar_ficha(blanco, 22)
+        apply_play_to_board(board, ((Checker.BAR, 3), (22, Checker.OFF)), "blanco")
+        assert board.get_point_color(3) == "blanco"
+        assert board.get_bar_count("negro") == 1
+        assert board.get_off_count("blanco") == 1
+        assert board.point_count(22) == 0
+
+    def test_apply_play_invalido(self):
+        board = BoardEngine()
+        with pytest.raises(ValueError):
+            apply_play_to_board(board, ((Checker.BAR, 3),), "blanco")
+        with pytest.raises(ValueError):
+            apply_play_to_board(board, ((5, 8),), "blanco")
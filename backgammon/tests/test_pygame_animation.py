@@ -0,0 +1,143 @@
+"""
+Tests de la animación de movimientos (reloj simulado, sin ventana).
+"""
+import pytest
+
+pygame = pytest.importorskip("pygame")
+
+from backgammon.core.position import Position
+from backgammon.core.movegen import apply_play
+from backgammon.pygame_ui.animation import MoveAnimator, MOVE_SECONDS, HIT_SECONDS
+from backgammon.pygame_ui.layout import BoardLayout
+
+
+class Reloj:
+    def __init__(self):
+        self.t = 100.0
+
+    def __call__(self):
+        return self.t
+
+
+@pytest.fixture
+def reloj():
+    return Reloj()
+
+
+@pytest.fixture
+def layout():
+    return BoardLayout()
+
+
+def _mover(position, move):
+    return apply_play(position, (move,)).with_turn(position.get_turn())
+
+
+def test_la_ficha_viaja_por_tiempo_y_no_por_cuadros(reloj, layout):
+    animator = MoveAnimator(clock=reloj)
+    before = Position.initial()
+    animator.enqueue_move(before, _mover(before, (1, 4)), (1, 4), "blanco")
+
+    display, overlays = animator.frame(layout)
+    # Mientras vuela, la ficha no está ni en el origen ni en el destino
+    assert display.get_point(1) == 1 and display.get_point(4) == 0
+    assert overlays == [(layout.slots[1][1], "blanco")]
+
+    reloj.t += MOVE_SECONDS / 2
+    _, [(center, _)] = animator.frame(layout)
+    assert center == (
+        round((layout.slots[1][1][0] + layout.slots[4][0][0]) / 2),
+        round((layout.slots[1][1][1] + layout.slots[4][0][1]) / 2),
+    )
+
+    reloj.t += MOVE_SECONDS
+    assert animator.frame(layout) == (None, [])
+    assert not animator.is_active()
+
+
+def test_cuadros_lentos_se_saltean(reloj, layout):
+    animator = MoveAnimator(clock=reloj, frame_seconds=0.01)
+    before = Position.initial()
+    animator.enqueue_move(before, _mover(before, (1, 4)), (1, 4), "blanco")
+    animator.frame(layout)
+    reloj.t += 0.05
+    animator.frame(layout)
+    assert animator.get_frames() == 2
+    assert animator.get_dropped_frames() == 4
+
+
+def test_captura_manda_la_ficha_a_la_barra(reloj, layout):
+    points = [0] * 25
+    points[1], points[4] = 2, -1
+    before = Position(points, turn="blanco")
+    after = _mover(before, (1, 4))
+    animator = MoveAnimator(clock=reloj)
+    animator.enqueue_move(before, after, (1, 4), "blanco")
+
+    reloj.t += MOVE_SECONDS + 0.001
+    display, [(center, color)] = animator.frame(layout)
+    assert color == "negro"
+    assert display.get_point(4) == 1 and display.get_bar_count("negro") == 0
+    assert center != layout.bar_slots["negro"][0]
+
+    reloj.t += HIT_SECONDS
+    assert animator.frame(layout) == (None, [])
+
+
+def test_jugada_completa_y_velocidad(reloj, layout):
+    animator = MoveAnimator(speed=10, clock=reloj)
+    before = Position.initial()
+    assert animator.enqueue_play(before, ((12, 17), (17, 19)))
+    assert animator.is_active()
+
+    reloj.t += MOVE_SECONDS / 10 + 0.0001
+    display, [(center, _)] = animator.frame(layout)
+    # Segundo tramo: sale del 17 (ya con la ficha del primero) hacia el 19
+    assert display.get_point(17) == 3 and display.get_point(12) == 4
+    assert center == layout.slots[17][3]
+
+    reloj.t += MOVE_SECONDS / 10
+    assert not animator.is_active()
+    assert not animator.enqueue_play(before, ((2, 5),))
+
+
+def test_bear_off_y_clear(reloj, layout):
+    points = [0] * 25
+    points[24] = 1
+    before = Position(points, turn="blanco")
+    animator = MoveAnimator(clock=reloj)
+    animator.enqueue_play(before, ((24, 0),))
+    reloj.t += MOVE_SECONDS
+    animator.frame(layout, reloj.t - 0.0001)
+    _, [(center, _)] = animator.frame(layout, reloj.t - 0.0001)
+    x, y = layout.off_pos["blanco"]
+    assert center == pytest.approx((x + layout.radius, y + layout.font_size // 2), abs=1)
+    animator.clear()
+    assert not animator.is_active()
+
+
+def test_renderer_redibuja_debajo_de_la_ficha(monkeypatch, reloj):
+    monkeypatch.setenv("SDL_VIDEODRIVER", "dummy")
+    pygame.display.init()
+    pygame.font.init()
+    try:
+        from backgammon.pygame_ui.renderer import BoardRenderer
+        surface = pygame.Surface((1300, 700))
+        renderer = BoardRenderer(surface)
+        layout = renderer.get_layout()
+        position = Position.initial()
+        renderer.render_position(position)
+        fondo = surface.copy()
+
+        center = layout.slots[5][0]
+        dirty = renderer.render_position(position, overlays=[(center, "blanco")])
+        assert any(rect.collidepoint(center) for rect in dirty)
+        assert surface.get_at(center) != fondo.get_at(center)
+
+        # Al quitar la ficha se restaura el fondo donde estaba
+        dirty = renderer.render_position(position)
+        assert any(rect.collidepoint(center) for rect in dirty)
+        assert surface.get_at(center) == fondo.get_at(center)
+        assert renderer.render_position(position) == []
+    finally:
+        pygame.display.quit()
@@ -0,0 +1,73 @@
+"""
+Tests de la geometría precalculada y del hit testing de la UI de Pygame.
+"""
+import pytest
+
+pygame = pytest.importorskip("pygame")
+
+from backgammon.pygame_ui.layout import BoardLayout, BUTTON, WIDTH, HEIGHT
+
+
+def _brute_force(layout, pos):
+    """Resolución de clicks de referencia (la cuenta que hacía la UI antes)."""
+    board_rect = layout.board_rect
+    mx, my = pos
+    if not (board_rect.left <= mx <= board_rect.right and board_rect.top <= my <= board_rect.bottom):
+        return None
+    col = min(int((mx - board_rect.left) / layout.tri_width), 11)
+    return 13 + col if my < board_rect.centery else 12 - col
+
+
+@pytest.mark.parametrize("size", [(WIDTH, HEIGHT), (800, 450), (1920, 1080), (640, 900)])
+def test_hit_test_coincide_con_la_cuenta_directa(size):
+    layout = BoardLayout(size)
+    for x in range(-5, size[0] + 5, 7):
+        for y in range(-5, size[1] + 5, 7):
+            if layout.button_rect.collidepoint(x, y):
+                assert layout.hit_test((x, y)) == BUTTON
+            else:
+                assert layout.hit_test((x, y)) == _brute_force(layout, (x, y))
+
+
+def test_centros_de_fichas_caen_en_su_punto():
+    layout = BoardLayout()
+    for point in range(1, 25):
+        for center in layout.slots[point]:
+            assert layout.point_at(center) == point
+            assert layout.regions[f"point_{point}"].collidepoint(center)
+
+
+def test_escala_con_la_ventana():
+    chico = BoardLayout((650, 350))
+    grande = BoardLayout((WIDTH, HEIGHT))
+    assert chico.scale == pytest.approx(0.5)
+    assert chico.radius < grande.radius
+    assert chico.board_rect.width == pytest.approx(grande.board_rect.width / 2, abs=1)
+    assert chico.point_at(chico.button_rect.center) is None
+    assert chico.hit_test(chico.button_rect.center) == BUTTON
+
+
+def test_renderer_reconstruye_al_cambiar_de_superficie(monkeypatch):
+    monkeypatch.setenv("SDL_VIDEODRIVER", "dummy")
+    pygame.display.init()
+    pygame.font.init()
+    try:
+        from backgammon.core.position import Position
+        from backgammon.pygame_ui.renderer import BoardRenderer
+        renderer = BoardRenderer(pygame.Surface((WIDTH, HEIGHT)))
+        layout = renderer.get_layout()
+        renderer.render_position(Position.initial())
+
+        # Misma medida: se conserva la geometría pero se redibuja todo
+        otra = pygame.Surface((WIDTH, HEIGHT))
+        renderer.set_surface(otra)
+        assert renderer.get_layout() is layout
+        assert renderer.render_position(Position.initial()) == [otra.get_rect()]
+
+        chica = pygame.Surface((800, 450))
+        renderer.set_surface(chica)
+        assert renderer.get_layout().size == (800, 450)
+        assert renderer.render_position(Position.initial()) == [chica.get_rect()]
+        assert renderer.render_position(Position.initial()) == []
+    finally:
+        pygame.display.quit()
@@ -0,0 +1,252 @@
+"""
+Tests del loop event-driven de la UI de Pygame y de FrameStats.
+"""
+import threading
+import time
+
+import pytest
+
+from backgammon.pygame_ui.frame_stats import FrameStats
+
+try:
+    import pygame
+except ImportError:  # pragma: no cover
+    pygame = None
+
+
+class TestFrameStats:
+    def test_sin_medicion(self):
+        stats = FrameStats()
+        assert stats.get_frames() == 0
+        assert stats.get_frame_ms() == 0.0
+        assert stats.get_cpu_percent() == 0.0
+        stats.stop()
+        assert stats.get_wall_time() == 0.0
+
+    def test_percentiles_y_resumen(self):
+        stats = FrameStats()
+        stats.start()
+        for ms in (1, 2, 3, 4, 10):
+            stats.record_frame(ms / 1000)
+            stats.record_wakeup()
+        stats.stop()
+        assert stats.get_frames() == 5
+        assert stats.get_wakeups() == 5
+        assert stats.get_frame_ms(50) == pytest.approx(3)
+        assert stats.get_frame_ms(100) == pytest.approx(10)
+        assert stats.get_wall_time() > 0
+        assert "cuadros=5" in stats.summary()
+
+
+@pytest.fixture
+def ui(monkeypatch):
+    monkeypatch.setenv("SDL_VIDEODRIVER", "dummy")
+    pygame.init()
+    from backgammon.pygame_ui.main import BackgammonUI, create_game
+    screen = pygame.display.set_mode((1300, 700))
+    yield BackgammonUI(screen, create_game())
+    pygame.quit()
+
+
+def _click(ui, pos):
+    ui.handle_event(pygame.event.Event(pygame.MOUSEBUTTONDOWN, button=1, pos=pos))
+
+
+def _centro_del_punto(ui, point):
+    rect = ui.get_renderer().get_region(f"point_{point}")
+    return rect.center
+
+
+@pytest.mark.skipif(pygame is None, reason="pygame no está instalado")
+class TestBackgammonUI:
+    def test_render_baja_el_flag(self, ui):
+        assert ui.dirty is True
+        ui.render()
+        assert ui.dirty is False
+        assert ui.get_stats().get_frames() == 1
+
+    def test_eventos_sin_cambios_no_ensucian(self, ui):
+        ui.render()
+        ui.handle_event(pygame.event.Event(pygame.MOUSEMOTION, pos=(5, 5), rel=(1, 1), buttons=(0, 0, 0)))
+        ui.handle_event(pygame.event.Event(pygame.KEYDOWN, key=pygame.K_a))
+        _click(ui, (5, 5))
+        assert ui.dirty is False
+
+    def test_tirar_y_seleccionar_ensucian(self, ui):
+        ui.render()
+        ui.handle_event(pygame.event.Event(pygame.KEYDOWN, key=pygame.K_SPACE))
+        assert ui.dirty is True
+        assert len(ui.dice_values) in (2, 4)
+        ui.render()
+
+        _click(ui, _centro_del_punto(ui, 1))
+        assert ui.selected_point == 1
+        assert ui.dirty is True
+
+    def test_mover_anima_sin_esperar_al_juego(self, ui):
+        ui.get_game().roll = lambda: [3, 1]
+        ui.roll()
+        ui.render()
+        ui.click_point(1)
+        ui.click_point(4)
+        # El juego ya cambió; la animación solo es visual
+        assert ui.get_game().get_board().point_count(4) == 1
+        assert ui.is_animating()
+        ui.render()
+        assert ui.get_animator().get_frames() == 1
+        ui.get_animator().clear()
+        ui.render()
+        assert not ui.is_animating()
+
+    def test_point_at(self, ui):
+        for point in (1, 6, 12, 13, 19, 24):
+            assert ui.point_at(_centro_del_punto(ui, point)) == point
+        assert ui.point_at((0, 0)) is None
+
+    def test_redimensionar_recalcula_geometria(self, ui):
+        ui.render()
+        ui.handle_event(pygame.event.Event(pygame.VIDEORESIZE, size=(900, 500), w=900, h=500))
+        assert ui.dirty
+        assert ui.get_renderer().get_layout().size == (900, 500)
+        ui.render()
+        assert not ui.dirty
+        for point in (1, 12, 13, 24):
+            assert ui.point_at(_centro_del_punto(ui, point)) == point
+
+    def test_evento_de_estado_y_salida(self, ui):
+        ui.render()
+        ui.handle_event(pygame.event.Event(pygame.USEREVENT + 1))
+        assert ui.dirty is True
+        ui.handle_event(pygame.event.Event(pygame.KEYDOWN, key=pygame.K_ESCAPE))
+        assert ui.running is False
+
+    def test_loop_event_driven_dibuja_solo_si_hay_cambios(self, ui):
+        pygame.event.clear()
+        pygame.event.post(pygame.event.Event(pygame.MOUSEMOTION, pos=(5, 5), rel=(1, 1), buttons=(0, 0, 0)))
+        pygame.event.post(pygame.event.Event(pygame.QUIT))
+        ui.run_event_driven()
+        # Solo el cuadro inicial: el movimiento del mouse no cambió nada
+        assert ui.get_stats().get_frames() == 1
+
+
+@pytest.mark.skipif(pygame is None, reason="pygame no está instalado")
+class TestBotWorker:
+    def test_publica_la_jugada_como_evento(self):
+        from backgammon.core.position import Position
+        from backgammon.pygame_ui.bot_worker import BotWorker, BOT_PLAY
+        recibidos = []
+        listo = threading.Event()
+
+        def post(event):
+            recibidos.append(event)
+            listo.set()
+
+        worker = BotWorker(post=post)
+        job = worker.request(Position.initial(), (3, 1))
+        assert listo.wait(5)
+        worker.shutdown()
+        assert recibidos[0].type == BOT_PLAY
+        assert recibidos[0].job == job
+        assert tuple(sorted(recibidos[0].play)) == ((17, 20), (19, 20))
+
+    def test_cancelado_no_publica(self):
+        from backgammon.core.bot import Bot, SearchCancelled
+        from backgammon.core.position import Position
+        from backgammon.pygame_ui.bot_worker import BotWorker
+
+        empezo = threading.Event()
+
+        class BotLento(Bot):
+            def choose_play(self, position, dice, cancel=None):
+                empezo.set()
+                cancel.wait(5)
+                raise SearchCancelled()
+
+        recibidos = []
+        worker = BotWorker(bot=BotLento(), post=recibidos.append)
+        worker.request(Position.initial(), (3, 1))
+        assert empezo.wait(5)
+        assert worker.is_busy()
+        worker.cancel()
+        worker.shutdown()
+        assert recibidos == []
+        assert worker.get_current_job() == 1
+
+
+@pytest.fixture
+def ui_con_bot(monkeypatch):
+    monkeypatch.setenv("SDL_VIDEODRIVER", "dummy")
+    pygame.init()
+    from backgammon.pygame_ui.main import BackgammonUI, create_game
+    screen = pygame.display.set_mode((1300, 700))
+    game = create_game()
+    # Tiradas fijas: el turno humano siempre se puede jugar completo
+    game.roll = lambda: [3, 1]
+    ui = BackgammonUI(screen, game, bot_color="negro")
+    yield ui
+    ui.close()
+    pygame.quit()
+
+
+def _esperar_evento_del_bot(timeout_s=5):
+    from backgammon.pygame_ui.bot_worker import BOT_PLAY
+    limite = time.monotonic() + timeout_s
+    while time.monotonic() < limite:
+        for event in pygame.event.get(BOT_PLAY):
+            return event
+        time.sleep(0.01)
+    return None
+
+
+@pytest.mark.skipif(pygame is None, reason="pygame no está instalado")
+class TestBackgammonUIConBot:
+    def _jugar_turno_humano(self, ui):
+        """Juega el turno de las blancas moviendo la ficha de 1 con cada dado."""
+        ui.roll()
+        game = ui.get_game()
+        while ui.available_moves and not ui.is_bot_turn():
+            d = ui.available_moves[0]
+            origen = next(p for p in range(1, 25)
+                          if game.get_board().get_point_color(p) == "blanco"
+                          and game.is_valid_move(p, p + d, d))
+            ui.click_point(origen)
+            ui.click_point(origen + d)
+
+    def test_el_bot_juega_su_turno_en_segundo_plano(self, ui_con_bot):
+        ui = ui_con_bot
+        pygame.event.clear()
+        self._jugar_turno_humano(ui)
+        assert ui.is_bot_turn()
+        assert ui.is_bot_thinking()
+
+        # Mientras piensa se ignoran los clicks
+        ui.handle_event(pygame.event.Event(pygame.KEYDOWN, key=pygame.K_SPACE))
+        event = _esperar_evento_del_bot()
+        assert event is not None
+        ui.handle_event(event)
+        assert not ui.is_bot_thinking()
+        assert ui.get_game().get_current_player().get_color() == "blanco"
+        assert "computadora jugó" in ui.message
+
+    def test_pondering_durante_el_turno_humano(self, ui_con_bot):
+        ui = ui_con_bot
+        ui.start_bot_turn()
+        assert ui.get_ponder().is_pondering()
+        ui.roll()
+        assert ui.get_ponder().is_pondering()
+        ui.close()
+        assert not ui.get_ponder().is_pondering()
+
+    def test_deshacer_cancela_y_restaura(self, ui_con_bot):
+        from backgammon.core.position import Position
+        ui = ui_con_bot
+        pygame.event.clear()
+        inicio = Position.from_game(ui.get_game())
+        self._jugar_turno_humano(ui)
+        job_viejo = ui.get_worker().get_current_job()
+        ui.handle_event(pygame.event.Event(pygame.KEYDOWN, key=pygame.K_u))
+        assert Position.from_game(ui.get_game()) == inicio
+        assert not ui.is_bot_thinking()
+        # Un resultado tardío del pedido cancelado se descarta
+        ui.apply_bot_play(job_viejo, ((24, 20),))
+        assert Position.from_game(ui.get_game()) == inicio
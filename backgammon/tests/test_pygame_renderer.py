@@ -0,0 +1,127 @@
+"""
+Tests del renderer de Pygame (con el driver de video 'dummy' de SDL).
+"""
+import pytest
+
+pygame = pytest.importorskip("pygame")
+
+from backgammon.core.game_refactored import GameFacade
+from backgammon.core.board_refactored import BoardWithSetupFacade
+from backgammon.core.player_refactored import PlayerFacade
+
+
+@pytest.fixture
+def screen(monkeypatch):
+    monkeypatch.setenv("SDL_VIDEODRIVER", "dummy")
+    pygame.display.init()
+    pygame.font.init()
+    yield pygame.display.set_mode((1300, 700))
+    pygame.display.quit()
+
+
+@pytest.fixture
+def game():
+    p1 = PlayerFacade("Blancas", color="blanco")
+    p2 = PlayerFacade("Negras", color="negro")
+    board = BoardWithSetupFacade()
+    board.setup_initial_position(p1, p2)
+    return GameFacade(p1, p2, board=board)
+
+
+def test_primer_render_es_pantalla_completa_y_luego_nada(screen, game):
+    from backgammon.pygame_ui.renderer import BoardRenderer
+    renderer = BoardRenderer(screen)
+    assert renderer.render(game, [3, 5], "hola") == [screen.get_rect()]
+    assert renderer.render(game, [3, 5], "hola") == []
+
+
+def test_solo_redibuja_regiones_cambiadas(screen, game):
+    from backgammon.pygame_ui.renderer import BoardRenderer
+    renderer = BoardRenderer(screen)
+    renderer.render(game, [3, 5], "hola")
+
+    game.get_board().mover_ficha(1, 4)
+    dirty = renderer.render(game, [5], "hola", selected_point=4)
+    esperado = [renderer.get_region(n) for n in ("point_1", "point_4", "dice")]
+    assert sorted(map(tuple, dirty)) == sorted(map(tuple, esperado))
+
+    # Cambiar solo el mensaje toca solo la línea de mensaje
+    assert renderer.render(game, [5], "chau", selected_point=4) == [renderer.get_region("message")]
+
+
+def test_invalidate_fuerza_pantalla_completa(screen, game):
+    from backgammon.pygame_ui.renderer import BoardRenderer
+    renderer = BoardRenderer(screen)
+    renderer.render(game, [], "")
+    renderer.invalidate()
+    assert renderer.render(game, [], "") == [screen.get_rect()]
+
+
+def test_glyph_cache_reutiliza_superficies(screen):
+    from backgammon.pygame_ui.renderer import GlyphCache
+    glyphs = GlyphCache()
+    a = glyphs.render("12", (0, 0, 0))
+    assert glyphs.render("12", (0, 0, 0)) is a
+    assert glyphs.get_font(20) is glyphs.get_font(20)
+    assert glyphs.size() == 1
+
+
+class _SuperficieContada(pygame.Surface):
+    """Surface que cuenta las llamadas a blit y blits."""
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.llamadas = []
+
+    def blit(self, *args, **kwargs):
+        self.llamadas.append("blit")
+        return super().blit(*args, **kwargs)
+
+    def blits(self, *args, **kwargs):
+        self.llamadas.append("blits")
+        return super().blits(*args, **kwargs)
+
+
+def test_atlas_tiene_todas_las_fichas_y_dados(screen):
+    from backgammon.pygame_ui.renderer import BoardRenderer
+    renderer = BoardRenderer(screen)
+    atlas = renderer.get_atlas()
+    radius = renderer.get_layout().radius
+    # 2 colores x (normal, resaltada) x (sin número + 2..15) + 6 caras de dado
+    assert atlas.size() == 2 * 2 * 15 + 6
+    surface, dest, area = atlas.checker((100, 100), "negro", 15, True)
+    assert surface is atlas.get_surface()
+    assert dest == (100 - radius - 1, 100 - radius - 1)
+    assert area.size == (2 * radius + 2, 2 * radius + 2)
+
+
+def test_un_solo_blits_por_cuadro(screen, game):
+    from backgammon.pygame_ui.renderer import BoardRenderer
+    surface = _SuperficieContada((1300, 700))
+    renderer = BoardRenderer(surface)
+    renderer.render(game, [3, 5], "hola")
+    assert surface.llamadas == ["blits"]
+
+    surface.llamadas.clear()
+    game.get_board().mover_ficha(1, 4)
+    renderer.render(game, [5], "hola", selected_point=4)
+    assert surface.llamadas == ["blits"]
+
+    surface.llamadas.clear()
+    renderer.render(game, [5], "hola", selected_point=4)
+    assert surface.llamadas == []
+
+
+def test_ficha_seleccionada_se_resalta(screen, game):
+    from backgammon.pygame_ui.renderer import BoardRenderer, HIGHLIGHT_COLOR
+    renderer = BoardRenderer(screen)
+    layout = renderer.get_layout()
+    x, y = layout.slots[1][1]
+    borde = (x + layout.radius - 1, y)
+
+    renderer.render(game, [], "")
+    assert tuple(screen.get_at(borde))[:3] != HIGHLIGHT_COLOR
+    renderer.render(game, [], "", selected_point=1)
+    assert tuple(screen.get_at(borde))[:3] == HIGHLIGHT_COLOR
+    renderer.render(game, [], "")
+    assert tuple(screen.get_at(borde))[:3] != HIGHLIGHT_COLOR
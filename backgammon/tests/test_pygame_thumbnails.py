@@ -0,0 +1,57 @@
+"""
+Tests del render por lotes a PNG (sin ventana).
+"""
+import pytest
+
+pygame = pytest.importorskip("pygame")
+
+from backgammon.core.position import Position
+from backgammon.pygame_ui.thumbnails import ThumbnailRenderer, parse_line, render_batch
+
+
+@pytest.fixture(autouse=True)
+def dummy(monkeypatch):
+    monkeypatch.setenv("SDL_VIDEODRIVER", "dummy")
+    yield
+    pygame.display.quit()
+
+
+def test_parse_line():
+    pid = Position.initial().position_id()
+    assert parse_line("", 1) is None
+    assert parse_line("# comentario", 1) is None
+    assert parse_line(pid, 7) == ("posicion_000007", Position.initial())
+    assert parse_line(f"{pid} negro apertura", 1) == ("apertura", Position.initial("negro"))
+    with pytest.raises(ValueError):
+        parse_line("no-es-un-id", 1)
+
+
+def test_guarda_png_del_tamano_pedido(tmp_path):
+    thumbs = ThumbnailRenderer((200, 110))
+    path = thumbs.save(Position.initial(), str(tmp_path / "inicial.png"))
+    image = pygame.image.load(path)
+    assert image.get_size() == (200, 110)
+
+
+@pytest.mark.parametrize("processes", [0, 2])
+def test_render_batch(tmp_path, processes):
+    inicial = Position.initial()
+    items = ((f"p{i}", inicial if i % 2 else inicial.with_turn("negro")) for i in range(6))
+    assert render_batch(items, str(tmp_path), (160, 90), processes=processes, chunksize=2) == 6
+    assert sorted(p.name for p in tmp_path.iterdir()) == [f"p{i}.png" for i in range(6)]
+
+
+def test_main_con_archivo_inexistente(tmp_path, capsys):
+    from backgammon.pygame_ui.thumbnails import main
+    with pytest.raises(SystemExit) as exc:
+        main([str(tmp_path / "no-existe.txt")])
+    assert exc.value.code == 2
+    assert "No se puede leer" in capsys.readouterr().err
+
+
+def test_main_con_id_invalido(tmp_path, capsys):
+    from backgammon.pygame_ui.thumbnails import main
+    entrada = tmp_path / "ids.txt"
+    entrada.write_text("no-es-un-id\n", encoding="utf-8")
+    assert main([str(entrada), "--salida", str(tmp_path / "out"), "--procesos", "0"]) == 1
+    assert "Position ID inválido" in capsys.readouterr().err